@@ -0,0 +1,167 @@
+"""Throughput, latency percentiles, allocations and bytes per call of every client mixin.
+
+Every mixin is called against `MockNASA`, a local server with api.nasa.gov
+response shapes, log-normal latency and PNG payloads. The results are printed
+as a table and written as JSON with --output to track regressions across releases.
+
+Usage:
+    python -m benchmarks.bench_clients --calls 50 --latency-ms 20 --output results.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Text
+
+import nasa
+from benchmarks.mock_api import MockNASA
+from nasa.clients.main import Client
+
+SCENARIOS: Dict[Text, Callable[[Client], Any]] = {
+    "apod": lambda client: client.apod(date="2021-01-01"),
+    "donki": lambda client: client.donki_cme("2021-01-01", "2021-01-31"),
+    "neo": lambda client: client.neo_feed("2021-01-01", "2021-01-07"),
+    "epic": lambda client: client.epic("natural", "2021-01-01", get_images=True),
+    "mars_rover_photos": lambda client: client.mars_rover_photos("opportunity", 1000),
+    "earth": lambda client: client.earth_imagery(lat=1.5, lon=100.75),
+    "techport": lambda client: client.techport(),
+    "tech_transfer": lambda client: client.tech_transfer_patent("engine"),
+}
+
+
+def percentile(samples: List[float], q: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1]
+
+
+def measure(
+    call: Callable[[Client], Any], client: Client, server: MockNASA, calls: int
+) -> Dict[Text, float]:
+    """Benchmark one scenario
+
+    Args:
+        call (Callable[[Client], Any]): scenario calling the client
+        client (Client): client under test
+        server (MockNASA): server the client talks to
+        calls (int): number of timed calls
+
+    Returns:
+        Dict[Text, float]: metrics of the scenario, latencies in milliseconds
+    """
+    call(client)
+    latencies: List[float] = []
+    requests_before: int = len(server.requests)
+    bytes_before: int = server.bytes_sent
+    start: float = time.perf_counter()
+    for _ in range(calls):
+        call_start: float = time.perf_counter()
+        call(client)
+        latencies.append((time.perf_counter() - call_start) * 1000)
+    elapsed: float = time.perf_counter() - start
+    requests: int = len(server.requests) - requests_before
+    transferred: int = server.bytes_sent - bytes_before
+    # Allocations are traced on separate calls, tracemalloc slows down the timed ones.
+    # Tracing restarts for every peak, tracemalloc.reset_peak needs Python 3.9
+    peaks: List[int] = []
+    for _ in range(min(calls, 5)):
+        tracemalloc.start()
+        call(client)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    for _ in range(min(calls, 5)):
+        call(client)
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated_blocks: int = sum(
+        stat.count_diff
+        for stat in snapshot_after.compare_to(snapshot_before, "filename")
+        if stat.count_diff > 0
+    )
+    return {
+        "calls": calls,
+        "requests_per_call": requests / calls,
+        "throughput_per_s": calls / elapsed,
+        "latency_p50_ms": percentile(latencies, 50),
+        "latency_p99_ms": percentile(latencies, 99),
+        "latency_mean_ms": statistics.fmean(latencies),
+        "bytes_per_call": transferred / calls,
+        "peak_alloc_bytes_per_call": statistics.fmean(peaks),
+        "retained_blocks": allocated_blocks,
+    }
+
+
+def run_suite(
+    calls: int = 50,
+    latency_ms: float = 20,
+    sigma: float = 0.5,
+    image_size: int = 512,
+    scenarios: Optional[List[Text]] = None,
+) -> Dict[Text, Any]:
+    """Run the benchmark of the selected mixins against a fresh mock server
+
+    Args:
+        calls (int, optional): timed calls per mixin. Defaults to 50.
+        latency_ms (float, optional): median latency of the mock server. Defaults to 20.
+        sigma (float, optional): shape of the log-normal latency. Defaults to 0.5.
+        image_size (int, optional): side of the served PNG images. Defaults to 512.
+        scenarios (Optional[List[Text]], optional): mixins to run, all of them if None. Defaults to None.
+
+    Returns:
+        Dict[Text, Any]: JSON serializable report with the environment and the metrics of each mixin
+    """
+    names: List[Text] = list(SCENARIOS) if scenarios is None else scenarios
+    results: Dict[Text, Dict[Text, float]] = dict()
+    with MockNASA(latency_ms, sigma, image_size) as server:
+        with Client(base_url=server.url) as client:
+            for name in names:
+                results[name] = measure(SCENARIOS[name], client, server, calls)
+    return {
+        "nasa_version": nasa.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "calls": calls,
+            "latency_ms": latency_ms,
+            "sigma": sigma,
+            "image_size": image_size,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--sigma", type=float, default=0.5)
+    parser.add_argument("--image-size", type=int, default=512)
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS))
+    parser.add_argument("--output", help="path of the JSON report")
+    args = parser.parse_args()
+    report: Dict[Text, Any] = run_suite(
+        args.calls, args.latency_ms, args.sigma, args.image_size, args.scenarios
+    )
+    print(
+        f"{'mixin':<18} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'KiB/call':>9} {'peak KiB':>9}"
+    )
+    for name, result in report["results"].items():
+        print(
+            f"{name:<18} {result['throughput_per_s']:8.1f} {result['latency_p50_ms']:8.2f} "
+            f"{result['latency_p99_ms']:8.2f} {result['bytes_per_call'] / 1024:9.1f} "
+            f"{result['peak_alloc_bytes_per_call'] / 1024:9.1f}"
+        )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Peak memory and CPU time of reading 5-50 MB image bodies.
+
+"before" concatenates 1 KiB chunks into bytes like the former `get_url_image`,
+"after" reads into a buffer preallocated from Content-Length with adaptive chunks.
+The quadratic "before" loop is only run up to --before-max-mb.
+
+Usage:
+    python -m benchmarks.bench_download --sizes 5 20 50
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+from typing import Callable, Text, Tuple
+
+import requests
+from nasa.utils import read_content
+from benchmarks.server import StubServer
+
+MB: int = 1024 * 1024
+
+
+def concatenate(response: requests.Response) -> bytes:
+    content: bytes = bytes()
+    for c in response.iter_content(chunk_size=1024):
+        content += c
+    return content
+
+
+def preallocate(response: requests.Response) -> bytearray:
+    return read_content(response, int(response.headers["Content-Length"]))
+
+
+def measure(
+    session: requests.Session, url: Text, read: Callable[[requests.Response], bytes]
+) -> Tuple[float, float]:
+    tracemalloc.start()
+    start: float = time.process_time()
+    with session.get(url, stream=True) as response:
+        read(response)
+    seconds: float = time.process_time() - start
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / MB, seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 20, 50])
+    parser.add_argument("--before-max-mb", type=int, default=10)
+    args = parser.parse_args()
+    with StubServer() as server, requests.Session() as session:
+        for size in args.sizes:
+            body: bytes = os.urandom(size * MB)
+            server.route(
+                f"/{size}.png",
+                lambda *_, b=body: (200, {"Content-Type": "image/png"}, b),
+            )
+            url: Text = f"{server.url}/{size}.png"
+            reads = [("after", preallocate)]
+            if size <= args.before_max_mb:
+                reads.insert(0, ("before", concatenate))
+            for name, read in reads:
+                peak, seconds = measure(session, url, read)
+                print(
+                    f"{size:3d} MB {name:<7} peak {peak:8.1f} MiB cpu {seconds:8.3f} s"
+                )
+
+
+if __name__ == "__main__":
+    main()
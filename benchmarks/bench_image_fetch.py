@@ -0,0 +1,65 @@
+"""Bytes transferred and wall time of `EpicClient.epic(get_images=True)` on large PNGs.
+
+"before" re-downloads every image from `response.url` like the former response
+handler did, "after" decodes the image from the response already in hand.
+
+Usage:
+    python -m benchmarks.bench_image_fetch --images 4 --size 2048
+"""
+
+import argparse
+import time
+from typing import Dict, List, Text, Tuple, Union
+
+from PIL.ImageFile import ImageFile
+from requests.models import Response
+
+from benchmarks.mock_api import noise_png
+from nasa.clients.main import Client
+from nasa.typing import JSONType
+from nasa.utils import get_url_image
+from benchmarks.server import StubServer
+
+
+class DoubleFetchClient(Client):
+    def _response_handler(self, response: Response) -> Union[JSONType, ImageFile]:
+        if response.headers.get("Content-Type", "").startswith("image/"):
+            return get_url_image(response.url, session=self._session)
+        return super()._response_handler(response)
+
+
+def run(client: Client, server: StubServer) -> Tuple[int, float]:
+    sent: int = server.bytes_sent
+    start: float = time.perf_counter()
+    client.epic("natural", date="2021-01-01", get_images=True)
+    return server.bytes_sent - sent, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--images", type=int, default=4)
+    parser.add_argument("--size", type=int, default=2048)
+    args = parser.parse_args()
+    image: bytes = noise_png(args.size)
+    records: List[Dict[Text, Text]] = [
+        {"date": "2021-01-01 00:00:00", "image": f"epic_1b_{i}"}
+        for i in range(args.images)
+    ]
+    with StubServer() as server:
+        server.json("/EPIC/api/natural/date/2021-01-01", records)
+        for record in records:
+            server.route(
+                f"/EPIC/archive/natural/2021/01/01/png/{record['image']}.png",
+                lambda *_: (200, {"Content-Type": "image/png"}, image),
+            )
+        for name, client_class in [
+            ("before", DoubleFetchClient),
+            ("after", Client),
+        ]:
+            with client_class(base_url=server.url) as client:
+                transferred, seconds = run(client, server)
+            print(f"{name:<8} {transferred / 2 ** 20:10.1f} MiB {seconds:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
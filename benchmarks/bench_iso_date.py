@@ -0,0 +1,86 @@
+"""Per date cost of `IsoDate(value).value()` against `IsoDate.batch` and `IsoDate.date_range`.
+
+The values are a year of days as strings, dates and unix timestamps, repeated
+like the overlapping windows of a chunked harvest.
+
+Usage:
+    python -m benchmarks.bench_iso_date --days 365 --repeat 10
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Text
+
+from nasa.typing import IsoDate, IsoDateConvertible, _valid_iso_value
+
+
+def values(days: int) -> Dict[Text, List[IsoDateConvertible]]:
+    first: date = date(2021, 1, 1)
+    dates: List[date] = [first + timedelta(days=offset) for offset in range(days)]
+    return {
+        "str": [day.isoformat() for day in dates],
+        "date": dates,
+        "timestamp": [
+            int(datetime(d.year, d.month, d.day, tzinfo=timezone.utc).timestamp())
+            for d in dates
+        ],
+    }
+
+
+def seconds_per_value(call: Callable[[], Any], count: int, repeat: int) -> float:
+    start: float = time.perf_counter()
+    for _ in range(repeat):
+        call()
+    return (time.perf_counter() - start) / repeat / count
+
+
+def compare(days: int, repeat: int = 10) -> Dict[Text, Dict[Text, float]]:
+    """Time the conversions of every kind of value
+
+    Args:
+        days (int): dates per kind of value
+        repeat (int, optional): passes to average, the first batch pass fills the cache. Defaults to 10.
+
+    Returns:
+        Dict[Text, Dict[Text, float]]: seconds per date by kind of value and method
+    """
+    results: Dict[Text, Dict[Text, float]] = dict()
+    for kind, items in values(days).items():
+        _valid_iso_value.cache_clear()
+        start: float = time.perf_counter()
+        IsoDate.batch(items)
+        cold: float = (time.perf_counter() - start) / days
+        results[kind] = {
+            "IsoDate.value": seconds_per_value(
+                lambda: [IsoDate(item).value() for item in items], days, repeat
+            ),
+            "batch (cold)": cold,
+            "batch (warm)": seconds_per_value(
+                lambda: IsoDate.batch(items), days, repeat
+            ),
+        }
+    results["range"] = {
+        "IsoDate.date_range": seconds_per_value(
+            lambda: IsoDate.date_range(
+                date(2021, 1, 1), date(2021, 1, 1) + timedelta(days=days - 1)
+            ),
+            days,
+            repeat,
+        )
+    }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    for kind, timings in compare(args.days, args.repeat).items():
+        for name, duration in timings.items():
+            print(f"{kind:<10} {name:<20} {duration * 1e6:8.2f} us per date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Time of `BaseClient._response_handler` on large JSON bodies with every decoder.
+
+"response.json" is the handler before the decoder hook, the other rows use the
+`json_decoder` option of the client.
+
+Usage:
+    python -m benchmarks.bench_json --records 2000 --repeat 20
+"""
+
+import argparse
+import json
+import time
+from datetime import date
+from typing import Any, Callable, Dict, Text
+
+from benchmarks.mock_api import neo_object, techport_projects
+from nasa.clients.base import BaseClient
+from nasa.decoders import DECODERS
+from requests.models import Response
+
+
+def payloads(records: int) -> Dict[Text, bytes]:
+    """JSON bodies shaped like the largest responses of the API"""
+    bodies: Dict[Text, Any] = {
+        "techport": techport_projects(records * 10),
+        "neo_browse": {
+            "page": {"size": records},
+            "near_earth_objects": [neo_object(i) for i in range(records)],
+        },
+        "wsa_enlil": [
+            {
+                "simulationID": f"WSA-ENLIL/{i}",
+                "modelCompletionTime": f"{date(2021, 1, 1).isoformat()}T00:00Z",
+                "au": 2.0,
+                "estimatedShockArrivalTime": None,
+                "cmeInputs": [
+                    {
+                        "cmeStartTime": "2021-01-01T00:00Z",
+                        "latitude": float(i % 90),
+                        "longitude": float(i % 180),
+                        "speed": 500.0 + i,
+                        "halfAngle": 30.0,
+                        "isMostAccurate": True,
+                    }
+                ],
+                "impactList": [
+                    {"location": "Earth", "arrivalTime": "2021-01-03T00:00Z"}
+                ],
+            }
+            for i in range(records)
+        ],
+    }
+    return {name: json.dumps(body).encode() for name, body in bodies.items()}
+
+
+def response(content: bytes) -> Response:
+    result: Response = Response()
+    result.status_code = 200
+    result.headers["Content-Type"] = "application/json"
+    result._content = content
+    return result
+
+
+def seconds(call: Callable[[], Any], repeat: int) -> float:
+    start: float = time.perf_counter()
+    for _ in range(repeat):
+        call()
+    return (time.perf_counter() - start) / repeat
+
+
+def compare(records: int, repeat: int = 20) -> Dict[Text, Dict[Text, float]]:
+    """Time the response handler on every payload with every available decoder
+
+    Args:
+        records (int): records per payload, the TechPort list holds ten times more
+        repeat (int, optional): decodings to average. Defaults to 20.
+
+    Returns:
+        Dict[Text, Dict[Text, float]]: seconds per decoding by payload and decoder
+    """
+    handlers: Dict[Text, Callable[[Response], Any]] = {"response.json": Response.json}
+    for name in DECODERS:
+        try:
+            client: BaseClient = BaseClient(json_decoder=name)
+        except ImportError:
+            continue
+        handlers[name] = client._response_handler
+    results: Dict[Text, Dict[Text, float]] = dict()
+    for payload, content in payloads(records).items():
+        results[payload] = {
+            name: seconds(lambda: handler(response(content)), repeat)
+            for name, handler in handlers.items()
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    for payload, timings in compare(args.records, args.repeat).items():
+        baseline: float = timings["response.json"]
+        for name, duration in timings.items():
+            print(
+                f"{payload:<12} {name:<14} {duration * 1000:8.2f} ms "
+                f"{baseline / duration:6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
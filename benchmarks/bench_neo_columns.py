@@ -0,0 +1,101 @@
+"""Filter and sort a NEO feed by walking the dicts and with `nasa.columnar.neo_columns`.
+
+Both select the close approaches nearer than a miss distance, faster than a
+velocity and with a minimum diameter, then sort them by miss distance.
+
+Usage:
+    python -m benchmarks.bench_neo_columns --days 365 --per-day 100
+"""
+
+import argparse
+import time
+from datetime import date
+from typing import Any, Callable, Dict, List, Text, Tuple
+
+import numpy
+from benchmarks.mock_api import neo_feed
+from nasa.columnar import neo_columns
+
+MAX_MISS_KM: float = 1e7
+MIN_VELOCITY_KPS: float = 12
+MIN_DIAMETER_KM: float = 0.15
+
+
+def dict_filter(feed: Dict[Text, Any]) -> List[int]:
+    rows: List[Tuple[float, int]] = []
+    for objects in feed["near_earth_objects"].values():
+        for neo in objects:
+            diameter: float = neo["estimated_diameter"]["kilometers"][
+                "estimated_diameter_max"
+            ]
+            for approach in neo["close_approach_data"]:
+                miss: float = float(approach["miss_distance"]["kilometers"])
+                velocity: float = float(
+                    approach["relative_velocity"]["kilometers_per_second"]
+                )
+                if (
+                    miss < MAX_MISS_KM
+                    and velocity > MIN_VELOCITY_KPS
+                    and diameter > MIN_DIAMETER_KM
+                ):
+                    rows.append((miss, int(neo["id"])))
+    return [neo_id for _, neo_id in sorted(rows)]
+
+
+def columnar_filter(columns: Dict[Text, numpy.ndarray]) -> numpy.ndarray:
+    mask: numpy.ndarray = (
+        (columns["miss_distance_km"] < MAX_MISS_KM)
+        & (columns["relative_velocity_kps"] > MIN_VELOCITY_KPS)
+        & (columns["diameter_max_km"] > MIN_DIAMETER_KM)
+    )
+    order: numpy.ndarray = numpy.argsort(
+        columns["miss_distance_km"][mask], kind="stable"
+    )
+    return columns["id"][mask][order]
+
+
+def seconds(call: Callable[[], Any], repeat: int) -> float:
+    start: float = time.perf_counter()
+    for _ in range(repeat):
+        call()
+    return (time.perf_counter() - start) / repeat
+
+
+def compare(days: int, per_day: int, repeat: int = 5) -> Dict[Text, float]:
+    """Time the dict and columnar filters over the same feed
+
+    Args:
+        days (int): days in the feed
+        per_day (int): near earth objects per day
+        repeat (int, optional): runs to average. Defaults to 5.
+
+    Returns:
+        Dict[Text, float]: seconds per run by method, and the export time
+    """
+    feed: Dict[Text, Any] = neo_feed(date(2021, 1, 1), days, per_day)
+    start: float = time.perf_counter()
+    columns: Dict[Text, numpy.ndarray] = neo_columns(feed)
+    export: float = time.perf_counter() - start
+    return {
+        "rows": len(columns["id"]),
+        "export_seconds": export,
+        "dict_seconds": seconds(lambda: dict_filter(feed), repeat),
+        "columnar_seconds": seconds(lambda: columnar_filter(columns), repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--per-day", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    results: Dict[Text, float] = compare(args.days, args.per_day, args.repeat)
+    print(f"rows            {results['rows']:10d}")
+    print(f"export (once)   {results['export_seconds'] * 1000:10.2f} ms")
+    print(f"dict filter     {results['dict_seconds'] * 1000:10.2f} ms")
+    print(f"columnar filter {results['columnar_seconds'] * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Memory and field access time of a NEO feed as dicts and as `nasa.models`.
+
+The feed is decoded from JSON like a real response, so the dict form holds the
+numbers as strings, as the API sends them.
+
+Usage:
+    python -m benchmarks.bench_neo_models --days 90 --per-day 100
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from datetime import date
+from typing import Any, Callable, Dict, List, Text
+
+from benchmarks.mock_api import neo_feed
+from nasa.models import NearEarthObject, NeoFeed
+
+
+def retained(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by the result of build once it returns"""
+    gc.collect()
+    tracemalloc.start()
+    result: Any = build()
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def parsed_feed(payload: bytes) -> NeoFeed:
+    feed: NeoFeed = NeoFeed(json.loads(payload))
+    for neo in feed:
+        for approach in neo.close_approaches:
+            approach.miss_distance_km
+    return feed
+
+
+def dict_access(feed: Dict[Text, Any]) -> float:
+    total: float = 0
+    for objects in feed["near_earth_objects"].values():
+        for neo in objects:
+            total += neo["estimated_diameter"]["kilometers"]["estimated_diameter_max"]
+            for approach in neo["close_approach_data"]:
+                total += float(approach["miss_distance"]["kilometers"])
+                total += float(approach["relative_velocity"]["kilometers_per_second"])
+    return total
+
+
+def model_access(feed: NeoFeed) -> float:
+    total: float = 0
+    for neo in feed:
+        total += neo.diameter_max_km
+        for approach in neo.close_approaches:
+            total += approach.miss_distance_km
+            total += approach.relative_velocity_kps
+    return total
+
+
+def seconds(call: Callable[[], Any], repeat: int) -> float:
+    start: float = time.perf_counter()
+    for _ in range(repeat):
+        call()
+    return (time.perf_counter() - start) / repeat
+
+
+def compare(days: int, per_day: int, repeat: int = 20) -> Dict[Text, Dict[Text, float]]:
+    """Measure the dict form against the parsed models
+
+    Args:
+        days (int): days in the feed
+        per_day (int): near earth objects per day
+        repeat (int, optional): passes over the fields to average. Defaults to 20.
+
+    Returns:
+        Dict[Text, Dict[Text, float]]: retained bytes and seconds per pass over the fields, by form
+    """
+    payload: bytes = json.dumps(neo_feed(date(2021, 1, 1), days, per_day)).encode()
+    raw: Dict[Text, Any] = json.loads(payload)
+    feed: NeoFeed = parsed_feed(payload)
+    objects: List[NearEarthObject] = list(feed)
+    return {
+        "dict": {
+            "retained_bytes": retained(lambda: json.loads(payload)),
+            "access_seconds": seconds(lambda: dict_access(raw), repeat),
+        },
+        "models": {
+            "retained_bytes": retained(lambda: parsed_feed(payload)),
+            "access_seconds": seconds(lambda: model_access(feed), repeat),
+            "objects": len(objects),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--per-day", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    results: Dict[Text, Dict[Text, float]] = compare(
+        args.days, args.per_day, args.repeat
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<8} {result['retained_bytes'] / 2 ** 20:8.2f} MiB "
+            f"{result['access_seconds'] * 1000:8.2f} ms per pass"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Overhead of the progress sinks on reading a body of many small chunks.
+
+The body is served from memory so only the reading loop and the progress
+reporting are measured. "per chunk tqdm" reports every chunk like the
+downloads did before the sinks batched their updates.
+
+Usage:
+    python -m benchmarks.bench_progress --chunks 100000 --chunk-size 64
+"""
+
+import argparse
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Text
+
+from nasa.progress import (
+    NO_PROGRESS,
+    CallbackProgress,
+    MetricsProgress,
+    Progress,
+    ProgressSink,
+    TqdmProgress,
+)
+from nasa.utils import read_content
+
+
+class MemoryResponse:
+    """Stands for a streamed response, yielding chunks already in memory"""
+
+    def __init__(self, chunks: List[bytes]) -> None:
+        self.chunks: List[bytes] = chunks
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        return iter(self.chunks)
+
+
+def read(chunks: List[bytes], sink: Optional[ProgressSink]) -> bytearray:
+    """Read the chunks like `nasa.utils._read_image`, None reads them without any sink"""
+    total: int = sum(map(len, chunks))
+    if sink is None:
+        return read_content(MemoryResponse(chunks), total)
+    task: Optional[Progress] = sink.open("bench", total)
+    if task is None:
+        return read_content(MemoryResponse(chunks), total)
+    with task:
+        return read_content(MemoryResponse(chunks), total, None, task.update)
+
+
+def seconds(call: Callable[[], Any], repeat: int) -> float:
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare(chunks: int, chunk_size: int, repeat: int = 5) -> Dict[Text, float]:
+    """Time the reading of the body with every sink
+
+    Args:
+        chunks (int): chunks in the body
+        chunk_size (int): bytes per chunk
+        repeat (int, optional): runs of which the fastest is kept. Defaults to 5.
+
+    Returns:
+        Dict[Text, float]: seconds per read by sink
+    """
+    body: List[bytes] = [bytes(chunk_size)] * chunks
+    with open(os.devnull, "w") as devnull:
+        sinks: Dict[Text, Optional[ProgressSink]] = {
+            "no sink": None,
+            "none": NO_PROGRESS,
+            "metrics": MetricsProgress(),
+            "callback": CallbackProgress(lambda *_: None),
+            "tqdm": TqdmProgress(file=devnull),
+            "per chunk tqdm": TqdmProgress(min_bytes=0, min_interval=0, file=devnull),
+        }
+        return {
+            name: seconds(lambda: read(body, sink), repeat)
+            for name, sink in sinks.items()
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=100000)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    results: Dict[Text, float] = compare(args.chunks, args.chunk_size, args.repeat)
+    baseline: float = results["no sink"]
+    for name, duration in results.items():
+        print(
+            f"{name:<16} {duration * 1000:8.2f} ms "
+            f"{(duration - baseline) / args.chunks * 1e9:8.1f} ns per chunk overhead"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Requests per second of `BaseClient._get` with and without the pooled session.
+
+Usage:
+    python -m benchmarks.bench_session --requests 500
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, Text
+
+import requests
+from nasa.auth import NASAAuth
+from nasa.clients.main import Client
+from benchmarks.server import StubServer
+
+
+def requests_per_second(call: Callable[[], None], n: int) -> float:
+    start: float = time.perf_counter()
+    for _ in range(n):
+        call()
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    with StubServer() as server:
+        server.json("/planetary/apod", {"title": "stub", "url": "stub"})
+        url: Text = f"{server.url}/planetary/apod"
+        auth: NASAAuth = NASAAuth()
+        client: Client = Client(base_url=server.url)
+        results: Dict[Text, float] = {
+            "requests.get (before)": requests_per_second(
+                lambda: requests.get(url, {}, auth=auth).json(), args.requests
+            ),
+            "pooled session (after)": requests_per_second(client.apod, args.requests),
+        }
+        client.close()
+    for name, rps in results.items():
+        print(f"{name:<24} {rps:10.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
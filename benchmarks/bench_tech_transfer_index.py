@@ -0,0 +1,65 @@
+"""Keyword searches through the TechTransfer API against `nasa.stores.TechTransferIndex`.
+
+Both search the four corpora served by `MockNASA`, the API with one request per
+corpus and keyword, the index locally once it has mirrored them.
+
+Usage:
+    python -m benchmarks.bench_tech_transfer_index --records 500 --latency-ms 20 --searches 20
+"""
+
+import argparse
+import time
+from typing import Dict, Text
+
+from benchmarks.mock_api import MockNASA
+from nasa.clients.main import Client
+from nasa.stores.tech_transfer import TechTransferIndex
+
+
+def compare(
+    records: int, latency_ms: float = 20, searches: int = 20
+) -> Dict[Text, float]:
+    """Time the API and local searches of the same keyword
+
+    Args:
+        records (int): results per corpus
+        latency_ms (float, optional): median latency of the mock API. Defaults to 20.
+        searches (int, optional): searches to average. Defaults to 20.
+
+    Returns:
+        Dict[Text, float]: seconds of the mirror, and per search with each method
+    """
+    with MockNASA(latency_ms=latency_ms, image_size=8, records=records) as server:
+        client: Client = Client(base_url=server.url)
+        start: float = time.perf_counter()
+        for _ in range(searches):
+            for api_type in client.TECH_TRANSFER_TYPES:
+                client.tech_transfer(api_type, "engine")
+        api: float = (time.perf_counter() - start) / searches
+        index: TechTransferIndex = TechTransferIndex()
+        start = time.perf_counter()
+        index.mirror(client)
+        mirror: float = time.perf_counter() - start
+        client.close()
+    start = time.perf_counter()
+    for _ in range(searches):
+        index.search("engine")
+    local: float = (time.perf_counter() - start) / searches
+    index.close()
+    return {"mirror_seconds": mirror, "api_seconds": api, "local_seconds": local}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--searches", type=int, default=20)
+    args = parser.parse_args()
+    results: Dict[Text, float] = compare(args.records, args.latency_ms, args.searches)
+    print(f"mirror (once)   {results['mirror_seconds'] * 1000:10.2f} ms")
+    print(f"api search      {results['api_seconds'] * 1e6:10.1f} us")
+    print(f"local search    {results['local_seconds'] * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
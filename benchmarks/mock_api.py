@@ -0,0 +1,287 @@
+"""Local mock of api.nasa.gov serving the response shapes of every client mixin.
+
+Each route answers after a latency drawn from a log-normal distribution around
+`latency_ms`, so percentiles look like a real API rather than a constant sleep.
+"""
+
+import json
+import random
+import time
+from datetime import date, timedelta
+from io import BytesIO
+from threading import Lock
+from typing import Any, Dict, List, Optional, Text
+
+from PIL import Image
+from benchmarks.server import Route, StubServer
+
+DONKI_TYPES: List[Text] = [
+    "CME",
+    "CMEAnalysis",
+    "GST",
+    "IPS",
+    "FLR",
+    "SEP",
+    "MPC",
+    "RBE",
+    "HSS",
+    "WSAEnlilSimulations",
+    "notifications",
+]
+
+
+def noise_png(size: int, seed: int = 0) -> bytes:
+    """PNG of random pixels, which does not compress, sized like a real archive image"""
+    length: int = size * size * 3
+    # Random.randbytes is only available from Python 3.9
+    pixels: bytes = (
+        random.Random(seed).getrandbits(length * 8).to_bytes(length, "little")
+    )
+    buffer: BytesIO = BytesIO()
+    Image.frombytes("RGB", (size, size), pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def apod_record(day: date) -> Dict[Text, Text]:
+    return {
+        "copyright": "Stub Observatory",
+        "date": day.isoformat(),
+        "explanation": "A stub explanation of the picture of the day. " * 20,
+        "hdurl": f"https://apod.nasa.gov/apod/image/{day:%y%m}/stub_{day:%d}_hd.jpg",
+        "media_type": "image",
+        "service_version": "v1",
+        "title": f"Stub Picture {day.isoformat()}",
+        "url": f"https://apod.nasa.gov/apod/image/{day:%y%m}/stub_{day:%d}.jpg",
+    }
+
+
+def donki_events(api_type: Text, count: int) -> List[Dict[Text, Any]]:
+    return [
+        {
+            "activityID": f"2021-01-{i % 28 + 1:02d}T00:00:00-{api_type}-{i:03d}",
+            "catalog": "M2M_CATALOG",
+            "startTime": f"2021-01-{i % 28 + 1:02d}T00:00Z",
+            "sourceLocation": "N20W10",
+            "activeRegionNum": 12800 + i,
+            "link": f"https://kauai.ccmc.gsfc.nasa.gov/DONKI/view/{api_type}/{i}/-1",
+            "note": "Stub event note. " * 5,
+            "instruments": [{"displayName": "SOHO: LASCO/C2"}],
+            "linkedEvents": [{"activityID": f"2021-01-01T00:00:00-IPS-{i:03d}"}],
+        }
+        for i in range(count)
+    ]
+
+
+def neo_object(i: int) -> Dict[Text, Any]:
+    diameter: Dict[Text, float] = {
+        "estimated_diameter_min": 0.1 + i / 1000,
+        "estimated_diameter_max": 0.3 + i / 1000,
+    }
+    return {
+        "id": str(2000000 + i),
+        "neo_reference_id": str(2000000 + i),
+        "name": f"({2000 + i} AB)",
+        "nasa_jpl_url": f"http://ssd.jpl.nasa.gov/sbdb.cgi?sstr={2000000 + i}",
+        "absolute_magnitude_h": 20.0 + i % 10,
+        "estimated_diameter": {
+            "kilometers": diameter,
+            "meters": {k: v * 1000 for k, v in diameter.items()},
+        },
+        "is_potentially_hazardous_asteroid": i % 7 == 0,
+        "close_approach_data": [
+            {
+                "close_approach_date": "2021-01-01",
+                "epoch_date_close_approach": 1609459200000,
+                "relative_velocity": {"kilometers_per_second": str(10.0 + i % 5)},
+                "miss_distance": {"kilometers": str(1e6 * (1 + i % 30))},
+                "orbiting_body": "Earth",
+            }
+        ],
+        "is_sentry_object": False,
+    }
+
+
+def neo_feed(start: date, days: int, per_day: int) -> Dict[Text, Any]:
+    feed: Dict[Text, List] = {
+        (start + timedelta(days=d)).isoformat(): [
+            neo_object(d * per_day + i) for i in range(per_day)
+        ]
+        for d in range(days)
+    }
+    return {
+        "links": {"self": "stub"},
+        "element_count": days * per_day,
+        "near_earth_objects": feed,
+    }
+
+
+def epic_records(day: date, count: int) -> List[Dict[Text, Any]]:
+    return [
+        {
+            "identifier": f"{day:%Y%m%d}{i:06d}",
+            "caption": "This image was taken by NASA's EPIC camera onboard the NOAA DSCOVR spacecraft",
+            "image": f"epic_1b_{day:%Y%m%d}{i:06d}",
+            "version": "03",
+            "date": f"{day.isoformat()} {i % 24:02d}:00:00",
+            "centroid_coordinates": {"lat": 10.0, "lon": -100.0 + i},
+        }
+        for i in range(count)
+    ]
+
+
+def mars_photos(rover: Text, count: int) -> Dict[Text, List]:
+    return {
+        "photos": [
+            {
+                "id": 100000 + i,
+                "sol": 1000,
+                "camera": {"id": 20, "name": "FHAZ", "rover_id": 5},
+                "img_src": f"http://mars.jpl.nasa.gov/msl-raw-images/stub/{i}.JPG",
+                "earth_date": "2015-05-30",
+                "rover": {"id": 5, "name": rover.title(), "status": "active"},
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def techport_projects(count: int) -> Dict[Text, Any]:
+    return {
+        "projects": [
+            {"projectId": 90000 + i, "lastUpdated": "2021-1-1"} for i in range(count)
+        ],
+        "totalCount": count,
+    }
+
+
+def tech_transfer_results(api_type: Text, count: int) -> Dict[Text, Any]:
+    return {
+        "results": [
+            [
+                f"stub{i}",
+                f"GSC-{17000 + i}-1",
+                f"Stub {api_type} title {i}",
+                'A stub technology description with <span class="highlight">engine</span>. '
+                * 4,
+                f"GSC-TOPS-{i}",
+                "propulsion",
+                "",
+                "",
+                "",
+                "https://technology.nasa.gov/t2media/stub.jpg",
+                "",
+                1.0,
+            ]
+            for i in range(count)
+        ],
+        "count": count,
+        "total": count,
+        "perpage": 10,
+        "page": 0,
+    }
+
+
+class MockNASA(StubServer):
+    """StubServer serving fixtures shaped like the api.nasa.gov responses.
+
+    Args:
+        latency_ms (float, optional): median simulated latency of every response. Defaults to 20.
+        sigma (float, optional): shape of the log-normal latency, 0 for a constant latency. Defaults to 0.5.
+        image_size (int, optional): width and height of the served PNG images. Defaults to 512.
+        records (int, optional): number of records in list responses. Defaults to 25.
+        seed (int, optional): seed of the latency and image generators. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 20,
+        sigma: float = 0.5,
+        image_size: int = 512,
+        records: int = 25,
+        seed: int = 0,
+    ) -> None:
+        super().__init__()
+        self.latency_ms: float = latency_ms
+        self.sigma: float = sigma
+        self._random: random.Random = random.Random(seed)
+        self._random_lock: Lock = Lock()
+        self.image: bytes = noise_png(image_size, seed)
+        day: date = date(2021, 1, 1)
+        self.add_json("/planetary/apod", apod_record(day))
+        for api_type in DONKI_TYPES:
+            self.add_json(f"/DONKI/{api_type}", donki_events(api_type, records))
+        self.add_json("/neo/rest/v1/feed", neo_feed(day, 7, records))
+        self.add_json(
+            "/neo/rest/v1/neo/browse",
+            {
+                "page": {"size": records},
+                "near_earth_objects": [neo_object(i) for i in range(records)],
+            },
+        )
+        epic: List[Dict[Text, Any]] = epic_records(day, 4)
+        self.add_json("/EPIC/api/natural/date/2021-01-01", epic)
+        for record in epic:
+            self.add_image(
+                f"/EPIC/archive/natural/2021/01/01/png/{record['image']}.png"
+            )
+        for rover in ("curiosity", "opportunity", "spirit"):
+            self.add_json(
+                f"/mars-photos/api/v1/rovers/{rover}/photos",
+                mars_photos(rover, records),
+            )
+        self.add_image("/planetary/earth/imagery")
+        self.add_json(
+            "/planetary/earth/assets",
+            {
+                "date": "2021-01-01T00:00:00",
+                "id": "LC8_L1T_TOA/stub",
+                "resource": {"dataset": "LC8_L1T_TOA"},
+            },
+        )
+        self.add_json("/techport/api/projects/", techport_projects(records * 10))
+        for api_type in ("patent", "patent_issued", "software", "Spinoff"):
+            for keyword in ("", "engine"):
+                self.add_json(
+                    f"/techtransfer/{api_type}/{keyword}",
+                    tech_transfer_results(api_type, records),
+                )
+
+    def delay(self) -> None:
+        if self.latency_ms <= 0:
+            return
+        with self._random_lock:
+            factor: float = self._random.lognormvariate(0, self.sigma)
+        time.sleep(self.latency_ms * factor / 1000)
+
+    def delayed(self, handler: Route) -> Route:
+        def route(*args: Any):
+            self.delay()
+            return handler(*args)
+
+        return route
+
+    def add_json(self, path: Text, body: Any, headers: Optional[Dict] = None) -> None:
+        payload: bytes = json.dumps(body).encode()
+        response_headers: Dict[Text, Text] = {
+            "Content-Type": "application/json",
+            "X-RateLimit-Limit": "1000000",
+            "X-RateLimit-Remaining": "999999",
+            **(dict() if headers is None else headers),
+        }
+        self.route(path, self.delayed(lambda *_: (200, response_headers, payload)))
+
+    def add_image(self, path: Text) -> None:
+        image: bytes = self.image
+        self.route(
+            path, self.delayed(lambda *_: (200, {"Content-Type": "image/png"}, image))
+        )
+
+
+if __name__ == "__main__":
+    with MockNASA() as server:
+        print(f"Mock NASA API listening on {server.url}, press Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
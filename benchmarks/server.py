@@ -0,0 +1,103 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple
+from urllib.parse import parse_qs, urlparse
+
+Route = Callable[[Text, Dict[Text, List[Text]], Dict[Text, Text]], Tuple]
+
+
+class StubServer:
+    """Local HTTP/1.1 server mimicking api.nasa.gov for tests and benchmarks.
+
+    Routes map a path to a handler receiving (path, query, headers) and returning
+    (status, headers, body). Unknown paths answer with `{}` as JSON.
+    """
+
+    def __init__(self, routes: Optional[Dict[Text, Route]] = None) -> None:
+        self.routes: Dict[Text, Route] = dict() if routes is None else routes
+        self.connections: int = 0
+        self.bytes_sent: int = 0
+        self.requests: List[Tuple[Text, Dict[Text, List[Text]], Dict[Text, Text]]] = []
+        self._lock: Lock = Lock()
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ("127.0.0.1", 0), self._handler()
+        )
+        self._server.daemon_threads = True
+        self._thread: Thread = Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+
+    @property
+    def url(self) -> Text:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def route(self, path: Text, handler: Route) -> None:
+        self.routes[path] = handler
+
+    def json(self, path: Text, body: Any, headers: Optional[Dict] = None) -> None:
+        payload: bytes = json.dumps(body).encode()
+        extra: Dict[Text, Text] = dict() if headers is None else headers
+        self.route(
+            path,
+            lambda *_: (200, {"Content-Type": "application/json", **extra}, payload),
+        )
+
+    def start(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def _handler(self) -> type:
+        stub: StubServer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version: Text = "HTTP/1.1"
+            disable_nagle_algorithm: bool = True
+            wbufsize: int = -1
+
+            def setup(self) -> None:
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                query: Dict[Text, List[Text]] = parse_qs(parsed.query)
+                headers: Dict[Text, Text] = dict(self.headers.items())
+                with stub._lock:
+                    stub.requests.append((parsed.path, query, headers))
+                handler: Optional[Route] = stub.routes.get(parsed.path)
+                if handler is None:
+                    status, response_headers, body = (
+                        200,
+                        {"Content-Type": "application/json"},
+                        b"{}",
+                    )
+                else:
+                    status, response_headers, body = handler(
+                        parsed.path, query, headers
+                    )
+                self.send_response(status)
+                for key, value in response_headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with stub._lock:
+                    stub.bytes_sent += len(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -2,4 +2,30 @@ __author__ = "Faisal Malik"
 __email__ = "faisalmalikwidyaprasetya@gmail.com"
 __version__ = "0.3.1"
 
-from nasa.clients.main import Client
+from importlib import import_module
+from typing import Any, Dict, List, Text, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nasa.clients.main import Client
+    from nasa.clients.async_main import AsyncClient
+
+# The clients pull in requests, and aiohttp for the async one, so they are
+# imported on first access to keep `import nasa` cheap
+_LAZY_ATTRIBUTES: Dict[Text, Text] = {
+    "Client": "nasa.clients.main",
+    "AsyncClient": "nasa.clients.async_main",
+}
+
+__all__: List[Text] = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: Text) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[Text]:
+    return sorted(list(globals()) + __all__)
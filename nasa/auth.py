@@ -1,25 +1,51 @@
+from functools import partial
 from hashlib import sha256
-from typing import Any, Text
+from typing import Any, Optional, Sequence, Text, Tuple, Union
 from requests.auth import AuthBase
-from requests.models import PreparedRequest
+from requests.models import PreparedRequest, Response
+
+from nasa.ratelimit import RATE_LIMIT_PERIOD, RateLimiter
 
 
 class NASAAuth(AuthBase):
-    def __init__(self, api_key: Text = "DEMO_KEY") -> None:
-        self.__api_key: Text = api_key
+    def __init__(
+        self,
+        api_key: Union[Text, Sequence[Text]] = "DEMO_KEY",
+        rate_limit: Optional[int] = None,
+        rate_limit_period: float = RATE_LIMIT_PERIOD,
+    ) -> None:
+        """Authenticate the requests with an API key, rotating across a pool of keys when several are given
+
+        Args:
+            api_key (Union[Text, Sequence[Text]], optional): API key or pool of API keys. Defaults to "DEMO_KEY".
+            rate_limit (Optional[int], optional): Requests allowed per key and period, None to learn it from the X-RateLimit-Limit header. Defaults to None.
+            rate_limit_period (float, optional): Quota period in seconds. Defaults to one hour.
+        """
+        api_keys: Sequence[Text] = [api_key] if isinstance(api_key, str) else api_key
+        self.__api_keys: Tuple[Text, ...] = tuple(api_keys)
+        self.rate_limiter: RateLimiter = RateLimiter(
+            self.__api_keys, rate_limit, rate_limit_period
+        )
 
     def __call__(self, request: PreparedRequest) -> PreparedRequest:
-        request.prepare_url(request.url, {"api_key": self.__api_key})
+        api_key: Text = self.rate_limiter.acquire()
+        request.prepare_url(request.url, {"api_key": api_key})
+        request.register_hook("response", partial(self.handle_response, api_key))
         return request
 
+    def handle_response(self, api_key: Text, response: Response, **kwargs: Any) -> None:
+        self.rate_limiter.update(api_key, response.status_code, response.headers)
+
     def __eq__(self, obj: Any) -> bool:
         return hash(self) == hash(obj)
 
     def __hash__(self) -> int:
-        return hash(self.__api_key)
+        if len(self.__api_keys) == 1:
+            return hash(self.__api_keys[0])
+        return hash(self.__api_keys)
 
     def __str__(self) -> str:
-        checksum: Text = sha256(self.__api_key.encode()).hexdigest()
+        checksum: Text = sha256("".join(self.__api_keys).encode()).hexdigest()
         string: Text = f"NASAAuth(API Key Checksum = {checksum}"
         return string
 
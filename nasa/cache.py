@@ -0,0 +1,254 @@
+import os
+import pickle
+import time
+from collections import OrderedDict
+from hashlib import sha256
+from threading import RLock
+from typing import Dict, List, Optional, Text, Tuple
+from urllib.parse import urlencode
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from nasa.typing import JSONType
+
+DEFAULT_CACHE_TTL: Dict[Text, float] = {
+    "": 60 * 60,
+    "/planetary/apod": 6 * 60 * 60,
+    "/DONKI": 15 * 60,
+    "/neo/rest/v1/feed": 60 * 60,
+    "/EPIC/archive": 7 * 24 * 60 * 60,
+    "/insight_weather": 15 * 60,
+}
+
+
+def cache_key(path: Text, params: Dict[Text, JSONType]) -> Text:
+    """Build the cache key of a request from its path and normalized params
+
+    None values are dropped, as they are never sent, and the params are sorted by name.
+
+    Args:
+        path (Text): path of the request
+        params (Dict[Text, JSONType]): query params of the request
+
+    Returns:
+        Text: cache key
+    """
+    query: List[Tuple[Text, Text]] = sorted(
+        (key, str(value)) for key, value in params.items() if value is not None
+    )
+    return f"{path}?{urlencode(query)}"
+
+
+def cache_ttl(path: Text, ttl: Dict[Text, float]) -> float:
+    """Get the TTL of a path from the entry with the longest matching path prefix
+
+    Args:
+        path (Text): path of the request
+        ttl (Dict[Text, float]): TTL in seconds by path prefix
+
+    Returns:
+        float: TTL in seconds, 0 if no prefix matches
+    """
+    prefixes: List[Text] = [prefix for prefix in ttl if path.startswith(prefix)]
+    if not prefixes:
+        return 0
+    return ttl[max(prefixes, key=len)]
+
+
+class CacheEntry:
+    """Stored response with its expiry time and conditional request validators"""
+
+    def __init__(self, response: Response, expires: float) -> None:
+        self.url: Text = response.url
+        self.status_code: int = response.status_code
+        self.reason: Optional[Text] = response.reason
+        self.headers: Dict[Text, Text] = dict(response.headers)
+        self.encoding: Optional[Text] = response.encoding
+        self.content: bytes = response.content
+        self.expires: float = expires
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires
+
+    def validators(self) -> Dict[Text, Text]:
+        """Headers to revalidate the entry with a conditional request
+
+        Returns:
+            Dict[Text, Text]: If-None-Match and If-Modified-Since headers when the server sent ETag or Last-Modified
+        """
+        headers: CaseInsensitiveDict = CaseInsensitiveDict(self.headers)
+        validators: Dict[Text, Text] = dict()
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+    def to_response(self) -> Response:
+        response: Response = Response()
+        response._content = self.content
+        response.status_code = self.status_code
+        response.reason = self.reason
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = self.url
+        response.encoding = self.encoding
+        return response
+
+
+class BaseCache:
+    """Storage interface of the response cache"""
+
+    def get(self, key: Text) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def set(self, key: Text, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: Text) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        """In-memory LRU cache
+
+        Args:
+            max_entries (int, optional): Maximum number of entries kept. Defaults to 1024.
+            max_bytes (int, optional): Maximum total size of the stored bodies. Defaults to 64 MiB.
+        """
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.size: int = 0
+        self._entries: "OrderedDict[Text, CacheEntry]" = OrderedDict()
+        self._lock: RLock = RLock()
+
+    def get(self, key: Text) -> Optional[CacheEntry]:
+        with self._lock:
+            entry: Optional[CacheEntry] = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Text, entry: CacheEntry) -> None:
+        with self._lock:
+            self.delete(key)
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self.size += entry.size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+
+    def delete(self, key: Text) -> None:
+        with self._lock:
+            entry: Optional[CacheEntry] = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache(BaseCache):
+    SUFFIX: Text = ".cache"
+
+    def __init__(self, directory: Text, max_bytes: int = 512 * 1024 * 1024) -> None:
+        """Persistent cache storing one pickled entry per file, least recently used files are evicted first
+
+        Only point it to a directory written by this cache, as the entries are unpickled.
+
+        Args:
+            directory (Text): Directory of the cache files, created if missing
+            max_bytes (int, optional): Maximum total size of the cache files. Defaults to 512 MiB.
+        """
+        self.directory: Text = directory
+        self.max_bytes: int = max_bytes
+        self._lock: RLock = RLock()
+        os.makedirs(directory, exist_ok=True)
+        self.size: int = sum(size for _, _, size in self._files())
+
+    def _path(self, key: Text) -> Text:
+        return os.path.join(
+            self.directory, sha256(key.encode()).hexdigest() + self.SUFFIX
+        )
+
+    def _files(self) -> List[Tuple[float, Text, int]]:
+        files: List[Tuple[float, Text, int]] = list()
+        for item in os.scandir(self.directory):
+            if item.name.endswith(self.SUFFIX):
+                stat: os.stat_result = item.stat()
+                files.append((stat.st_mtime, item.path, stat.st_size))
+        return files
+
+    def get(self, key: Text) -> Optional[CacheEntry]:
+        path: Text = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                entry: CacheEntry = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            # Evicted or replaced since it was read
+            pass
+        return entry
+
+    def set(self, key: Text, entry: CacheEntry) -> None:
+        data: bytes = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        path: Text = self._path(key)
+        with self._lock:
+            self.delete(key)
+            if len(data) > self.max_bytes:
+                return
+            temporary_path: Text = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, path)
+            self.size += len(data)
+            if self.size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        files: List[Tuple[float, Text, int]] = sorted(self._files())
+        self.size = sum(size for _, _, size in files)
+        for _, path, size in files:
+            if self.size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self.size -= size
+
+    def delete(self, key: Text) -> None:
+        path: Text = self._path(key)
+        with self._lock:
+            try:
+                size: int = os.path.getsize(path)
+                os.remove(path)
+            except FileNotFoundError:
+                return
+            self.size -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, path, _ in self._files():
+                os.remove(path)
+            self.size = 0
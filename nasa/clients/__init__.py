@@ -0,0 +1,33 @@
+from importlib import import_module
+from typing import Any, Dict, List, Text
+
+# Each mixin is imported on first access, `Client` still needs all of them
+_LAZY_ATTRIBUTES: Dict[Text, Text] = {
+    "ApodClient": "nasa.clients.apod",
+    "AsyncBaseClient": "nasa.clients.async_base",
+    "AsyncClient": "nasa.clients.async_main",
+    "BaseClient": "nasa.clients.base",
+    "Client": "nasa.clients.main",
+    "DonkiClient": "nasa.clients.donki",
+    "EarthClient": "nasa.clients.earth",
+    "EpicClient": "nasa.clients.epic",
+    "InsightClient": "nasa.clients.insight",
+    "MarsRoverPhotosClient": "nasa.clients.mars_rover_photos",
+    "NeoClient": "nasa.clients.neo",
+    "TechPortClient": "nasa.clients.techport",
+    "TechTransferClient": "nasa.clients.tech_transfer",
+}
+
+__all__: List[Text] = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: Text) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[Text]:
+    return sorted(list(globals()) + __all__)
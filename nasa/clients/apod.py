@@ -1,12 +1,15 @@
+import os
 from warnings import warn
-from typing import Dict, Optional, Text, Union
-from PIL.ImageFile import ImageFile
+from typing import Dict, List, Optional, Text, Tuple, TYPE_CHECKING, Union
 
 from nasa.clients.base import BaseClient
 from nasa.typing import IsoDate, IsoDateConvertible, JSONType
-from nasa.utils import get_url_image
+from nasa.utils import download_all, get_urls_images, url_filename
 from nasa.warnings import AttributesCollussionWarning
 
+if TYPE_CHECKING:
+    from PIL.ImageFile import ImageFile
+
 
 class ApodClient(BaseClient):
     def apod(
@@ -42,9 +45,9 @@ class ApodClient(BaseClient):
                 "url": "https://apod.nasa.gov/apod/image/{image_id}/{filename}.{format}"
             }
         """
-        iso_date: Optional[Text] = IsoDate(date).value()
-        iso_start_date: Optional[Text] = IsoDate(start_date).value()
-        iso_end_date: Optional[Text] = IsoDate(end_date).value()
+        iso_date: Optional[Text] = IsoDate.cached_value(date)
+        iso_start_date: Optional[Text] = IsoDate.cached_value(start_date)
+        iso_end_date: Optional[Text] = IsoDate.cached_value(end_date)
         if iso_date is not None:
             if iso_start_date is not None or iso_end_date is not None:
                 message: Text = "start_date or end_date shouldn't be filled when the date is filled. Set them to None"
@@ -71,16 +74,85 @@ class ApodClient(BaseClient):
         }
         response: JSONType = self._get(path, params)
         if get_image or get_hd_image:
-            image_response: Dict[Text, Union[JSONType, Optional[ImageFile]]] = {
+            image_response: Dict[Text, Union[JSONType, Optional["ImageFile"]]] = {
                 "JSON": response
             }
             content_json: JSONType = response
+            keys: List[Text] = list()
+            urls: List[Text] = list()
             if get_image:
-                url: Text = content_json.get("url")
-                image_response["image"] = get_url_image(url)
+                keys.append("image")
+                urls.append(content_json.get("url"))
             if get_hd_image:
-                hdurl: Text = content_json.get("hdurl")
-                image_response["hd_image"] = get_url_image(hdurl)
+                keys.append("hd_image")
+                urls.append(content_json.get("hdurl"))
+            images: List[Optional["ImageFile"]] = get_urls_images(
+                urls,
+                session=self._session,
+                observers=self._observers,
+                progress=self._progress,
+            )
+            image_response.update(zip(keys, images))
             return image_response
         else:
             return response
+
+    def apod_download(
+        self,
+        directory: Text,
+        date: Optional[IsoDateConvertible] = None,
+        start_date: Optional[IsoDateConvertible] = None,
+        end_date: Optional[IsoDateConvertible] = None,
+        count: Optional[int] = None,
+        hd: bool = False,
+        max_workers: int = 4,
+    ) -> List[Text]:
+        """Download the Astronomy Pictures of the Day to a directory, streaming them to disk
+
+        Files already in the directory are skipped and interrupted downloads are resumed.
+
+        Args:
+            directory (Text): Destination directory, created if missing
+            date (Optional[IsoDateConvertible], optional): The date of the APOD image to retrieve. Defaults to None.
+            start_date (Optional[IsoDateConvertible], optional): The start of a date range. Cannot be used with date. Defaults to None.
+            end_date (Optional[IsoDateConvertible], optional): The end of the date range, when used with start_date. Defaults to None.
+            count (Optional[int], optional): If this is specified then count randomly chosen images will be downloaded. Defaults to None.
+            hd (bool, optional): Download the HD image when there is one. Defaults to False.
+            max_workers (int, optional): Number of images downloaded at the same time. Defaults to 4.
+
+        Returns:
+            List[Text]: Path of the downloaded images, videos are skipped
+        """
+        response: JSONType = self.apod(
+            date=date, start_date=start_date, end_date=end_date, count=count
+        )
+        os.makedirs(directory, exist_ok=True)
+        return download_all(
+            self._apod_downloads(response, directory, hd),
+            session=self._session,
+            max_workers=max_workers,
+            progress=self._progress,
+        )
+
+    @staticmethod
+    def _apod_downloads(
+        response: JSONType, directory: Text, hd: bool
+    ) -> List[Tuple[Text, Text]]:
+        """URL and destination file of the images of an APOD response
+
+        Args:
+            response (JSONType): APOD response, a record or a list of records
+            directory (Text): Destination directory
+            hd (bool): Use the HD image when there is one
+
+        Returns:
+            List[Tuple[Text, Text]]: URL and destination file of every image
+        """
+        records: List[JSONType] = response if isinstance(response, list) else [response]
+        downloads: List[Tuple[Text, Text]] = list()
+        for record in records:
+            if record.get("media_type") != "image":
+                continue
+            url: Text = (hd and record.get("hdurl")) or record.get("url")
+            downloads.append((url, os.path.join(directory, url_filename(url))))
+        return downloads
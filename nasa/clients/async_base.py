@@ -0,0 +1,466 @@
+import asyncio
+import os
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Text,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+from urllib.parse import urlparse
+from warnings import warn
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from nasa.cache import BaseCache, CacheEntry, cache_key
+from nasa.clients.base import BaseClient
+from nasa.decoders import Decoder
+from nasa.exceptions import NASAContentTypeNotImage, NASAHTTPError
+from nasa.metrics import Observer, RequestTrace
+from nasa.progress import Progress, ProgressConvertible
+from nasa.retry import CircuitBreaker, RetryPolicy
+from nasa.singleflight import AsyncSingleFlight
+from nasa.typing import JSONType
+from nasa.utils import (
+    PARTIAL_SUFFIX,
+    adaptive_chunk_size,
+    download_headers,
+    expected_download_size,
+    finish_download,
+    open_image,
+)
+from nasa.warnings import InvalidInputWarning
+
+if TYPE_CHECKING:
+    from PIL.ImageFile import ImageFile
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncBaseClient(BaseClient):
+    def __init__(
+        self,
+        api_key: Union[Text, Sequence[Text]] = "DEMO_KEY",
+        session: Optional["aiohttp.ClientSession"] = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keep_alive: bool = True,
+        base_url: Optional[Text] = None,
+        cache: Optional[BaseCache] = None,
+        cache_ttl: Optional[Dict[Text, float]] = None,
+        rate_limit: Optional[int] = None,
+        observers: Sequence[Observer] = (),
+        retry: Optional[Union[RetryPolicy, Dict[Text, RetryPolicy]]] = None,
+        circuit_breaker: Union[bool, CircuitBreaker] = True,
+        coalesce: bool = True,
+        json_decoder: Union[Text, Decoder] = "auto",
+        progress: ProgressConvertible = "tqdm",
+    ) -> None:
+        """Base client performing the requests on the running asyncio event loop with aiohttp
+
+        Args:
+            api_key (Union[Text, Sequence[Text]], optional): NASA API Key, or a pool of keys to rotate across. Defaults to "DEMO_KEY".
+            session (Optional[aiohttp.ClientSession], optional): Session to be reused instead of creating a new one. The connector options are ignored when it is given. Defaults to None.
+            limit (int, optional): Maximum number of simultaneous connections, further calls wait on the event loop. Defaults to 100.
+            limit_per_host (int, optional): Maximum number of simultaneous connections per host, 0 means no limit. Defaults to 0.
+            keep_alive (bool, optional): If False, connections are closed after every response. Defaults to True.
+            base_url (Optional[Text], optional): Override the API base url, e.g. for a local stub server. Defaults to None.
+            cache (Optional[BaseCache], optional): Response cache, e.g. `nasa.cache.MemoryCache` or `nasa.cache.DiskCache`. Defaults to None.
+            cache_ttl (Optional[Dict[Text, float]], optional): Cache TTL in seconds by path prefix, the longest matching prefix wins. Defaults to `nasa.cache.DEFAULT_CACHE_TTL`.
+            rate_limit (Optional[int], optional): Hourly requests allowed per key, None to learn it from the X-RateLimit-Limit header. Requests are paced so no key runs out of quota. Defaults to None.
+            observers (Sequence[Observer], optional): Callables receiving a `nasa.metrics.RequestEvent` when every request starts, ends, fails or receives its body, e.g. `nasa.metrics.MetricsCollector`. Defaults to ().
+            retry (Optional[Union[RetryPolicy, Dict[Text, RetryPolicy]]], optional): Retry policy of 429, 5xx and connection errors, or policies by path prefix where the longest matching prefix wins. `nasa.retry.NO_RETRY` disables retries. Defaults to `nasa.retry.DEFAULT_RETRY_POLICIES`.
+            circuit_breaker (Union[bool, CircuitBreaker], optional): Circuit breaker failing fast while an upstream is down, True for the default one and False to disable it. Defaults to True.
+            coalesce (bool, optional): If True, concurrent calls with the same path and params share one upstream request. Defaults to True.
+            json_decoder (Union[Text, Decoder], optional): Decoder of the JSON responses, "auto" for orjson when it is installed, "orjson", "json", "raw" to return the undecoded bytes, or a callable decoding bytes. Defaults to "auto".
+            progress (ProgressConvertible, optional): Sink of the progress of image fetches and downloads, "tqdm", "none", a `nasa.progress.ProgressSink` such as `MetricsProgress`, or a callback. Defaults to "tqdm".
+
+        Raises:
+            ImportError: Raised when aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncClient requires aiohttp, install it with `pip install python-nasa[async]`"
+            )
+        self._configure(
+            api_key,
+            base_url,
+            cache,
+            cache_ttl,
+            rate_limit,
+            observers,
+            retry,
+            circuit_breaker,
+            json_decoder,
+            progress,
+        )
+        self._owns_session: bool = session is None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._keep_alive: bool = keep_alive
+        self._single_flight: Optional[AsyncSingleFlight] = (
+            AsyncSingleFlight() if coalesce else None
+        )
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # aiohttp sessions are bound to the event loop, so it is created on first use
+        if self._session is None or self._session.closed:
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                force_close=not self._keep_alive,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled connections if the session is owned by this client"""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncBaseClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @staticmethod
+    def _prepare_params(params: Dict[Text, JSONType]) -> Dict[Text, Text]:
+        # Mirror requests: None values are dropped and other values are stringified
+        return {key: str(value) for key, value in params.items() if value is not None}
+
+    @staticmethod
+    async def _to_response(client_response: "aiohttp.ClientResponse") -> Response:
+        response: Response = Response()
+        response._content = await client_response.read()
+        response.status_code = client_response.status
+        response.reason = client_response.reason
+        response.headers = CaseInsensitiveDict(client_response.headers)
+        response.url = str(client_response.url)
+        response.encoding = get_encoding_from_headers(response.headers)
+        return response
+
+    async def _get(
+        self, path: Text, params: Dict[Text, JSONType] = dict()
+    ) -> Union[JSONType, "ImageFile"]:
+        """Making a GET request to the base url with given path and params without blocking the event loop.
+
+        Args:
+            path (Text): path to be concatinated to the base url
+            params (Dict, optional): parameters to be passed as query in url. Defaults to dict().
+
+        Returns:
+            Union[JSONType, ImageFile]: Depends on the result of the response handler
+        """
+        url: Text = f"{self.BASE_URL}{path}"
+        trace: RequestTrace = RequestTrace(self._observers, path, url)
+        response: Optional[Response] = None
+        try:
+            response, cache, shared = await self._send_coalesced(
+                path, url, params, trace
+            )
+            if cache in (None, "miss") and not shared:
+                trace.bytes(len(response.content), response.status_code)
+            content: Union[JSONType, "ImageFile"] = self._response_handler(response)
+        except Exception as error:
+            if response is None:
+                trace.error(error)
+            else:
+                trace.error(error, response.status_code, response.headers)
+            raise
+        trace.end(response.status_code, response.headers, cache, shared)
+        return content
+
+    async def _send_coalesced(
+        self,
+        path: Text,
+        url: Text,
+        params: Dict[Text, JSONType],
+        trace: RequestTrace,
+    ) -> Tuple[Response, Optional[Text], bool]:
+        """Send the request, sharing it with the concurrent coroutines having the same path and params
+
+        Returns:
+            Tuple[Response, Optional[Text], bool]: response, cache result, and whether the response was shared with another call
+        """
+        if self._single_flight is None:
+            return (*await self._send(path, url, params, trace), False)
+        (response, cache), shared = await self._single_flight.do(
+            cache_key(path, params), lambda: self._send(path, url, params, trace)
+        )
+        return response, cache, shared
+
+    async def _send(
+        self,
+        path: Text,
+        url: Text,
+        params: Dict[Text, JSONType],
+        trace: RequestTrace,
+    ) -> Tuple[Response, Optional[Text]]:
+        """Send the request on the event loop, or answer it from the cache
+
+        Args:
+            path (Text): path of the request
+            url (Text): full url of the request
+            params (Dict[Text, JSONType]): query params of the request
+            trace (RequestTrace): events of the request
+
+        Returns:
+            Tuple[Response, Optional[Text]]: response and the cache result, "hit", "revalidated", "miss" or None without cache
+        """
+        key: Optional[Text] = None
+        entry: Optional[CacheEntry] = None
+        headers: Dict[Text, Text] = dict()
+        if self._cache is not None:
+            key, entry = self._cache_lookup(path, params)
+            if entry is not None and entry.is_fresh():
+                return entry.to_response(), "hit"
+            if entry is not None:
+                headers = entry.validators()
+        response: Response = await self._send_with_retry(
+            path, trace, lambda: self._send_once(url, params, headers)
+        )
+        if self._cache is None:
+            return response, None
+        cache: Text = self._cache_result(entry, response)
+        return self._cache_store(key, path, entry, response), cache
+
+    async def _send_once(
+        self, url: Text, params: Dict[Text, JSONType], headers: Dict[Text, Text]
+    ) -> Response:
+        api_key: Text = await self._auth.rate_limiter.acquire_async()
+        query: Dict[Text, Text] = {**self._prepare_params(params), "api_key": api_key}
+        async with self._get_session().get(
+            url, params=query, headers=headers
+        ) as client_response:
+            response: Response = await self._to_response(client_response)
+        self._auth.rate_limiter.update(api_key, response.status_code, response.headers)
+        return response
+
+    async def _send_with_retry(
+        self,
+        path: Text,
+        trace: RequestTrace,
+        send: Callable[[], Awaitable[Response]],
+    ) -> Response:
+        """Send a request until it succeeds or its retry policy gives up, sleeping on the event loop
+
+        Args:
+            path (Text): path of the request
+            trace (RequestTrace): events of the request
+            send (Callable[[], Awaitable[Response]]): sends one attempt of the request
+
+        Raises:
+            NASACircuitOpen: Raised when the upstream is failing and requests are paused
+
+        Returns:
+            Response: last response, which may still be an error
+        """
+        attempt: int = 0
+        while True:
+            attempt += 1
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.before_call(path)
+            try:
+                response: Response = await send()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                delay: Optional[float] = self._retry_delay(
+                    path, attempt, trace, error=error
+                )
+                if delay is None:
+                    raise
+            except BaseException:
+                # Not an upstream failure, e.g. cancelled, but a trial request must not leave the circuit half-open
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.release(path)
+                raise
+            else:
+                delay: Optional[float] = self._retry_delay(
+                    path, attempt, trace, response.status_code, response.headers
+                )
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    async def _gather(
+        function: Callable[[Any], Awaitable], items: Iterable[Any], max_workers: int
+    ) -> List[Any]:
+        """Await function on every item with at most max_workers running at the same time
+
+        Args:
+            function (Callable[[Any], Awaitable]): coroutine function called with every item
+            items (Iterable[Any]): items to be processed
+            max_workers (int): maximum number of coroutines running at the same time
+
+        Returns:
+            List[Any]: results in the order of the items
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(item: Any) -> Any:
+            async with semaphore:
+                return await function(item)
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+    async def _download_to(
+        self,
+        url: Text,
+        path: Text,
+        authenticate: bool = False,
+        resume: bool = True,
+        overwrite: bool = False,
+    ) -> Text:
+        """Stream the content of an URL to a file without holding it in memory, see `nasa.utils.download_to`
+
+        Args:
+            url (Text): URL of the content
+            path (Text): destination file
+            authenticate (bool, optional): Add an API key to the request, for api.nasa.gov URLs. Defaults to False.
+            resume (bool, optional): Resume from the partial file if there is one. Defaults to True.
+            overwrite (bool, optional): Download again when path already exists. Defaults to False.
+
+        Raises:
+            NASAHTTPError: The server answered with an error status.
+            NASAIncompleteDownload: The connection ended before the whole content was received.
+
+        Returns:
+            Text: path of the downloaded file
+        """
+        if os.path.exists(path) and not overwrite:
+            return path
+        part_path: Text = path + PARTIAL_SUFFIX
+        offset: int = 0
+        if resume and os.path.exists(part_path):
+            offset = os.path.getsize(part_path)
+        params: Dict[Text, Text] = dict()
+        if authenticate:
+            params["api_key"] = await self._auth.rate_limiter.acquire_async()
+        async with self._get_session().get(
+            url, params=params, headers=download_headers(offset)
+        ) as client_response:
+            expected_size: Optional[int] = expected_download_size(
+                client_response.status, client_response.headers, offset
+            )
+            if client_response.status == 416 and offset > 0:
+                if expected_size == offset:
+                    return finish_download(part_path, path, expected_size)
+                os.remove(part_path)
+                return await self._download_to(
+                    url, path, authenticate, False, overwrite
+                )
+            # Reported with the URL requested, the response URL carries the API key
+            if client_response.status >= 400:
+                message: Text = f"{client_response.status} Error: {client_response.reason} for url: {url}"
+                raise NASAHTTPError(message)
+            if client_response.status != 206:
+                offset = 0
+            chunk_size: int = adaptive_chunk_size((expected_size or 0) - offset)
+            task: Optional[Progress] = self._progress.open(
+                f"Download {url}", expected_size, initial=offset
+            )
+            # Chunks are written synchronously, local disk writes are short compared to the network
+            with open(part_path, "ab" if offset > 0 else "wb") as file:
+                try:
+                    async for chunk in client_response.content.iter_chunked(chunk_size):
+                        file.write(chunk)
+                        if task is not None:
+                            task.update(len(chunk))
+                finally:
+                    if task is not None:
+                        task.close()
+        return finish_download(part_path, path, expected_size)
+
+    async def _download_all(
+        self,
+        downloads: Iterable[Tuple[Text, Text]],
+        authenticate: bool = False,
+        max_workers: int = 4,
+    ) -> List[Text]:
+        """Stream the content of several URLs to files concurrently
+
+        Args:
+            downloads (Iterable[Tuple[Text, Text]]): URL and destination file of every download
+            authenticate (bool, optional): Add an API key to the requests, for api.nasa.gov URLs. Defaults to False.
+            max_workers (int, optional): Number of files downloaded at the same time. Defaults to 4.
+
+        Returns:
+            List[Text]: path of the downloaded files, in the order of the downloads
+        """
+        return await self._gather(
+            lambda download: self._download_to(*download, authenticate=authenticate),
+            downloads,
+            max_workers,
+        )
+
+    async def _get_url_image(
+        self, url: Text, ignore_non_image: bool = False
+    ) -> Optional["ImageFile"]:
+        """Parse Response Content Image to PIL Image
+
+        Args:
+            url (Text): URL containing image
+            ignore_non_image (bool, optional): If True, Gave warning but return None, else raise an error. Defaults to False.
+
+        Raises:
+            NASAContentTypeNotImage: The response content type is not image.
+
+        Returns:
+            ImageFile: PIL ImageFile Object
+        """
+        trace: RequestTrace = RequestTrace(self._observers, urlparse(url).path, url)
+        status_code: Optional[int] = None
+        headers: Optional[Mapping] = None
+        try:
+            async with self._get_session().get(url) as client_response:
+                status_code, headers = client_response.status, client_response.headers
+                content_type: Text = headers.get("Content-Type", "")
+                if content_type.split("/")[0] == "image":
+                    content: bytes = await client_response.read()
+                    trace.bytes(len(content), status_code)
+                    image: "ImageFile" = open_image(content)
+                    trace.end(status_code, headers)
+                    return image
+        except Exception as error:
+            trace.error(error, status_code, headers)
+            raise
+        trace.end(status_code, headers)
+        message: Text = "Response Content-Type is not Image."
+        if ignore_non_image:
+            warn(message, InvalidInputWarning)
+            return None
+        raise NASAContentTypeNotImage(message)
+
+    async def _get_urls_images(
+        self, urls: Iterable[Text], ignore_non_image: bool = False
+    ) -> List[Optional["ImageFile"]]:
+        """Parse response contents from list of urls to list of image concurrently
+
+        Args:
+            urls (Iterable[Text]): List of URLs containing images
+            ignore_non_image (bool, optional): If True, Gave warning but return None, else raise an error. Defaults to False.
+
+        Returns:
+            List[Optional[ImageFile]]: List of PIL ImageFile Object
+        """
+        return list(
+            await asyncio.gather(
+                *(self._get_url_image(url, ignore_non_image) for url in urls)
+            )
+        )
@@ -0,0 +1,400 @@
+import asyncio
+import os
+from collections import deque
+from datetime import date
+from typing import (
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Text,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+import nasa
+from nasa.clients.apod import ApodClient
+from nasa.clients.async_base import AsyncBaseClient
+from nasa.clients.donki import DonkiClient
+from nasa.clients.earth import EarthClient
+from nasa.clients.epic import EpicClient
+from nasa.clients.insight import InsightClient
+from nasa.clients.mars_rover_photos import MarsRoverPhotosClient
+from nasa.clients.neo import NeoClient
+from nasa.clients.tech_transfer import TechTransferClient
+from nasa.clients.techport import TechPortClient
+from nasa.decorators import catch_unidentidied_error, decorate_all_methods
+from nasa.exceptions import NASAInvalidInput
+from nasa.typing import IsoDate, IsoDateConvertible, JSONType
+
+if TYPE_CHECKING:
+    from PIL.ImageFile import ImageFile
+
+
+@decorate_all_methods(catch_unidentidied_error)
+class AsyncClient(
+    AsyncBaseClient,
+    ApodClient,
+    DonkiClient,
+    EarthClient,
+    EpicClient,
+    InsightClient,
+    MarsRoverPhotosClient,
+    NeoClient,
+    TechTransferClient,
+    TechPortClient,
+):
+    """Client with the same surface as `nasa.Client` whose endpoint methods return awaitables"""
+
+    VERSION: Text = nasa.__version__
+
+    async def apod(
+        self,
+        date: Optional[IsoDateConvertible] = None,
+        start_date: Optional[IsoDateConvertible] = None,
+        end_date: Optional[IsoDateConvertible] = None,
+        count: Optional[int] = None,
+        thumbs: bool = False,
+        get_image: bool = False,
+        get_hd_image: bool = False,
+    ) -> JSONType:
+        """Astronomy Picture of the Day https://github.com/nasa/apod-api
+
+        See `nasa.clients.apod.ApodClient.apod`, the images are downloaded concurrently.
+        """
+        response: JSONType = await super().apod(
+            date=date,
+            start_date=start_date,
+            end_date=end_date,
+            count=count,
+            thumbs=thumbs,
+        )
+        if not (get_image or get_hd_image):
+            return response
+        image_response: Dict[Text, Union[JSONType, Optional["ImageFile"]]] = {
+            "JSON": response
+        }
+        keys: List[Text] = list()
+        urls: List[Text] = list()
+        if get_image:
+            keys.append("image")
+            urls.append(response.get("url"))
+        if get_hd_image:
+            keys.append("hd_image")
+            urls.append(response.get("hdurl"))
+        image_response.update(zip(keys, await self._get_urls_images(urls)))
+        return image_response
+
+    async def apod_download(
+        self,
+        directory: Text,
+        date: Optional[IsoDateConvertible] = None,
+        start_date: Optional[IsoDateConvertible] = None,
+        end_date: Optional[IsoDateConvertible] = None,
+        count: Optional[int] = None,
+        hd: bool = False,
+        max_workers: int = 4,
+    ) -> List[Text]:
+        """Download the Astronomy Pictures of the Day to a directory, streaming them to disk
+
+        See `nasa.clients.apod.ApodClient.apod_download`.
+        """
+        response: JSONType = await self.apod(
+            date=date, start_date=start_date, end_date=end_date, count=count
+        )
+        os.makedirs(directory, exist_ok=True)
+        return await self._download_all(
+            self._apod_downloads(response, directory, hd), max_workers=max_workers
+        )
+
+    async def epic(
+        self,
+        image_type: Text,
+        date: Optional[IsoDateConvertible] = None,
+        available: bool = False,
+        get_images: bool = False,
+    ) -> Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]:
+        """The EPIC API provides information on the daily imagery collected by Earth Polychromatic Imaging Camera (EPIC) instrument.
+
+        See `nasa.clients.epic.EpicClient.epic`, the images are downloaded concurrently.
+        """
+        response: JSONType = await super().epic(
+            image_type=image_type, date=date, available=available
+        )
+        if not get_images:
+            return response
+        images: List["ImageFile"] = list(
+            await asyncio.gather(
+                *(
+                    self._get(self._epic_archive_path(image_type, record))
+                    for record in response
+                )
+            )
+        )
+        return {"JSON": response, "Images": images}
+
+    async def epic_download(
+        self,
+        directory: Text,
+        image_type: Text,
+        date: IsoDateConvertible,
+        max_workers: int = 4,
+    ) -> List[Text]:
+        """Download the EPIC images of a date to a directory, streaming them to disk
+
+        See `nasa.clients.epic.EpicClient.epic_download`.
+        """
+        if IsoDate.cached_value(date) is None:
+            message: Text = "Missing or invalid date"
+            raise NASAInvalidInput(message)
+        response: JSONType = await self.epic(image_type=image_type, date=date)
+        os.makedirs(directory, exist_ok=True)
+        return await self._download_all(
+            self._epic_downloads(image_type, response, directory),
+            authenticate=True,
+            max_workers=max_workers,
+        )
+
+    async def epic_download_range(
+        self,
+        directory: Text,
+        image_type: Text,
+        start_date: IsoDateConvertible,
+        end_date: Optional[IsoDateConvertible] = None,
+        variant: Text = "png",
+        max_workers: int = 8,
+        batch_days: int = 30,
+    ) -> List[Text]:
+        """Download the EPIC images of a date range to a directory, streaming them to disk
+
+        See `nasa.clients.epic.EpicClient.epic_download_range`.
+        """
+        self._epic_check_variant(variant)
+        available: JSONType = await self.epic(image_type=image_type, available=True)
+        days: List[Text] = self._epic_range_dates(available, start_date, end_date)
+        latest: Optional[Text] = max(available, default=None)
+        paths: List[Text] = list()
+        pending: List[Text] = list()
+        for day in days:
+            manifest: Optional[List[Text]] = self._epic_read_manifest(
+                directory, variant, day
+            )
+            if manifest is None:
+                pending.append(day)
+            else:
+                paths.extend(manifest)
+        for start in range(0, len(pending), batch_days):
+            batch: List[Text] = pending[start : start + batch_days]
+            responses: List[JSONType] = await self._gather(
+                lambda day: self.epic(image_type=image_type, date=day),
+                batch,
+                max_workers,
+            )
+            downloads: Dict[Text, List[Tuple[Text, Text]]] = {
+                day: self._epic_range_downloads(
+                    image_type, variant, response, directory, day
+                )
+                for day, response in zip(batch, responses)
+            }
+            paths.extend(
+                await self._download_all(
+                    [item for items in downloads.values() for item in items],
+                    authenticate=True,
+                    max_workers=max_workers,
+                )
+            )
+            self._epic_write_manifests(directory, variant, downloads, latest)
+        return paths
+
+    async def neo_feed_range(
+        self,
+        start_date: IsoDateConvertible,
+        end_date: Optional[IsoDateConvertible] = None,
+        window_days: int = NeoClient.NEO_FEED_MAX_DAYS,
+        max_workers: int = 4,
+    ) -> JSONType:
+        """Near Earth Object Web Service Feed Endpoint over an arbitrary date range
+
+        See `nasa.clients.neo.NeoClient.neo_feed_range`.
+        """
+        windows: List[Tuple[date, date]] = self._date_windows(
+            start_date, end_date, window_days
+        )
+        responses: List[JSONType] = await self._gather(
+            lambda window: self.neo_feed(*window), windows, max_workers
+        )
+        return self._merge_neo_feeds(responses, windows)
+
+    async def donki_range(
+        self,
+        api_type: Text,
+        start_date: IsoDateConvertible,
+        end_date: Optional[IsoDateConvertible] = None,
+        most_accurate_only: Optional[bool] = None,
+        speed: Optional[int] = None,
+        half_angle: Optional[int] = None,
+        catalog: Optional[Text] = None,
+        notification_type: Optional[Text] = None,
+        window_days: int = 30,
+        max_workers: int = 4,
+    ) -> JSONType:
+        """The Space Weather Database Of Notifications, Knowledge, Information over an arbitrary date range
+
+        See `nasa.clients.donki.DonkiClient.donki_range`.
+        """
+        windows: List[Tuple[date, date]] = self._date_windows(
+            start_date, end_date, window_days
+        )
+        responses: List[JSONType] = await self._gather(
+            lambda window: self.donki(
+                api_type=api_type,
+                start_date=window[0],
+                end_date=window[1],
+                most_accurate_only=most_accurate_only,
+                speed=speed,
+                half_angle=half_angle,
+                catalog=catalog,
+                notification_type=notification_type,
+            ),
+            windows,
+            max_workers,
+        )
+        return self._merge_donki_events(api_type, responses)
+
+    async def mars_rover_photos(
+        self,
+        rover: Text,
+        sol: Optional[int] = None,
+        camera: Text = "all",
+        page: int = 1,
+        earth_date: Optional[IsoDateConvertible] = None,
+        get_images: bool = False,
+    ) -> Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]:
+        """Mars Rover Photos API
+
+        See `nasa.clients.mars_rover_photos.MarsRoverPhotosClient.mars_rover_photos`, the images are downloaded concurrently.
+        """
+        response: JSONType = await super().mars_rover_photos(
+            rover=rover, sol=sol, camera=camera, page=page, earth_date=earth_date
+        )
+        if not get_images:
+            return response
+        images: List["ImageFile"] = await self._get_urls_images(
+            [record.get("img_src") for record in response.get("photos")]
+        )
+        return {"JSON": response, "Images": images}
+
+    async def mars_rover_photos_pages(
+        self,
+        rover: Text,
+        sol: Optional[int] = None,
+        camera: Text = "all",
+        earth_date: Optional[IsoDateConvertible] = None,
+        get_images: bool = False,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]]:
+        """Iterate over the pages of Mars Rover Photos API as they arrive
+
+        See `nasa.clients.mars_rover_photos.MarsRoverPhotosClient.mars_rover_photos_pages`, the pages ahead are fetched as tasks.
+        """
+
+        def fetch(page: int) -> asyncio.Task:
+            return asyncio.ensure_future(
+                self.mars_rover_photos(
+                    rover=rover,
+                    sol=sol,
+                    camera=camera,
+                    page=page,
+                    earth_date=earth_date,
+                    get_images=get_images,
+                )
+            )
+
+        pending: Deque[asyncio.Task] = deque(
+            fetch(page) for page in range(1, prefetch + 2)
+        )
+        next_page: int = prefetch + 2
+        try:
+            while pending:
+                response: Union[
+                    JSONType, Dict[Text, Union[JSONType, "ImageFile"]]
+                ] = await pending.popleft()
+                photos: JSONType = (
+                    response["JSON"]["photos"] if get_images else response["photos"]
+                )
+                if not photos:
+                    break
+                full: bool = len(photos) == self.MARS_ROVER_PHOTOS_PAGE_SIZE
+                if not full:
+                    for task in pending:
+                        task.cancel()
+                    pending.clear()
+                yield response
+                # The next page is only requested once the caller is done with this one
+                if full:
+                    pending.append(fetch(next_page))
+                    next_page += 1
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def mars_rover_photos_all_pages(
+        self,
+        rover: Text,
+        sol: Optional[int] = None,
+        camera: Text = "all",
+        earth_date: Optional[IsoDateConvertible] = None,
+        get_images: bool = False,
+        prefetch: int = 2,
+    ) -> Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]:
+        """Get all pages from Mars Rover Photos API
+
+        See `nasa.clients.mars_rover_photos.MarsRoverPhotosClient.mars_rover_photos_all_pages`.
+        """
+        photos_list: List[JSONType] = list()
+        images_list: List["ImageFile"] = list()
+        async for response in self.mars_rover_photos_pages(
+            rover=rover,
+            sol=sol,
+            camera=camera,
+            earth_date=earth_date,
+            get_images=get_images,
+            prefetch=prefetch,
+        ):
+            if get_images:
+                photos_list.extend(response["JSON"]["photos"])
+                images_list.extend(response["Images"])
+            else:
+                photos_list.extend(response["photos"])
+        if get_images:
+            return {"JSON": {"photos": photos_list}, "Images": images_list}
+        else:
+            return {"photos": photos_list}
+
+    async def mars_rover_photos_download(
+        self,
+        directory: Text,
+        rover: Text,
+        sol: Optional[int] = None,
+        camera: Text = "all",
+        earth_date: Optional[IsoDateConvertible] = None,
+        max_workers: int = 4,
+    ) -> List[Text]:
+        """Download the photos of every page of Mars Rover Photos API to a directory, streaming them to disk
+
+        See `nasa.clients.mars_rover_photos.MarsRoverPhotosClient.mars_rover_photos_download`.
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths: List[Text] = list()
+        async for response in self.mars_rover_photos_pages(
+            rover=rover, sol=sol, camera=camera, earth_date=earth_date
+        ):
+            paths.extend(
+                await self._download_all(
+                    self._mars_rover_photos_downloads(response, directory),
+                    max_workers=max_workers,
+                )
+            )
+        return paths
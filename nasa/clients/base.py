@@ -1,23 +1,162 @@
-from typing import Dict, Text, Union
-from PIL.ImageFile import ImageFile
+import time
+from datetime import date
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Text,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 import requests
 from requests.models import HTTPError, Response
 from nasa.auth import NASAAuth
-from nasa.exceptions import NASAHTTPError
+from nasa.cache import DEFAULT_CACHE_TTL, BaseCache, CacheEntry, cache_key, cache_ttl
+from nasa.decoders import Decoder, get_decoder
+from nasa.exceptions import NASAHTTPError, NASAInvalidInput
+from nasa.metrics import Observer, RequestTrace
+from nasa.progress import ProgressConvertible, ProgressSink, get_progress
+from nasa.retry import (
+    DEFAULT_RETRY_POLICIES,
+    CircuitBreaker,
+    RetryPolicy,
+    retry_policy,
+)
+from nasa.session import create_session
+from nasa.singleflight import SingleFlight
 
-from nasa.typing import JSONType
-from nasa.utils import get_url_image
+from nasa.typing import IsoDate, IsoDateConvertible, JSONType
+from nasa.utils import date_windows, open_image
+
+if TYPE_CHECKING:
+    from PIL.ImageFile import ImageFile
 
 
 class BaseClient:
     BASE_URL: Text = "https://api.nasa.gov"
 
-    def __init__(self, api_key: Text = "DEMO_KEY") -> None:
-        self.__api_key: Text = api_key
+    def __init__(
+        self,
+        api_key: Union[Text, Sequence[Text]] = "DEMO_KEY",
+        session: Optional[requests.Session] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        base_url: Optional[Text] = None,
+        cache: Optional[BaseCache] = None,
+        cache_ttl: Optional[Dict[Text, float]] = None,
+        rate_limit: Optional[int] = None,
+        observers: Sequence[Observer] = (),
+        retry: Optional[Union[RetryPolicy, Dict[Text, RetryPolicy]]] = None,
+        circuit_breaker: Union[bool, CircuitBreaker] = True,
+        coalesce: bool = True,
+        json_decoder: Union[Text, Decoder] = "auto",
+        progress: ProgressConvertible = "tqdm",
+    ) -> None:
+        """Base client holding the API key and the pooled HTTP session shared by every endpoint mixin
+
+        Args:
+            api_key (Union[Text, Sequence[Text]], optional): NASA API Key, or a pool of keys to rotate across. Defaults to "DEMO_KEY".
+            session (Optional[requests.Session], optional): Session to be reused instead of creating a new one. The pool options are ignored when it is given. Defaults to None.
+            pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of connections kept open per host. Defaults to 10.
+            pool_block (bool, optional): If True, pool_maxsize is a hard per-host limit and requests wait for a free connection. Defaults to False.
+            keep_alive (bool, optional): If False, connections are closed after every response. Defaults to True.
+            base_url (Optional[Text], optional): Override the API base url, e.g. for a local stub server. Defaults to None.
+            cache (Optional[BaseCache], optional): Response cache, e.g. `nasa.cache.MemoryCache` or `nasa.cache.DiskCache`. Defaults to None.
+            cache_ttl (Optional[Dict[Text, float]], optional): Cache TTL in seconds by path prefix, the longest matching prefix wins. Defaults to `nasa.cache.DEFAULT_CACHE_TTL`.
+            rate_limit (Optional[int], optional): Hourly requests allowed per key, None to learn it from the X-RateLimit-Limit header. Requests are paced so no key runs out of quota. Defaults to None.
+            observers (Sequence[Observer], optional): Callables receiving a `nasa.metrics.RequestEvent` when every request starts, ends, fails or receives its body, e.g. `nasa.metrics.MetricsCollector`. Defaults to ().
+            retry (Optional[Union[RetryPolicy, Dict[Text, RetryPolicy]]], optional): Retry policy of 429, 5xx and connection errors, or policies by path prefix where the longest matching prefix wins. `nasa.retry.NO_RETRY` disables retries. Defaults to `nasa.retry.DEFAULT_RETRY_POLICIES`.
+            circuit_breaker (Union[bool, CircuitBreaker], optional): Circuit breaker failing fast while an upstream is down, True for the default one and False to disable it. Defaults to True.
+            coalesce (bool, optional): If True, concurrent calls with the same path and params share one upstream request. Defaults to True.
+            json_decoder (Union[Text, Decoder], optional): Decoder of the JSON responses, "auto" for orjson when it is installed, "orjson", "json", "raw" to return the undecoded bytes, or a callable decoding bytes. Defaults to "auto".
+            progress (ProgressConvertible, optional): Sink of the progress of image fetches and downloads, "tqdm", "none", a `nasa.progress.ProgressSink` such as `MetricsProgress`, or a callback. Defaults to "tqdm".
+        """
+        self._configure(
+            api_key,
+            base_url,
+            cache,
+            cache_ttl,
+            rate_limit,
+            observers,
+            retry,
+            circuit_breaker,
+            json_decoder,
+            progress,
+        )
+        self._owns_session: bool = session is None
+        if session is None:
+            session = create_session(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+            )
+        self._session: requests.Session = session
+        self._single_flight: Optional[SingleFlight] = (
+            SingleFlight() if coalesce else None
+        )
+
+    def _configure(
+        self,
+        api_key: Union[Text, Sequence[Text]],
+        base_url: Optional[Text],
+        cache: Optional[BaseCache],
+        ttl: Optional[Dict[Text, float]],
+        rate_limit: Optional[int],
+        observers: Sequence[Observer],
+        retry: Optional[Union[RetryPolicy, Dict[Text, RetryPolicy]]],
+        circuit_breaker: Union[bool, CircuitBreaker],
+        json_decoder: Union[Text, Decoder],
+        progress: ProgressConvertible,
+    ) -> None:
+        # Options shared with the transports of the subclasses
+        self._auth: NASAAuth = NASAAuth(api_key, rate_limit)
+        if base_url is not None:
+            self.BASE_URL = base_url.rstrip("/")
+        self._cache: Optional[BaseCache] = cache
+        self._cache_ttl: Dict[Text, float] = DEFAULT_CACHE_TTL if ttl is None else ttl
+        self._observers: List[Observer] = list(observers)
+        if retry is None:
+            retry = DEFAULT_RETRY_POLICIES
+        elif isinstance(retry, RetryPolicy):
+            retry = {"": retry}
+        self._retry: Dict[Text, RetryPolicy] = retry
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self._circuit_breaker: Optional[CircuitBreaker] = circuit_breaker or None
+        self._decode: Decoder = get_decoder(json_decoder)
+        self._progress: ProgressSink = get_progress(progress)
+
+    def add_observer(self, observer: Observer) -> None:
+        """Register a callable receiving a `nasa.metrics.RequestEvent` for every request event
+
+        Args:
+            observer (Observer): e.g. a `nasa.metrics.MetricsCollector`
+        """
+        self._observers.append(observer)
+
+    def close(self) -> None:
+        """Close the pooled connections if the session is owned by this client"""
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "BaseClient":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
     def _get(
         self, path: Text, params: Dict[Text, JSONType] = dict()
-    ) -> Union[JSONType, ImageFile]:
+    ) -> Union[JSONType, "ImageFile"]:
         """Making a GET request to the base url with given path and params.
 
         Args:
@@ -28,10 +167,230 @@ class BaseClient:
             Union[JSONType, ImageFile]: Depends on the result of the response handler
         """
         url: Text = f"{self.BASE_URL}{path}"
-        response: Response = requests.get(url, params, auth=NASAAuth(self.__api_key))
-        return self._response_handler(response)
+        trace: RequestTrace = RequestTrace(self._observers, path, url)
+        response: Optional[Response] = None
+        try:
+            response, cache, shared = self._send_coalesced(path, url, params, trace)
+            if cache in (None, "miss") and not shared:
+                trace.bytes(len(response.content or b""), response.status_code)
+            content: Union[JSONType, "ImageFile"] = self._response_handler(response)
+        except Exception as error:
+            if response is None:
+                trace.error(error)
+            else:
+                trace.error(error, response.status_code, response.headers)
+            raise
+        trace.end(response.status_code, response.headers, cache, shared)
+        return content
+
+    def _send_coalesced(
+        self,
+        path: Text,
+        url: Text,
+        params: Dict[Text, JSONType],
+        trace: RequestTrace,
+    ) -> Tuple[Response, Optional[Text], bool]:
+        """Send the request, sharing it with the concurrent calls having the same path and params
+
+        Returns:
+            Tuple[Response, Optional[Text], bool]: response, cache result, and whether the response was shared with another call
+        """
+        if self._single_flight is None:
+            return (*self._send(path, url, params, trace), False)
+        (response, cache), shared = self._single_flight.do(
+            cache_key(path, params), lambda: self._send(path, url, params, trace)
+        )
+        return response, cache, shared
+
+    def _send(
+        self,
+        path: Text,
+        url: Text,
+        params: Dict[Text, JSONType],
+        trace: RequestTrace,
+    ) -> Tuple[Response, Optional[Text]]:
+        """Send the request, or answer it from the cache
+
+        Args:
+            path (Text): path of the request
+            url (Text): full url of the request
+            params (Dict[Text, JSONType]): query params of the request
+            trace (RequestTrace): events of the request
+
+        Returns:
+            Tuple[Response, Optional[Text]]: response and the cache result, "hit", "revalidated", "miss" or None without cache
+        """
+        if self._cache is None:
+            response: Response = self._send_with_retry(
+                path,
+                trace,
+                lambda: self._session.get(url, params=params, auth=self._auth),
+            )
+            return response, None
+        key, entry = self._cache_lookup(path, params)
+        if entry is not None and entry.is_fresh():
+            return entry.to_response(), "hit"
+        headers: Dict[Text, Text] = dict() if entry is None else entry.validators()
+        response: Response = self._send_with_retry(
+            path,
+            trace,
+            lambda: self._session.get(
+                url, params=params, auth=self._auth, headers=headers
+            ),
+        )
+        cache: Text = self._cache_result(entry, response)
+        return self._cache_store(key, path, entry, response), cache
+
+    def _send_with_retry(
+        self, path: Text, trace: RequestTrace, send: Callable[[], Response]
+    ) -> Response:
+        """Send a request until it succeeds or its retry policy gives up
+
+        Args:
+            path (Text): path of the request
+            trace (RequestTrace): events of the request
+            send (Callable[[], Response]): sends one attempt of the request
+
+        Raises:
+            NASACircuitOpen: Raised when the upstream is failing and requests are paused
+
+        Returns:
+            Response: last response, which may still be an error
+        """
+        attempt: int = 0
+        while True:
+            attempt += 1
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.before_call(path)
+            try:
+                response: Response = send()
+            except (requests.ConnectionError, requests.Timeout) as error:
+                delay: Optional[float] = self._retry_delay(
+                    path, attempt, trace, error=error
+                )
+                if delay is None:
+                    raise
+            except BaseException:
+                # Not an upstream failure, e.g. cancelled, but a trial request must not leave the circuit half-open
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.release(path)
+                raise
+            else:
+                delay: Optional[float] = self._retry_delay(
+                    path, attempt, trace, response.status_code, response.headers
+                )
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+
+    def _retry_delay(
+        self,
+        path: Text,
+        attempt: int,
+        trace: RequestTrace,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping] = None,
+        error: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """Record the outcome of an attempt in the circuit breaker and decide whether it is retried
+
+        Args:
+            path (Text): path of the request
+            attempt (int): number of the attempt, starting at 1
+            trace (RequestTrace): events of the request
+            status_code (Optional[int], optional): status code of the response. Defaults to None.
+            headers (Optional[Mapping], optional): headers of the response. Defaults to None.
+            error (Optional[BaseException], optional): connection error raised instead of a response. Defaults to None.
+
+        Returns:
+            Optional[float]: seconds to wait before the next attempt, None if the attempt is final
+        """
+        failed: bool = error is not None or CircuitBreaker.is_failure(status_code)
+        if self._circuit_breaker is not None:
+            if failed:
+                self._circuit_breaker.record_failure(path)
+            else:
+                self._circuit_breaker.record_success(path)
+        policy: RetryPolicy = retry_policy(path, self._retry)
+        if error is None and status_code not in policy.statuses:
+            return None
+        delay: Optional[float] = policy.delay(attempt, headers)
+        if delay is not None:
+            trace.retry(attempt, delay, status_code, error)
+        return delay
+
+    @staticmethod
+    def _cache_result(entry: Optional[CacheEntry], response: Response) -> Text:
+        if entry is not None and response.status_code == 304:
+            return "revalidated"
+        return "miss"
+
+    @staticmethod
+    def _date_windows(
+        start_date: Optional[IsoDateConvertible],
+        end_date: Optional[IsoDateConvertible],
+        days: int,
+    ) -> List[Tuple[date, date]]:
+        """Split a date range into windows accepted by an endpoint
+
+        Args:
+            start_date (Optional[IsoDateConvertible]): First date of the range
+            end_date (Optional[IsoDateConvertible]): Last date of the range, today if None
+            days (int): Maximum number of days per window
+
+        Raises:
+            NASAInvalidInput: Raised when start_date is missing or invalid
+
+        Returns:
+            List[Tuple[date, date]]: start and end date of every window
+        """
+        start: Optional[date] = IsoDate(start_date).dt
+        if start is None:
+            message: Text = "Missing or invalid start_date"
+            raise NASAInvalidInput(message)
+        end: Optional[date] = IsoDate(end_date).dt
+        return date_windows(start, date.today() if end is None else end, days)
+
+    def _cache_lookup(
+        self, path: Text, params: Dict[Text, JSONType]
+    ) -> Tuple[Text, Optional[CacheEntry]]:
+        """Find the cached response of a request
+
+        Args:
+            path (Text): path of the request
+            params (Dict[Text, JSONType]): query params of the request
+
+        Returns:
+            Tuple[Text, Optional[CacheEntry]]: cache key and the cached entry, which may be stale
+        """
+        key: Text = cache_key(path, params)
+        return key, self._cache.get(key)
+
+    def _cache_store(
+        self, key: Text, path: Text, entry: Optional[CacheEntry], response: Response
+    ) -> Response:
+        """Store a successful response, or refresh the stale entry when the server answered 304 Not Modified
+
+        Args:
+            key (Text): cache key of the request
+            path (Text): path of the request, used to find its TTL
+            entry (Optional[CacheEntry]): stale entry which was revalidated, if any
+            response (Response): response from the API
+
+        Returns:
+            Response: response to be handled
+        """
+        ttl: float = cache_ttl(path, self._cache_ttl)
+        if response.status_code == 304 and entry is not None:
+            entry.expires = time.time() + ttl
+            self._cache.set(key, entry)
+            return entry.to_response()
+        if response.ok and ttl > 0:
+            self._cache.set(key, CacheEntry(response, time.time() + ttl))
+        return response
 
-    def _response_handler(self, response: Response) -> Union[JSONType, ImageFile]:
+    def _response_handler(self, response: Response) -> Union[JSONType, "ImageFile"]:
         """Handling Response from the API according to the requirements
 
         Args:
@@ -41,18 +400,18 @@ class BaseClient:
             NASAHTTPError: Customized and Extended HTTPError from requests library
 
         Returns:
-            Union[JSONType, ImageFile]: Depends on the content-type of the API response
+            Union[JSONType, ImageFile]: Depends on the content-type of the API response, JSON is decoded by the json_decoder of the client
         """
-        content: Union[JSONType, ImageFile, bytes, Text]
+        content: Union[JSONType, "ImageFile", bytes, Text]
         try:
             response.raise_for_status()
         except HTTPError as error:
             raise NASAHTTPError(error.strerror)
         content_type: Text = response.headers.get("Content-Type")
         if content_type == "application/json":
-            content = response.json()
+            content = self._decode(response.content)
         elif content_type.split("/")[0] == "image":
-            content = get_url_image(response.url)
+            content = open_image(response.content)
         else:
             if response.encoding is None:
                 content = response.content
@@ -1,4 +1,7 @@
-from typing import Dict, Optional, Set, Text, Union
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Text, Tuple, Union
 from warnings import warn
 from nasa.clients.base import BaseClient
 from nasa.exceptions import NASAInvalidInput
@@ -7,6 +10,19 @@ from nasa.warnings import AttributesCollussionWarning
 
 
 class DonkiClient(BaseClient):
+    DONKI_ID_FIELDS: Dict[Text, Text] = {
+        "CME": "activityID",
+        "GST": "gstID",
+        "IPS": "activityID",
+        "FLR": "flrID",
+        "SEP": "sepID",
+        "MPC": "mpcID",
+        "RBE": "rbeID",
+        "HSS": "hssID",
+        "WSAEnlilSimulations": "simulationID",
+        "notifications": "messageID",
+    }
+
     def donki(
         self,
         api_type: Text,
@@ -86,8 +102,8 @@ class DonkiClient(BaseClient):
         ):
             message: Text = f"Invalid notification_type value {notification_type}. Valid notification_type values are {tuple(notification_types)}"
             raise NASAInvalidInput(message)
-        iso_start_date: Text = IsoDate(start_date).value()
-        iso_end_date: Text = IsoDate(end_date).value()
+        iso_start_date: Text = IsoDate.cached_value(start_date)
+        iso_end_date: Text = IsoDate.cached_value(end_date)
         path: Text = f"/DONKI/{api_type}"
         params: Dict[Text, Union[Text, bool, int, None]] = {
             "startDate": iso_start_date,
@@ -100,6 +116,100 @@ class DonkiClient(BaseClient):
         }
         return self._get(path, params)
 
+    def donki_range(
+        self,
+        api_type: Text,
+        start_date: IsoDateConvertible,
+        end_date: Optional[IsoDateConvertible] = None,
+        most_accurate_only: Optional[bool] = None,
+        speed: Optional[int] = None,
+        half_angle: Optional[int] = None,
+        catalog: Optional[Text] = None,
+        notification_type: Optional[Text] = None,
+        window_days: int = 30,
+        max_workers: int = 4,
+    ) -> JSONType:
+        """The Space Weather Database Of Notifications, Knowledge, Information over an arbitrary date range
+
+        The range is split into windows which are fetched concurrently, the events are merged in window order.
+
+        Args:
+            api_type (Text): API Type to hit
+            start_date (IsoDateConvertible): Start date of data retrieved.
+            end_date (Optional[IsoDateConvertible], optional): End date of data retrieved. Defaults to None, today.
+            most_accurate_only (bool, optional): CMEAnalysis API only. If False, it'll query all, if True will query the most accurate only. Defaults to None.
+            speed (Optional[int], optional): CMEAnalysis API only. Query the speed value. Defaults to None.
+            half_angle (Optional[int], optional): CMEAnalysis API only. Query the half angle. Defaults to None.
+            catalog (Optional[Text], optional): CMEAnalysis API only. Query the catalog. Defaults to None.
+            notification_type (Optional[Text], optional): notifications API only. Defaults to None.
+            window_days (int, optional): Number of days per request. Defaults to 30.
+            max_workers (int, optional): Number of windows fetched at the same time. Defaults to 4.
+
+        Raises:
+            NASAInvalidInput: Raises when the start_date is missing or invalid
+
+        Returns:
+            JSONType: Events of every window, without the events repeated on the window boundaries
+        """
+        windows: List[Tuple[date, date]] = self._date_windows(
+            start_date, end_date, window_days
+        )
+
+        def fetch(window: Tuple[date, date]) -> JSONType:
+            return self.donki(
+                api_type=api_type,
+                start_date=window[0],
+                end_date=window[1],
+                most_accurate_only=most_accurate_only,
+                speed=speed,
+                half_angle=half_angle,
+                catalog=catalog,
+                notification_type=notification_type,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses: List[JSONType] = list(executor.map(fetch, windows))
+        return self._merge_donki_events(api_type, responses)
+
+    @classmethod
+    def _donki_event_id(cls, api_type: Text, event: JSONType) -> Text:
+        """Identify a DONKI event by its ID field, or by its whole content for API types without one
+
+        Args:
+            api_type (Text): API Type of the event
+            event (JSONType): DONKI event
+
+        Returns:
+            Text: event identifier
+        """
+        id_field: Optional[Text] = cls.DONKI_ID_FIELDS.get(api_type)
+        if id_field is not None and event.get(id_field) is not None:
+            return event[id_field]
+        return json.dumps(event, sort_keys=True)
+
+    @classmethod
+    def _merge_donki_events(
+        cls, api_type: Text, responses: Iterable[JSONType]
+    ) -> JSONType:
+        """Concatenate the events of several windows, dropping the events repeated on the window boundaries
+
+        Args:
+            api_type (Text): API Type of the events
+            responses (Iterable[JSONType]): events of every window
+
+        Returns:
+            JSONType: merged events
+        """
+        events: List[JSONType] = list()
+        seen: Set[Text] = set()
+        for response in responses:
+            for event in response or list():
+                event_id: Text = cls._donki_event_id(api_type, event)
+                if event_id not in seen:
+                    seen.add(event_id)
+                    events.append(event)
+        return events
+
     def donki_cme(
         self,
         start_date: Optional[IsoDateConvertible] = None,
@@ -1,12 +1,14 @@
-from typing import Dict, Optional, Set, Text, Union
+from typing import Dict, Optional, Set, Text, TYPE_CHECKING, Union
 from warnings import warn
-from PIL.ImageFile import ImageFile
 
 from nasa.clients.base import BaseClient
 from nasa.exceptions import NASAInvalidInput
 from nasa.typing import IsoDate, IsoDateConvertible, JSONType
 from nasa.warnings import AttributesCollussionWarning
 
+if TYPE_CHECKING:
+    from PIL.ImageFile import ImageFile
+
 
 class EarthClient(BaseClient):
     def earth(
@@ -17,7 +19,7 @@ class EarthClient(BaseClient):
         dim: Optional[float] = None,
         date: Optional[IsoDateConvertible] = None,
         cloud_score: Optional[bool] = None,
-    ) -> Union[JSONType, ImageFile]:
+    ) -> Union[JSONType, "ImageFile"]:
         """NASA Earth API
 
         Args:
@@ -42,7 +44,7 @@ class EarthClient(BaseClient):
             message: Text = "cloud_score shouldn't be filled if the api_type is not imagery. Set it to None"
             warn(message, AttributesCollussionWarning)
             cloud_score = None
-        iso_date: Optional[Text] = IsoDate(date).value()
+        iso_date: Optional[Text] = IsoDate.cached_value(date)
         path: Text = f"/planetary/earth/{api_type}"
         params: Dict[Text, Union[float, Text, bool, None]] = {
             "lat": lat,
@@ -60,7 +62,7 @@ class EarthClient(BaseClient):
         dim: Optional[float] = None,
         date: Optional[IsoDateConvertible] = None,
         cloud_score: Optional[bool] = False,
-    ) -> ImageFile:
+    ) -> "ImageFile":
         """NASA Earth Imagery API
 
         Args:
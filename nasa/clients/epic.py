@@ -1,21 +1,41 @@
-from typing import Dict, List, Optional, Set, Text, Union
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Text,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 from warnings import warn
 
-from PIL.ImageFile import ImageFile
 from nasa.clients.base import BaseClient
 from nasa.exceptions import NASAInvalidInput
 from nasa.typing import IsoDate, IsoDateConvertible, JSONType
+from nasa.utils import download_all
 from nasa.warnings import AttributesCollussionWarning
 
+if TYPE_CHECKING:
+    from PIL.ImageFile import ImageFile
+
 
 class EpicClient(BaseClient):
+    # File extension of every archive variant
+    EPIC_VARIANTS: Dict[Text, Text] = {"png": "png", "jpg": "jpg", "thumbs": "jpg"}
+    EPIC_MANIFEST: Text = "manifest.json"
+
     def epic(
         self,
         image_type: Text,
         date: Optional[IsoDateConvertible] = None,
         available: bool = False,
         get_images: bool = False,
-    ) -> Union[JSONType, Dict[Text, Union[JSONType, ImageFile]]]:
+    ) -> Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]:
         """The EPIC API provides information on the daily imagery collected by Earth Polychromatic Imaging Camera (EPIC) instrument.
 
         Args:
@@ -31,7 +51,7 @@ class EpicClient(BaseClient):
             Union[JSONType, Dict[Text, Union[JSONType, ImageFile]]]: If get_images is True then the output will be Dictionary of PIL Image file. Else the outpul will be JSON
         """
         image_types: Set[Text] = {"natural", "enhanced"}
-        iso_date: Optional[Text] = IsoDate(date).value()
+        iso_date: Optional[Text] = IsoDate.cached_value(date)
         if available and iso_date is not None:
             message: Text = "date shouldn't be filled when the available parameter is True. Set it to None"
             warn(message, AttributesCollussionWarning)
@@ -46,33 +66,279 @@ class EpicClient(BaseClient):
             path: Text = f"{base_path}/date/{iso_date}"
         response: JSONType = self._get(path)
         if get_images:
-            images: List[ImageFile] = [
-                self._get(
-                    "/".join(
-                        [
-                            "",
-                            "EPIC",
-                            "archive",
-                            image_type,
-                            record["date"][:10].replace("-", "/"),
-                            "png",
-                            record["image"],
-                            ".png",
-                        ]
-                    )
-                )
+            images: List["ImageFile"] = [
+                self._get(self._epic_archive_path(image_type, record))
                 for record in response
             ]
             return {"JSON": response, "Images": images}
         else:
             return response
 
+    @staticmethod
+    def _epic_archive_path(
+        image_type: Text, record: Dict[Text, JSONType], variant: Text = "png"
+    ) -> Text:
+        """Build the archive path of the image described by an EPIC record
+
+        Args:
+            image_type (Text): Possible values are natural or enhanced
+            record (Dict[Text, JSONType]): a record returned by the EPIC API
+            variant (Text, optional): "png" for the full resolution image, "jpg" for a compressed one or "thumbs" for a thumbnail. Defaults to "png".
+
+        Returns:
+            Text: path of the image to be concatinated to the base url
+        """
+        date_path: Text = record["date"][:10].replace("-", "/")
+        extension: Text = EpicClient.EPIC_VARIANTS[variant]
+        return f"/EPIC/archive/{image_type}/{date_path}/{variant}/{record['image']}.{extension}"
+
+    def epic_download(
+        self,
+        directory: Text,
+        image_type: Text,
+        date: IsoDateConvertible,
+        max_workers: int = 4,
+    ) -> List[Text]:
+        """Download the EPIC images of a date to a directory, streaming them to disk
+
+        Files already in the directory are skipped and interrupted downloads are resumed.
+
+        Args:
+            directory (Text): Destination directory, created if missing
+            image_type (Text): Possible values are natural or enhanced
+            date (IsoDateConvertible): date of the images
+            max_workers (int, optional): Number of images downloaded at the same time. Defaults to 4.
+
+        Raises:
+            NASAInvalidInput: raised when the image type or the date is not valid
+
+        Returns:
+            List[Text]: Path of the downloaded images
+        """
+        if IsoDate.cached_value(date) is None:
+            message: Text = "Missing or invalid date"
+            raise NASAInvalidInput(message)
+        response: JSONType = self.epic(image_type=image_type, date=date)
+        os.makedirs(directory, exist_ok=True)
+        return download_all(
+            self._epic_downloads(image_type, response, directory),
+            session=self._session,
+            auth=self._auth,
+            max_workers=max_workers,
+            progress=self._progress,
+        )
+
+    def _epic_downloads(
+        self, image_type: Text, response: JSONType, directory: Text
+    ) -> List[Tuple[Text, Text]]:
+        """URL and destination file of the images of an EPIC response
+
+        Args:
+            image_type (Text): Possible values are natural or enhanced
+            response (JSONType): EPIC records of a date
+            directory (Text): Destination directory
+
+        Returns:
+            List[Tuple[Text, Text]]: URL and destination file of every image
+        """
+        return [
+            (
+                f"{self.BASE_URL}{self._epic_archive_path(image_type, record)}",
+                os.path.join(directory, f"{record['image']}.png"),
+            )
+            for record in response
+        ]
+
+    def epic_download_range(
+        self,
+        directory: Text,
+        image_type: Text,
+        start_date: IsoDateConvertible,
+        end_date: Optional[IsoDateConvertible] = None,
+        variant: Text = "png",
+        max_workers: int = 8,
+        batch_days: int = 30,
+    ) -> List[Text]:
+        """Download the EPIC images of a date range to a directory, streaming them to disk
+
+        Only the dates listed as available are requested, batch_days at a time. The
+        images of every date go to `directory/variant/YYYY-MM-DD/`, and a manifest
+        is written once a date is complete, so a rerun neither lists nor downloads
+        it again. The latest available date is never marked complete since more
+        images may still be published for it. Files already in the directory are
+        skipped and interrupted downloads are resumed.
+
+        Args:
+            directory (Text): Destination directory, created if missing
+            image_type (Text): Possible values are natural or enhanced
+            start_date (IsoDateConvertible): First date of the range
+            end_date (Optional[IsoDateConvertible], optional): Last date of the range. Defaults to None, the latest available date.
+            variant (Text, optional): "png" for the full resolution images, "jpg" for compressed ones or "thumbs" for thumbnails. Defaults to "png".
+            max_workers (int, optional): Number of dates listed and images downloaded at the same time. Defaults to 8.
+            batch_days (int, optional): Number of dates whose images are downloaded before their manifests are written. Defaults to 30.
+
+        Raises:
+            NASAInvalidInput: raised when the image type, the variant or the dates are not valid
+
+        Returns:
+            List[Text]: Path of the images of the range, downloaded or already there
+        """
+        self._epic_check_variant(variant)
+        available: JSONType = self.epic(image_type=image_type, available=True)
+        days: List[Text] = self._epic_range_dates(available, start_date, end_date)
+        latest: Optional[Text] = max(available, default=None)
+        paths: List[Text] = list()
+        pending: List[Text] = list()
+        for day in days:
+            manifest: Optional[List[Text]] = self._epic_read_manifest(
+                directory, variant, day
+            )
+            if manifest is None:
+                pending.append(day)
+            else:
+                paths.extend(manifest)
+        for start in range(0, len(pending), batch_days):
+            batch: List[Text] = pending[start : start + batch_days]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses: List[JSONType] = list(
+                    executor.map(
+                        lambda day: self.epic(image_type=image_type, date=day), batch
+                    )
+                )
+            downloads: Dict[Text, List[Tuple[Text, Text]]] = {
+                day: self._epic_range_downloads(
+                    image_type, variant, response, directory, day
+                )
+                for day, response in zip(batch, responses)
+            }
+            paths.extend(
+                download_all(
+                    [item for items in downloads.values() for item in items],
+                    session=self._session,
+                    auth=self._auth,
+                    max_workers=max_workers,
+                    progress=self._progress,
+                )
+            )
+            self._epic_write_manifests(directory, variant, downloads, latest)
+        return paths
+
+    def _epic_check_variant(self, variant: Text) -> None:
+        if variant not in self.EPIC_VARIANTS:
+            message: Text = f"Invalid variant {variant}. Valid variant values are {tuple(self.EPIC_VARIANTS)}"
+            raise NASAInvalidInput(message)
+
+    @staticmethod
+    def _epic_range_dates(
+        available: JSONType,
+        start_date: IsoDateConvertible,
+        end_date: Optional[IsoDateConvertible],
+    ) -> List[Text]:
+        """Available dates of the EPIC archive within a range
+
+        Args:
+            available (JSONType): dates listed by the available endpoint
+            start_date (IsoDateConvertible): First date of the range
+            end_date (Optional[IsoDateConvertible]): Last date of the range, None for no limit
+
+        Raises:
+            NASAInvalidInput: raised when start_date or end_date is invalid
+
+        Returns:
+            List[Text]: sorted dates of the range in ISO format
+        """
+        start: Optional[Text] = IsoDate.cached_value(start_date)
+        end: Optional[Text] = IsoDate.cached_value(end_date)
+        if start is None or (end_date is not None and end is None):
+            message: Text = "Missing or invalid start_date or end_date"
+            raise NASAInvalidInput(message)
+        return sorted(
+            day for day in available if start <= day and (end is None or day <= end)
+        )
+
+    def _epic_range_downloads(
+        self,
+        image_type: Text,
+        variant: Text,
+        response: JSONType,
+        directory: Text,
+        day: Text,
+    ) -> List[Tuple[Text, Text]]:
+        """URL and destination file of the images of a date in the range layout
+
+        Args:
+            image_type (Text): Possible values are natural or enhanced
+            variant (Text): archive variant of the images
+            response (JSONType): EPIC records of the date
+            directory (Text): Destination directory of the range
+            day (Text): date of the records in ISO format
+
+        Returns:
+            List[Tuple[Text, Text]]: URL and destination file of every image
+        """
+        day_directory: Text = os.path.join(directory, variant, day)
+        os.makedirs(day_directory, exist_ok=True)
+        extension: Text = self.EPIC_VARIANTS[variant]
+        return [
+            (
+                f"{self.BASE_URL}{self._epic_archive_path(image_type, record, variant)}",
+                os.path.join(day_directory, f"{record['image']}.{extension}"),
+            )
+            for record in response
+        ]
+
+    @staticmethod
+    def _epic_manifest_path(directory: Text, variant: Text, day: Text) -> Text:
+        return os.path.join(directory, variant, day, EpicClient.EPIC_MANIFEST)
+
+    @staticmethod
+    def _epic_read_manifest(
+        directory: Text, variant: Text, day: Text
+    ) -> Optional[List[Text]]:
+        """Paths of the images of a completed date, None if it is not complete"""
+        manifest_path: Text = EpicClient._epic_manifest_path(directory, variant, day)
+        try:
+            with open(manifest_path) as file:
+                names: List[Text] = json.load(file)
+        except (OSError, ValueError):
+            return None
+        day_directory: Text = os.path.dirname(manifest_path)
+        paths: List[Text] = [os.path.join(day_directory, name) for name in names]
+        if not all(os.path.exists(path) for path in paths):
+            return None
+        return paths
+
+    @staticmethod
+    def _epic_write_manifests(
+        directory: Text,
+        variant: Text,
+        downloads: Dict[Text, Iterable[Tuple[Text, Text]]],
+        latest: Optional[Text],
+    ) -> None:
+        """Mark the dates before the latest available one as complete
+
+        Args:
+            directory (Text): Destination directory of the range
+            variant (Text): archive variant of the images
+            downloads (Dict[Text, Iterable[Tuple[Text, Text]]]): downloaded URL and file by date
+            latest (Optional[Text]): latest available date, which may still change
+        """
+        for day, items in downloads.items():
+            if latest is None or day >= latest:
+                continue
+            names: List[Text] = [os.path.basename(path) for _, path in items]
+            manifest_path: Text = EpicClient._epic_manifest_path(
+                directory, variant, day
+            )
+            with open(manifest_path, "w") as file:
+                json.dump(names, file)
+
     def epic_natural(
         self,
         date: Optional[IsoDateConvertible] = None,
         available: bool = False,
         get_images: bool = False,
-    ) -> Union[JSONType, Dict[Text, Union[JSONType, ImageFile]]]:
+    ) -> Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]:
         """The EPIC Natural API provides information on the daily imagery collected by Earth Polychromatic Imaging Camera (EPIC) instrument.
 
         Args:
@@ -95,7 +361,7 @@ class EpicClient(BaseClient):
         date: Optional[IsoDateConvertible] = None,
         available: bool = False,
         get_images: bool = False,
-    ) -> Union[JSONType, Dict[Text, Union[JSONType, ImageFile]]]:
+    ) -> Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]:
         """The EPIC Enhanced API provides information on the daily imagery collected by Earth Polychromatic Imaging Camera (EPIC) instrument.
 
         Args:
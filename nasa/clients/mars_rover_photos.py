@@ -1,13 +1,32 @@
-from typing import Dict, List, Optional, Set, Text, Tuple, Union
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Text,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
-from PIL.ImageFile import ImageFile
 from nasa.clients.base import BaseClient
 from nasa.exceptions import NASAInvalidInput
 from nasa.typing import IsoDate, IsoDateConvertible, JSONType
-from nasa.utils import get_urls_images
+from nasa.utils import download_all, get_urls_images, url_filename
+
+if TYPE_CHECKING:
+    from PIL.ImageFile import ImageFile
 
 
 class MarsRoverPhotosClient(BaseClient):
+    MARS_ROVER_PHOTOS_PAGE_SIZE: int = 25
+    MARS_ROVERS: Set[Text] = {"curiousity", "opportunity", "spirit"}
+
     def mars_rover_photos(
         self,
         rover: Text,
@@ -16,7 +35,7 @@ class MarsRoverPhotosClient(BaseClient):
         page: int = 1,
         earth_date: Optional[IsoDateConvertible] = None,
         get_images: bool = False,
-    ) -> Union[JSONType, Dict[Text, Union[JSONType, ImageFile]]]:
+    ) -> Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]:
         """This API is designed to collect image data gathered by NASA's Curiosity, Opportunity, and Spirit rovers on Mars and make it more easily available to other developers, educators, and citizen scientists.
 
         Args:
@@ -35,7 +54,6 @@ class MarsRoverPhotosClient(BaseClient):
         Returns:
             Union[JSONType, Dict[Text, Union[JSONType, ImageFile]]]: Only JSON if get_images is False else will includes the images
         """
-        rovers: Set[Text] = {"curiousity", "opportunity", "spirit"}
         cameras: Set[Text] = {
             "FHAZ",  # Front Hazard Avoidance Camera
             "RHAZ",  # Rear Hazard Avoidance Camera
@@ -71,11 +89,7 @@ class MarsRoverPhotosClient(BaseClient):
             ("spirit", "MINITES"),
             ("spirit", "all"),
         }
-        if rover not in rovers:
-            message: Text = (
-                f"Invalid rover {rover}. Valid rover values are {tuple(rovers)}"
-            )
-            raise NASAInvalidInput(message)
+        self._mars_check_rover(rover)
         if camera not in cameras:
             message: Text = (
                 f"Invalid camera {camera}. Valid rover values are {tuple(cameras)}"
@@ -84,7 +98,7 @@ class MarsRoverPhotosClient(BaseClient):
         if (rover, camera) not in rover_cameras:
             message: Text = f"Invalid rover and camera combination {(rover, camera)}. Valid rover camera combinations are {tuple(rover_cameras)}"
             raise NASAInvalidInput(message)
-        iso_earth_date: Optional[Text] = IsoDate(earth_date).value()
+        iso_earth_date: Optional[Text] = IsoDate.cached_value(earth_date)
         if iso_earth_date is not None:
             sol = None
         path: Text = f"/mars-photos/api/v1/rovers/{rover}/photos"
@@ -96,22 +110,50 @@ class MarsRoverPhotosClient(BaseClient):
         }
         response: JSONType = self._get(path, params)
         if get_images:
-            images: List[ImageFile] = get_urls_images(
-                [record.get("img_src") for record in response.get("photos")]
+            images: List["ImageFile"] = get_urls_images(
+                [record.get("img_src") for record in response.get("photos")],
+                session=self._session,
+                observers=self._observers,
+                progress=self._progress,
             )
             return {"JSON": response, "Images": images}
         else:
             return response
 
-    def mars_rover_photos_all_pages(
+    def mars_rover_manifest(self, rover: Text) -> JSONType:
+        """Mission manifest of a rover: its sols with photos, and the cameras and number of photos of each
+
+        Args:
+            rover (Text): Rover Name, currently supports "curiousity", "opportunity", "spirit"
+
+        Raises:
+            NASAInvalidInput: Raised when Mars Rover input is invalid
+
+        Returns:
+            JSONType: manifest, whose "photo_manifest" holds "max_sol", "total_photos" and an entry per sol in "photos"
+        """
+        self._mars_check_rover(rover)
+        path: Text = f"/mars-photos/api/v1/manifests/{rover}"
+        return self._get(path)
+
+    def _mars_check_rover(self, rover: Text) -> None:
+        if rover not in self.MARS_ROVERS:
+            message: Text = f"Invalid rover {rover}. Valid rover values are {tuple(self.MARS_ROVERS)}"
+            raise NASAInvalidInput(message)
+
+    def mars_rover_photos_pages(
         self,
         rover: Text,
         sol: Optional[int] = None,
         camera: Text = "all",
         earth_date: Optional[IsoDateConvertible] = None,
         get_images: bool = False,
-    ) -> Union[JSONType, Dict[Text, Union[JSONType, ImageFile]]]:
-        """Get all pages from Mars Rover Photos API
+        prefetch: int = 2,
+    ) -> Iterator[Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]]:
+        """Iterate over the pages of Mars Rover Photos API as they arrive
+
+        While a page is processed, the next `prefetch` pages are downloaded in the background,
+        so at most `prefetch` + 1 pages are held in memory.
 
         Args:
             rover (Text): Rover Name, currently supports "curiousity", "opportunity", "spirit"
@@ -119,17 +161,16 @@ class MarsRoverPhotosClient(BaseClient):
             camera (Text, optional): camera name abbreviation. Defaults to "all".
             earth_date (Optional[IsoDateConvertible], optional): corresponding date on earth for the given sol. Defaults to None.
             get_images (bool, optional): Whether to get images or not. Defaults to False.
+            prefetch (int, optional): Number of pages downloaded ahead, 0 downloads a page only when it is requested. Defaults to 2.
 
-        Returns:
-            Union[JSONType, Dict[Text, Union[JSONType, ImageFile]]]: Only JSON if get_images is False else will includes the images
+        Yields:
+            Iterator[Union[JSONType, Dict[Text, Union[JSONType, ImageFile]]]]: Every non empty page, as returned by `mars_rover_photos`
         """
-        photos_list: List[JSONType] = list()
-        images_list: List[ImageFile] = list()
-        page: int = 1
-        while True:
-            response: Union[
-                JSONType, Dict[Text, Union[JSONType, ImageFile]]
-            ] = self.mars_rover_photos(
+
+        def fetch(
+            page: int,
+        ) -> Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]:
+            return self.mars_rover_photos(
                 rover=rover,
                 sol=sol,
                 camera=camera,
@@ -137,17 +178,136 @@ class MarsRoverPhotosClient(BaseClient):
                 earth_date=earth_date,
                 get_images=get_images,
             )
-            photos: JSONType = (
-                response["JSON"]["photos"] if get_images else response["photos"]
-            )
-            if bool(photos):
-                break
-            else:
-                photos_list.extend(photos)
+
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max(prefetch, 1))
+        pending: Deque[Future] = deque(
+            executor.submit(fetch, page) for page in range(1, prefetch + 2)
+        )
+        next_page: int = prefetch + 2
+        try:
+            while pending:
+                response: Union[
+                    JSONType, Dict[Text, Union[JSONType, "ImageFile"]]
+                ] = pending.popleft().result()
+                photos: JSONType = (
+                    response["JSON"]["photos"] if get_images else response["photos"]
+                )
+                if not photos:
+                    break
+                full: bool = len(photos) == self.MARS_ROVER_PHOTOS_PAGE_SIZE
+                if not full:
+                    # A partial page is the last one, pages fetched ahead are empty
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                yield response
+                # The next page is only requested once the caller is done with this one
+                if full:
+                    pending.append(executor.submit(fetch, next_page))
+                    next_page += 1
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def mars_rover_photos_all_pages(
+        self,
+        rover: Text,
+        sol: Optional[int] = None,
+        camera: Text = "all",
+        earth_date: Optional[IsoDateConvertible] = None,
+        get_images: bool = False,
+        prefetch: int = 2,
+    ) -> Union[JSONType, Dict[Text, Union[JSONType, "ImageFile"]]]:
+        """Get all pages from Mars Rover Photos API
+
+        Args:
+            rover (Text): Rover Name, currently supports "curiousity", "opportunity", "spirit"
+            sol (Optional[int], optional): sol (ranges from 0 to max found in endpoint). Defaults to None.
+            camera (Text, optional): camera name abbreviation. Defaults to "all".
+            earth_date (Optional[IsoDateConvertible], optional): corresponding date on earth for the given sol. Defaults to None.
+            get_images (bool, optional): Whether to get images or not. Defaults to False.
+            prefetch (int, optional): Number of pages downloaded ahead. Defaults to 2.
+
+        Returns:
+            Union[JSONType, Dict[Text, Union[JSONType, ImageFile]]]: Only JSON if get_images is False else will includes the images
+        """
+        photos_list: List[JSONType] = list()
+        images_list: List["ImageFile"] = list()
+        for response in self.mars_rover_photos_pages(
+            rover=rover,
+            sol=sol,
+            camera=camera,
+            earth_date=earth_date,
+            get_images=get_images,
+            prefetch=prefetch,
+        ):
             if get_images:
-                images_list.extend(response["Image"])
-            page += 1
+                photos_list.extend(response["JSON"]["photos"])
+                images_list.extend(response["Images"])
+            else:
+                photos_list.extend(response["photos"])
         if get_images:
-            return {"JSON": {"photos": photos_list}, "Image": images_list}
+            return {"JSON": {"photos": photos_list}, "Images": images_list}
         else:
             return {"photos": photos_list}
+
+    def mars_rover_photos_download(
+        self,
+        directory: Text,
+        rover: Text,
+        sol: Optional[int] = None,
+        camera: Text = "all",
+        earth_date: Optional[IsoDateConvertible] = None,
+        max_workers: int = 4,
+    ) -> List[Text]:
+        """Download the photos of every page of Mars Rover Photos API to a directory, streaming them to disk
+
+        Files already in the directory are skipped and interrupted downloads are resumed.
+
+        Args:
+            directory (Text): Destination directory, created if missing
+            rover (Text): Rover Name, currently supports "curiousity", "opportunity", "spirit"
+            sol (Optional[int], optional): sol (ranges from 0 to max found in endpoint). Defaults to None.
+            camera (Text, optional): camera name abbreviation. Defaults to "all".
+            earth_date (Optional[IsoDateConvertible], optional): corresponding date on earth for the given sol. Defaults to None.
+            max_workers (int, optional): Number of photos downloaded at the same time. Defaults to 4.
+
+        Returns:
+            List[Text]: Path of the downloaded photos
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths: List[Text] = list()
+        for response in self.mars_rover_photos_pages(
+            rover=rover, sol=sol, camera=camera, earth_date=earth_date
+        ):
+            paths.extend(
+                download_all(
+                    self._mars_rover_photos_downloads(response, directory),
+                    session=self._session,
+                    max_workers=max_workers,
+                    progress=self._progress,
+                )
+            )
+        return paths
+
+    @staticmethod
+    def _mars_rover_photos_downloads(
+        response: JSONType, directory: Text
+    ) -> List[Tuple[Text, Text]]:
+        """URL and destination file of the photos of a Mars Rover Photos page
+
+        Args:
+            response (JSONType): Mars Rover Photos page
+            directory (Text): Destination directory
+
+        Returns:
+            List[Tuple[Text, Text]]: URL and destination file of every photo
+        """
+        return [
+            (
+                record["img_src"],
+                os.path.join(directory, url_filename(record["img_src"])),
+            )
+            for record in response["photos"]
+        ]
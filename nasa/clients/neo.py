@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from warnings import warn
-from typing import Dict, Optional, Text, Union
+from typing import Dict, Iterable, List, Optional, Set, Text, Tuple, Union
 from nasa.clients.base import BaseClient
 from nasa.exceptions import NASAInvalidInput
 from nasa.typing import IsoDate, IsoDateConvertible, JSONType
@@ -7,6 +9,8 @@ from nasa.warnings import AttributesCollussionWarning
 
 
 class NeoClient(BaseClient):
+    NEO_FEED_MAX_DAYS: int = 7
+
     def neo(
         self,
         api_type: Text,
@@ -55,8 +59,8 @@ class NeoClient(BaseClient):
             warn(message, AttributesCollussionWarning)
             asteroid_id, start_date, end_date = None, None, None
         path: Text = f"{base_path}{type_path.get(api_type)}"
-        iso_start_date: Optional[Text] = IsoDate(start_date).value()
-        iso_end_date: Optional[Text] = IsoDate(end_date).value()
+        iso_start_date: Optional[Text] = IsoDate.cached_value(start_date)
+        iso_end_date: Optional[Text] = IsoDate.cached_value(end_date)
         params: Dict[Text, Union[Text, int, None]] = {
             "start_date": iso_start_date,
             "end_date": iso_end_date,
@@ -80,6 +84,76 @@ class NeoClient(BaseClient):
         """
         return self.neo(api_type="feed", start_date=start_date, end_date=end_date)
 
+    def neo_feed_range(
+        self,
+        start_date: IsoDateConvertible,
+        end_date: Optional[IsoDateConvertible] = None,
+        window_days: int = NEO_FEED_MAX_DAYS,
+        max_workers: int = 4,
+    ) -> JSONType:
+        """Near Earth Object Web Service Feed Endpoint over an arbitrary date range
+
+        The range is split into windows accepted by the feed endpoint, fetched concurrently and merged.
+
+        Args:
+            start_date (IsoDateConvertible): Starting date for asteroid search.
+            end_date (Optional[IsoDateConvertible], optional): Ending date for asteroid search. Defaults to None, today.
+            window_days (int, optional): Number of days per request. Defaults to 7, the endpoint limit.
+            max_workers (int, optional): Number of windows fetched at the same time. Defaults to 4.
+
+        Raises:
+            NASAInvalidInput: Raises when the start_date is missing or invalid
+
+        Returns:
+            JSONType: Merged response body structure
+            {
+                "element_count": 0,
+                "near_earth_objects": {"YYYY-mm-dd": [...]}
+            }
+        """
+        windows: List[Tuple[date, date]] = self._date_windows(
+            start_date, end_date, window_days
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses: List[JSONType] = list(
+                executor.map(lambda window: self.neo_feed(*window), windows)
+            )
+        return self._merge_neo_feeds(responses, windows)
+
+    @staticmethod
+    def _merge_neo_feeds(
+        responses: Iterable[JSONType], windows: List[Tuple[date, date]]
+    ) -> JSONType:
+        """Merge the feed responses of several windows, dropping objects repeated on the window boundaries
+
+        Args:
+            responses (Iterable[JSONType]): feed responses
+            windows (List[Tuple[date, date]]): windows of the responses
+
+        Returns:
+            JSONType: Merged feed response
+        """
+        start: Text = windows[0][0].isoformat() if windows else ""
+        end: Text = windows[-1][1].isoformat() if windows else ""
+        near_earth_objects: Dict[Text, List[JSONType]] = dict()
+        seen: Dict[Text, Set[Text]] = dict()
+        for response in responses:
+            for day, objects in response.get("near_earth_objects", dict()).items():
+                if not start <= day <= end:
+                    continue
+                day_objects: List[JSONType] = near_earth_objects.setdefault(day, [])
+                day_ids: Set[Text] = seen.setdefault(day, set())
+                for neo in objects:
+                    if neo.get("id") not in day_ids:
+                        day_ids.add(neo.get("id"))
+                        day_objects.append(neo)
+        return {
+            "element_count": sum(
+                len(objects) for objects in near_earth_objects.values()
+            ),
+            "near_earth_objects": dict(sorted(near_earth_objects.items())),
+        }
+
     def neo_lookup(self, asteroid_id: int) -> JSONType:
         """Near Earth Object Web Service Lookup Endpoint
 
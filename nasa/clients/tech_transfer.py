@@ -1,16 +1,21 @@
-from typing import Set, Text
+from typing import Dict, List, Optional, Text
 from nasa.clients.base import BaseClient
 from nasa.exceptions import NASAInvalidInput
 from nasa.typing import JSONType
 
 
 class TechTransferClient(BaseClient):
-    def tech_transfer(self, api_type: Text, keyword: Text = "") -> JSONType:
+    TECH_TRANSFER_TYPES: List[Text] = ["patent", "patent_issued", "software", "Spinoff"]
+
+    def tech_transfer(
+        self, api_type: Text, keyword: Text = "", page: Optional[int] = None
+    ) -> JSONType:
         """This endpoint provides structured, searchable developer access to NASA’s patents, software, and technology spinoff descriptions that have been curated to support technology transfer.
 
         Args:
             api_type (Text): Type of API to be hit
             keyword (Text, optional): keyword to be highlighted. Defaults to "".
+            page (Optional[int], optional): page of the results, None for the first one. Defaults to None.
 
         Raises:
             NASAInvalidInput: Raises when the api_type provided is invalid
@@ -18,12 +23,14 @@ class TechTransferClient(BaseClient):
         Returns:
             JSONType: JSON object returned from the response
         """
-        api_types: Set[Text] = {"patent", "patent_issued", "software", "Spinoff"}
-        if api_type not in api_types:
-            message: Text = f"Invalid api_type {api_type}. Valid api_type values are {tuple(api_type)}"
+        if api_type not in self.TECH_TRANSFER_TYPES:
+            message: Text = f"Invalid api_type {api_type}. Valid api_type values are {tuple(self.TECH_TRANSFER_TYPES)}"
             raise NASAInvalidInput(message)
         path: Text = f"/techtransfer/{api_type}/{keyword}"
-        return self._get(path)
+        if page is None:
+            return self._get(path)
+        params: Dict[Text, int] = {"page": page}
+        return self._get(path, params)
 
     def tech_transfer_patent(self, keyword: Text = "") -> JSONType:
         """This endpoint provides structured, searchable developer access to NASA’s patents descriptions that have been curated to support technology transfer.
@@ -22,7 +22,7 @@ class TechPortClient(BaseClient):
             str_id_parameter: Text = ""
         else:
             str_id_parameter: Text = str(id_parameter)
-        iso_updated_since: Text = IsoDate(updated_since).value()
+        iso_updated_since: Text = IsoDate.cached_value(updated_since)
         path: Text = f"/techport/api/projects/{str_id_parameter}"
         params: Dict[Text, Text] = {"updatedSince": iso_updated_since}
         return self._get(path, params)
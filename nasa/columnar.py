@@ -0,0 +1,109 @@
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Text
+
+from nasa.typing import JSONType
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# Epoch of a close approach without a date, read back as NaT
+_NAT: int = -(2 ** 63)
+
+NEO_COLUMNS: List[Text] = [
+    "id",
+    "epoch",
+    "miss_distance_km",
+    "relative_velocity_kps",
+    "diameter_min_km",
+    "diameter_max_km",
+    "hazardous",
+]
+
+
+def _neo_objects(response: JSONType) -> Iterable[JSONType]:
+    objects: JSONType = response.get("near_earth_objects") or []
+    if isinstance(objects, dict):
+        # Feed and merged feed responses group the objects by day
+        for day in sorted(objects):
+            yield from objects[day]
+    else:
+        # Browse responses hold a flat list
+        yield from objects
+
+
+def _number(value: Optional[Text]) -> float:
+    return float("nan") if value is None else float(value)
+
+
+def neo_columns(*responses: JSONType) -> Dict[Text, "ndarray"]:
+    """Flatten NEO responses into one NumPy array per column, a row per close approach
+
+    Works with `neo_feed`, `neo_feed_range` and `neo_browse` responses. Several
+    responses are concatenated, so the rows can be filtered and sorted with
+    vectorized operations instead of walking the nested dicts, e.g.
+    `columns["id"][columns["miss_distance_km"] < 1e6]`.
+
+    Columns:
+        id (int64): SPK-ID of the object
+        epoch (datetime64[ms]): time of the close approach, NaT when missing
+        miss_distance_km (float64): miss distance, NaN when missing
+        relative_velocity_kps (float64): relative velocity in km/s, NaN when missing
+        diameter_min_km (float64): lower bound of the estimated diameter, NaN when missing
+        diameter_max_km (float64): upper bound of the estimated diameter, NaN when missing
+        hazardous (bool): whether the object is potentially hazardous
+
+    Args:
+        *responses (JSONType): NEO responses
+
+    Raises:
+        ImportError: Raised when numpy is not installed
+
+    Returns:
+        Dict[Text, ndarray]: arrays of the same length by column name, see NEO_COLUMNS
+    """
+    if numpy is None:
+        raise ImportError(
+            "neo_columns requires numpy, install it with `pip install python-nasa[numpy]`"
+        )
+    rows: Dict[Text, List] = {column: [] for column in NEO_COLUMNS}
+    for response in responses:
+        for neo in _neo_objects(response):
+            diameter: JSONType = (neo.get("estimated_diameter") or dict()).get(
+                "kilometers"
+            ) or dict()
+            neo_id: int = int(neo.get("id"))
+            diameter_min: float = _number(diameter.get("estimated_diameter_min"))
+            diameter_max: float = _number(diameter.get("estimated_diameter_max"))
+            hazardous: bool = bool(neo.get("is_potentially_hazardous_asteroid"))
+            for approach in neo.get("close_approach_data") or []:
+                epoch: Optional[int] = approach.get("epoch_date_close_approach")
+                rows["id"].append(neo_id)
+                rows["epoch"].append(_NAT if epoch is None else epoch)
+                rows["miss_distance_km"].append(
+                    _number((approach.get("miss_distance") or dict()).get("kilometers"))
+                )
+                rows["relative_velocity_kps"].append(
+                    _number(
+                        (approach.get("relative_velocity") or dict()).get(
+                            "kilometers_per_second"
+                        )
+                    )
+                )
+                rows["diameter_min_km"].append(diameter_min)
+                rows["diameter_max_km"].append(diameter_max)
+                rows["hazardous"].append(hazardous)
+    return {
+        "id": numpy.array(rows["id"], dtype=numpy.int64),
+        "epoch": numpy.array(rows["epoch"], dtype=numpy.int64).view("datetime64[ms]"),
+        "miss_distance_km": numpy.array(rows["miss_distance_km"], dtype=numpy.float64),
+        "relative_velocity_kps": numpy.array(
+            rows["relative_velocity_kps"], dtype=numpy.float64
+        ),
+        "diameter_min_km": numpy.array(rows["diameter_min_km"], dtype=numpy.float64),
+        "diameter_max_km": numpy.array(rows["diameter_max_km"], dtype=numpy.float64),
+        "hazardous": numpy.array(rows["hazardous"], dtype=numpy.bool_),
+    }
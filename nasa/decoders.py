@@ -0,0 +1,54 @@
+import json
+from typing import Callable, Dict, Text, Union
+
+from nasa.exceptions import NASAInvalidInput
+from nasa.typing import JSONType
+
+Decoder = Callable[[bytes], Union[JSONType, bytes]]
+
+
+def raw(content: bytes) -> bytes:
+    """Keep the JSON body undecoded, for callers forwarding it as is"""
+    return content
+
+
+def _orjson() -> Decoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _auto() -> Decoder:
+    try:
+        return _orjson()
+    except ImportError:
+        return json.loads
+
+
+DECODERS: Dict[Text, Callable[[], Decoder]] = {
+    "auto": _auto,
+    "orjson": _orjson,
+    "json": lambda: json.loads,
+    "raw": lambda: raw,
+}
+
+
+def get_decoder(decoder: Union[Text, Decoder]) -> Decoder:
+    """Resolve the decoder of the JSON responses
+
+    Args:
+        decoder (Union[Text, Decoder]): "auto" for orjson when it is installed and the standard library otherwise, "orjson", "json", "raw" for the undecoded bytes, or a callable decoding bytes
+
+    Raises:
+        NASAInvalidInput: Raised when the decoder name is unknown
+        ImportError: Raised when "orjson" is asked and is not installed
+
+    Returns:
+        Decoder: callable decoding the body of a response
+    """
+    if callable(decoder):
+        return decoder
+    if decoder not in DECODERS:
+        message: Text = f"Unknown JSON decoder {decoder!r}, expected one of {', '.join(DECODERS)} or a callable"
+        raise NASAInvalidInput(message)
+    return DECODERS[decoder]()
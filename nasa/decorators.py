@@ -1,14 +1,60 @@
 import inspect
 from typing import Any, Dict, Text, Tuple, Type, Callable
 
-from nasa.exceptions import NASAHTTPError, NASAInvalidInput, NASAUnidentifiedError
+from nasa.exceptions import BaseNASAException, NASAUnidentifiedError
 
 
 def catch_unidentidied_error(function: Callable) -> Callable:
+    if inspect.iscoroutinefunction(function):
+
+        async def async_wrapper(*args: Tuple[Any], **kwargs: Dict[Text, Any]) -> Any:
+            try:
+                result: Any = await function(*args, **kwargs)
+            except BaseNASAException:
+                raise
+            except Exception as error:
+                raise NASAUnidentifiedError(str(error), type(error))
+            else:
+                return result
+
+        return async_wrapper
+
+    if inspect.isgeneratorfunction(function):
+
+        def generator_wrapper(*args: Tuple[Any], **kwargs: Dict[Text, Any]) -> Any:
+            try:
+                result: Any = yield from function(*args, **kwargs)
+            except BaseNASAException:
+                raise
+            except Exception as error:
+                raise NASAUnidentifiedError(str(error), type(error))
+            else:
+                return result
+
+        return generator_wrapper
+
+    if inspect.isasyncgenfunction(function):
+
+        async def async_generator_wrapper(
+            *args: Tuple[Any], **kwargs: Dict[Text, Any]
+        ) -> Any:
+            generator: Any = function(*args, **kwargs)
+            try:
+                async for item in generator:
+                    yield item
+            except BaseNASAException:
+                raise
+            except Exception as error:
+                raise NASAUnidentifiedError(str(error), type(error))
+            finally:
+                await generator.aclose()
+
+        return async_generator_wrapper
+
     def wrapper(*args: Tuple[Any], **kwargs: Dict[Text, Any]) -> Any:
         try:
             result: Any = function(*args, **kwargs)
-        except (NASAHTTPError, NASAInvalidInput, NASAUnidentifiedError):
+        except BaseNASAException:
             raise
         except Exception as error:
             raise NASAUnidentifiedError(str(error), type(error))
@@ -21,7 +67,10 @@ def catch_unidentidied_error(function: Callable) -> Callable:
 def decorate_all_methods(decorator: Callable) -> Callable:
     def decorate(cls: Type):
         for name, method in inspect.getmembers(cls, inspect.isfunction):
-            setattr(cls, name, decorator(method))
+            if isinstance(inspect.getattr_static(cls, name), staticmethod):
+                setattr(cls, name, staticmethod(decorator(method)))
+            else:
+                setattr(cls, name, decorator(method))
         return cls
 
     return decorate
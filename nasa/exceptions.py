@@ -21,6 +21,14 @@ class NASAContentTypeNotImage(BaseNASAException):
     CODE: Text = "NASA-ERROR-004"
 
 
+class NASAIncompleteDownload(BaseNASAException):
+    CODE: Text = "NASA-ERROR-005"
+
+
+class NASACircuitOpen(BaseNASAException):
+    CODE: Text = "NASA-ERROR-006"
+
+
 class NASAUnidentifiedError(BaseNASAException):
     CODE: Text = "NASA-ERROR-999"
 
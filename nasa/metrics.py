@@ -0,0 +1,464 @@
+import re
+import time
+from bisect import bisect_left
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Match,
+    Optional,
+    Pattern,
+    Sequence,
+    Text,
+    Tuple,
+)
+
+REQUEST_START: Text = "start"
+REQUEST_END: Text = "end"
+REQUEST_ERROR: Text = "error"
+REQUEST_BYTES: Text = "bytes"
+REQUEST_RETRY: Text = "retry"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+# Path parameters of the endpoints, replaced by their name in the metric labels
+ROUTE_TEMPLATES: Sequence[Tuple[Pattern, Text]] = tuple(
+    (re.compile(pattern), template)
+    for pattern, template in (
+        (r"/neo/rest/v1/neo/(?!browse$)[^/]+", "/neo/rest/v1/neo/{id}"),
+        (r"/EPIC/api/[^/]+/date/[^/]+", "/EPIC/api/{collection}/date/{date}"),
+        (r"/EPIC/api/[^/]+/available", "/EPIC/api/{collection}/available"),
+        (
+            r"/EPIC/archive/[^/]+/[^/]+/[^/]+/[^/]+/[^/]+/[^/]+",
+            "/EPIC/archive/{collection}/{year}/{month}/{day}/{variant}/{image}",
+        ),
+        (
+            r"/mars-photos/api/v1/rovers/[^/]+/photos",
+            "/mars-photos/api/v1/rovers/{rover}/photos",
+        ),
+        (
+            r"/mars-photos/api/v1/manifests/[^/]+",
+            "/mars-photos/api/v1/manifests/{rover}",
+        ),
+        (r"/techport/api/projects/[^/]+", "/techport/api/projects/{id}"),
+        (r"/techtransfer/([^/]+)/.+", r"/techtransfer/\1/{keyword}"),
+    )
+)
+
+
+class RequestEvent:
+    """Structured event emitted by the clients around every HTTP request
+
+    Args:
+        kind (Text): One of REQUEST_START, REQUEST_END, REQUEST_ERROR, REQUEST_BYTES or REQUEST_RETRY
+        path (Text): path of the request, without the base url and the query
+        url (Text): full url of the request, without the query
+        status_code (Optional[int], optional): status code of the response. Defaults to None.
+        elapsed (Optional[float], optional): seconds since the request started. Defaults to None.
+        size (Optional[int], optional): bytes of the response body. Defaults to None.
+        cache (Optional[Text], optional): "hit", "revalidated" or "miss" when a cache is used. Defaults to None.
+        rate_limit_remaining (Optional[int], optional): value of X-RateLimit-Remaining. Defaults to None.
+        error (Optional[BaseException], optional): exception raised by the request. Defaults to None.
+        attempt (Optional[int], optional): number of the attempt which failed, for retries. Defaults to None.
+        delay (Optional[float], optional): seconds waited before the next attempt, for retries. Defaults to None.
+        coalesced (Optional[bool], optional): whether the response was shared with a concurrent identical call. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        kind: Text,
+        path: Text,
+        url: Text,
+        status_code: Optional[int] = None,
+        elapsed: Optional[float] = None,
+        size: Optional[int] = None,
+        cache: Optional[Text] = None,
+        rate_limit_remaining: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        attempt: Optional[int] = None,
+        delay: Optional[float] = None,
+        coalesced: Optional[bool] = None,
+    ) -> None:
+        self.kind: Text = kind
+        self.path: Text = path
+        self.url: Text = url
+        self.status_code: Optional[int] = status_code
+        self.elapsed: Optional[float] = elapsed
+        self.size: Optional[int] = size
+        self.cache: Optional[Text] = cache
+        self.rate_limit_remaining: Optional[int] = rate_limit_remaining
+        self.error: Optional[BaseException] = error
+        self.attempt: Optional[int] = attempt
+        self.delay: Optional[float] = delay
+        self.coalesced: Optional[bool] = coalesced
+
+    def __repr__(self) -> str:
+        fields: Text = ", ".join(
+            f"{name}={value!r}"
+            for name, value in vars(self).items()
+            if value is not None
+        )
+        return f"RequestEvent({fields})"
+
+
+Observer = Callable[[RequestEvent], None]
+
+
+def emit(observers: Sequence[Observer], event: RequestEvent) -> None:
+    """Send an event to every observer"""
+    for observer in observers:
+        observer(event)
+
+
+class RequestTrace:
+    """Emit the events of one request to observers, doing nothing when there are none
+
+    Args:
+        observers (Sequence[Observer]): observers receiving the events
+        path (Text): path of the request
+        url (Text): full url of the request
+    """
+
+    def __init__(self, observers: Sequence[Observer], path: Text, url: Text) -> None:
+        self.observers: Sequence[Observer] = observers
+        self.path: Text = path
+        self.url: Text = url
+        self.started: float = time.perf_counter()
+        if observers:
+            emit(observers, RequestEvent(REQUEST_START, path, url))
+
+    def _emit(self, kind: Text, **fields: Any) -> None:
+        elapsed: float = time.perf_counter() - self.started
+        emit(
+            self.observers,
+            RequestEvent(kind, self.path, self.url, elapsed=elapsed, **fields),
+        )
+
+    def bytes(self, size: int, status_code: Optional[int] = None) -> None:
+        if self.observers:
+            self._emit(REQUEST_BYTES, size=size, status_code=status_code)
+
+    def retry(
+        self,
+        attempt: int,
+        delay: float,
+        status_code: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if self.observers:
+            self._emit(
+                REQUEST_RETRY,
+                attempt=attempt,
+                delay=delay,
+                status_code=status_code,
+                error=error,
+            )
+
+    def end(
+        self,
+        status_code: Optional[int],
+        headers: Optional[Mapping] = None,
+        cache: Optional[Text] = None,
+        coalesced: Optional[bool] = None,
+    ) -> None:
+        if self.observers:
+            self._emit(
+                REQUEST_END,
+                status_code=status_code,
+                cache=cache,
+                coalesced=coalesced,
+                rate_limit_remaining=rate_limit_remaining(headers),
+            )
+
+    def error(
+        self,
+        error: BaseException,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping] = None,
+    ) -> None:
+        if self.observers:
+            self._emit(
+                REQUEST_ERROR,
+                status_code=status_code,
+                error=error,
+                rate_limit_remaining=rate_limit_remaining(headers),
+            )
+
+
+def rate_limit_remaining(headers: Optional[Mapping]) -> Optional[int]:
+    value: Optional[Text] = (
+        None if headers is None else headers.get("X-RateLimit-Remaining")
+    )
+    try:
+        return None if value is None else int(value)
+    except ValueError:
+        return None
+
+
+def route_label(path: Text) -> Text:
+    """Route of a path, e.g. "/neo/rest/v1/neo/{id}", keeping the number of metric series bounded
+
+    Paths which are not a route of the APIs, e.g. images hosted elsewhere, are returned as they are.
+    """
+    for pattern, template in ROUTE_TEMPLATES:
+        match: Optional[Match] = pattern.fullmatch(path)
+        if match is not None:
+            return match.expand(template)
+    return path
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds, as exported by Prometheus"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[Text, int]]:
+        """Count of observations less than or equal to every bound, ending with +Inf"""
+        bounds: List[Text] = [format_value(bound) for bound in self.buckets] + ["+Inf"]
+        total: int = 0
+        cumulative: List[Tuple[Text, int]] = []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+
+class MetricsCollector:
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        path_label: Optional[Callable[[Text], Text]] = None,
+        namespace: Text = "nasa",
+    ) -> None:
+        """In-process observer aggregating counters and latency histograms per endpoint path
+
+        Args:
+            buckets (Sequence[float], optional): upper bounds in seconds of the latency histograms. Defaults to DEFAULT_BUCKETS.
+            path_label (Optional[Callable[[Text], Text]], optional): maps a path to its label, e.g. to group image urls. Defaults to None, `route_label`.
+            namespace (Text, optional): prefix of the exported metric names. Defaults to "nasa".
+        """
+        self.buckets: Sequence[float] = buckets
+        self.path_label: Callable[[Text], Text] = (
+            route_label if path_label is None else path_label
+        )
+        self.namespace: Text = namespace
+        self._lock: Lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests: Dict[Tuple[Text, Text], int] = dict()
+            self.errors: Dict[Tuple[Text, Text], int] = dict()
+            self.retries: Dict[Text, int] = dict()
+            self.coalesced: Dict[Text, int] = dict()
+            self.bytes: Dict[Text, int] = dict()
+            self.cache: Dict[Tuple[Text, Text], int] = dict()
+            self.in_flight: Dict[Text, int] = dict()
+            self.latency: Dict[Text, Histogram] = dict()
+            self.rate_limit_remaining: Optional[int] = None
+
+    def __call__(self, event: RequestEvent) -> None:
+        path: Text = self.path_label(event.path)
+        with self._lock:
+            if event.kind == REQUEST_START:
+                self.in_flight[path] = self.in_flight.get(path, 0) + 1
+            elif event.kind == REQUEST_RETRY:
+                self._increment(self.retries, path)
+            elif event.kind == REQUEST_BYTES:
+                self.bytes[path] = self.bytes.get(path, 0) + (event.size or 0)
+            elif event.kind in (REQUEST_END, REQUEST_ERROR):
+                self.in_flight[path] = self.in_flight.get(path, 0) - 1
+                status: Text = (
+                    "error" if event.status_code is None else str(event.status_code)
+                )
+                self._increment(self.requests, (path, status))
+                if event.kind == REQUEST_ERROR:
+                    self._increment(self.errors, (path, type(event.error).__name__))
+                if event.coalesced:
+                    self._increment(self.coalesced, path)
+                if event.cache is not None:
+                    self._increment(self.cache, (path, event.cache))
+                if event.rate_limit_remaining is not None:
+                    self.rate_limit_remaining = event.rate_limit_remaining
+                if path not in self.latency:
+                    self.latency[path] = Histogram(self.buckets)
+                self.latency[path].observe(event.elapsed or 0)
+
+    @staticmethod
+    def _increment(counter: Dict[Any, int], key: Any) -> None:
+        counter[key] = counter.get(key, 0) + 1
+
+    def snapshot(self) -> Dict[Text, Any]:
+        """Copy of the metrics as plain dictionaries
+
+        Returns:
+            Dict[Text, Any]: counters by path, and latency count, sum and mean by path
+        """
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "errors": dict(self.errors),
+                "retries": dict(self.retries),
+                "coalesced": dict(self.coalesced),
+                "bytes": dict(self.bytes),
+                "cache": dict(self.cache),
+                "in_flight": dict(self.in_flight),
+                "latency": {
+                    path: {
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "mean": histogram.sum / histogram.count,
+                    }
+                    for path, histogram in self.latency.items()
+                },
+                "rate_limit_remaining": self.rate_limit_remaining,
+            }
+
+    def to_prometheus(self) -> Text:
+        """Export the metrics in the Prometheus text exposition format
+
+        Returns:
+            Text: metrics page, e.g. to be served on /metrics
+        """
+        prefix: Text = self.namespace
+        lines: List[Text] = []
+        with self._lock:
+            self._counter(
+                lines,
+                f"{prefix}_requests_total",
+                "Requests completed by endpoint path and status code.",
+                (
+                    ({"path": path, "status": status}, count)
+                    for (path, status), count in self.requests.items()
+                ),
+            )
+            self._counter(
+                lines,
+                f"{prefix}_request_errors_total",
+                "Requests which raised an exception by endpoint path and exception type.",
+                (
+                    ({"path": path, "error": error}, count)
+                    for (path, error), count in self.errors.items()
+                ),
+            )
+            self._counter(
+                lines,
+                f"{prefix}_retries_total",
+                "Failed attempts which were retried by endpoint path.",
+                (({"path": path}, count) for path, count in self.retries.items()),
+            )
+            self._counter(
+                lines,
+                f"{prefix}_coalesced_requests_total",
+                "Requests answered by a concurrent identical request by endpoint path.",
+                (({"path": path}, count) for path, count in self.coalesced.items()),
+            )
+            self._counter(
+                lines,
+                f"{prefix}_response_bytes_total",
+                "Response body bytes received by endpoint path.",
+                (({"path": path}, size) for path, size in self.bytes.items()),
+            )
+            self._counter(
+                lines,
+                f"{prefix}_cache_requests_total",
+                "Cached requests by endpoint path and result.",
+                (
+                    ({"path": path, "result": result}, count)
+                    for (path, result), count in self.cache.items()
+                ),
+            )
+            self._metric(
+                lines,
+                f"{prefix}_requests_in_flight",
+                "gauge",
+                "Requests started and not finished yet by endpoint path.",
+                (({"path": path}, count) for path, count in self.in_flight.items()),
+            )
+            if self.rate_limit_remaining is not None:
+                self._metric(
+                    lines,
+                    f"{prefix}_rate_limit_remaining",
+                    "gauge",
+                    "Last X-RateLimit-Remaining reported by the API.",
+                    [({}, self.rate_limit_remaining)],
+                )
+            name: Text = f"{prefix}_request_duration_seconds"
+            lines.append(f"# HELP {name} Request latency by endpoint path.")
+            lines.append(f"# TYPE {name} histogram")
+            for path, histogram in sorted(self.latency.items()):
+                for bound, count in histogram.cumulative():
+                    labels: Text = format_labels({"path": path, "le": bound})
+                    lines.append(f"{name}_bucket{labels} {count}")
+                labels: Text = format_labels({"path": path})
+                lines.append(f"{name}_sum{labels} {format_value(histogram.sum)}")
+                lines.append(f"{name}_count{labels} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def _counter(
+        self,
+        lines: List[Text],
+        name: Text,
+        description: Text,
+        samples: Iterable[Tuple[Dict[Text, Text], float]],
+    ) -> None:
+        self._metric(lines, name, "counter", description, samples)
+
+    @staticmethod
+    def _metric(
+        lines: List[Text],
+        name: Text,
+        metric_type: Text,
+        description: Text,
+        samples: Iterable[Tuple[Dict[Text, Text], float]],
+    ) -> None:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in sorted(
+            samples, key=lambda sample: sorted(sample[0].items())
+        ):
+            lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+
+
+def format_labels(labels: Dict[Text, Text]) -> Text:
+    if not labels:
+        return ""
+    escaped: List[Text] = [
+        f'{name}="{escape_label(value)}"' for name, value in labels.items()
+    ]
+    return "{" + ",".join(escaped) + "}"
+
+
+def escape_label(value: Text) -> Text:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: float) -> Text:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,152 @@
+from typing import Any, Dict, Iterator, List, Optional, Text, Tuple
+
+from nasa.typing import JSONType
+
+
+def _float(value: JSONType) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+class LazyModel:
+    """Typed view of an API record, parsed on the first field access
+
+    Subclasses list their fields in `__slots__` and fill them in `_parse`. Until
+    then only the raw record is held, and it is released once parsed, so a
+    parsed model keeps floats and short strings instead of nested dicts.
+    """
+
+    __slots__: Tuple[Text, ...] = ("_raw",)
+
+    def __init__(self, raw: Dict[Text, JSONType]) -> None:
+        self._raw: Optional[Dict[Text, JSONType]] = raw
+
+    def _parse(self, raw: Dict[Text, JSONType]) -> None:
+        raise NotImplementedError
+
+    def __getattr__(self, name: Text) -> Any:
+        # Only reached when a slot is not set yet, i.e. before parsing
+        raw: Optional[Dict[Text, JSONType]] = object.__getattribute__(self, "_raw")
+        if raw is None or name.startswith("_"):
+            raise AttributeError(name)
+        self._parse(raw)
+        self._raw = None
+        return object.__getattribute__(self, name)
+
+    @classmethod
+    def fields(cls) -> Tuple[Text, ...]:
+        return cls.__slots__
+
+    def to_dict(self) -> Dict[Text, Any]:
+        """Parsed fields as a dictionary, nested models included"""
+
+        def convert(value: Any) -> Any:
+            if isinstance(value, LazyModel):
+                return value.to_dict()
+            if isinstance(value, list):
+                return [convert(item) for item in value]
+            return value
+
+        return {name: convert(getattr(self, name)) for name in self.fields()}
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields: Text = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.fields()
+            if not isinstance(getattr(self, name), list)
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+class CloseApproach(LazyModel):
+    __slots__: Tuple[Text, ...] = (
+        "date",
+        "epoch",
+        "relative_velocity_kps",
+        "miss_distance_km",
+        "miss_distance_lunar",
+        "orbiting_body",
+    )
+
+    def _parse(self, raw: Dict[Text, JSONType]) -> None:
+        velocity: Dict[Text, JSONType] = raw.get("relative_velocity") or dict()
+        miss_distance: Dict[Text, JSONType] = raw.get("miss_distance") or dict()
+        self.date: Optional[Text] = raw.get("close_approach_date")
+        self.epoch: Optional[int] = raw.get("epoch_date_close_approach")
+        self.relative_velocity_kps: Optional[float] = _float(
+            velocity.get("kilometers_per_second")
+        )
+        self.miss_distance_km: Optional[float] = _float(miss_distance.get("kilometers"))
+        self.miss_distance_lunar: Optional[float] = _float(miss_distance.get("lunar"))
+        self.orbiting_body: Optional[Text] = raw.get("orbiting_body")
+
+
+class NearEarthObject(LazyModel):
+    __slots__: Tuple[Text, ...] = (
+        "id",
+        "neo_reference_id",
+        "name",
+        "nasa_jpl_url",
+        "absolute_magnitude_h",
+        "diameter_min_km",
+        "diameter_max_km",
+        "is_potentially_hazardous",
+        "is_sentry_object",
+        "close_approaches",
+    )
+
+    def _parse(self, raw: Dict[Text, JSONType]) -> None:
+        diameter: Dict[Text, JSONType] = (raw.get("estimated_diameter") or dict()).get(
+            "kilometers"
+        ) or dict()
+        self.id: Optional[Text] = raw.get("id")
+        self.neo_reference_id: Optional[Text] = raw.get("neo_reference_id")
+        self.name: Optional[Text] = raw.get("name")
+        self.nasa_jpl_url: Optional[Text] = raw.get("nasa_jpl_url")
+        self.absolute_magnitude_h: Optional[float] = _float(
+            raw.get("absolute_magnitude_h")
+        )
+        self.diameter_min_km: Optional[float] = _float(
+            diameter.get("estimated_diameter_min")
+        )
+        self.diameter_max_km: Optional[float] = _float(
+            diameter.get("estimated_diameter_max")
+        )
+        self.is_potentially_hazardous: bool = bool(
+            raw.get("is_potentially_hazardous_asteroid")
+        )
+        self.is_sentry_object: bool = bool(raw.get("is_sentry_object"))
+        self.close_approaches: List[CloseApproach] = [
+            CloseApproach(approach) for approach in raw.get("close_approach_data", [])
+        ]
+
+
+class NeoFeed:
+    __slots__: Tuple[Text, ...] = ("days",)
+
+    def __init__(self, response: JSONType) -> None:
+        """Typed view of a NEO feed response, from `neo_feed` or the merged `neo_feed_range`
+
+        The objects are wrapped without parsing them, each one is parsed on its first field access.
+
+        Args:
+            response (JSONType): feed response
+        """
+        self.days: Dict[Text, List[NearEarthObject]] = {
+            day: [NearEarthObject(neo) for neo in objects]
+            for day, objects in sorted(
+                (response.get("near_earth_objects") or dict()).items()
+            )
+        }
+
+    def __iter__(self) -> Iterator[NearEarthObject]:
+        for objects in self.days.values():
+            yield from objects
+
+    def __len__(self) -> int:
+        return sum(len(objects) for objects in self.days.values())
+
+    def __repr__(self) -> str:
+        return f"NeoFeed(days={len(self.days)}, objects={len(self)})"
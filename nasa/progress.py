@@ -0,0 +1,266 @@
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Text, Union
+
+from nasa.exceptions import NASAInvalidInput
+
+MIN_UPDATE_BYTES: int = 1024 * 1024
+MIN_UPDATE_INTERVAL: float = 0.1
+
+
+class Progress:
+    def __init__(
+        self,
+        flush: Callable[[int], Any],
+        close: Optional[Callable[[], Any]] = None,
+        min_size: int = 1,
+        min_interval: float = MIN_UPDATE_INTERVAL,
+    ) -> None:
+        """Progress of one task, forwarding its updates in batches
+
+        Updates are added up and flushed once they reach min_size or min_interval
+        has passed since the last flush, so a download reports a few times per
+        second rather than once per chunk.
+
+        Args:
+            flush (Callable[[int], Any]): receives the amount done since the last flush
+            close (Optional[Callable[[], Any]], optional): called once the task is over. Defaults to None.
+            min_size (int, optional): amount done which is flushed at once. Defaults to 1.
+            min_interval (float, optional): seconds after which pending updates are flushed. Defaults to 0.1.
+        """
+        self._flush: Callable[[int], Any] = flush
+        self._close: Optional[Callable[[], Any]] = close
+        self.min_size: int = min_size
+        self.min_interval: float = min_interval
+        self.pending: int = 0
+        self.flushed_at: float = time.monotonic()
+
+    def update(self, n: int = 1) -> None:
+        self.pending += n
+        if self.pending < self.min_size:
+            now: float = time.monotonic()
+            if now - self.flushed_at < self.min_interval:
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        self.flushed_at = time.monotonic()
+        if self.pending:
+            pending, self.pending = self.pending, 0
+            self._flush(pending)
+
+    def close(self) -> None:
+        self.flush()
+        if self._close is not None:
+            self._close()
+
+    def __enter__(self) -> "Progress":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class ProgressSink:
+    def __init__(
+        self,
+        min_bytes: int = MIN_UPDATE_BYTES,
+        min_interval: float = MIN_UPDATE_INTERVAL,
+    ) -> None:
+        """Receives the progress of downloads, base class of the sinks
+
+        `open` returns None when progress is not reported, so callers skip the
+        updates entirely instead of calling a no-op for every chunk.
+
+        Args:
+            min_bytes (int, optional): bytes downloaded which are reported at once. Defaults to 1 MiB.
+            min_interval (float, optional): seconds after which pending updates are reported. Defaults to 0.1.
+        """
+        self.min_bytes: int = min_bytes
+        self.min_interval: float = min_interval
+
+    def open(
+        self,
+        desc: Text,
+        total: Optional[int] = None,
+        unit: Text = "B",
+        initial: int = 0,
+    ) -> Optional[Progress]:
+        """Start reporting the progress of a task
+
+        Args:
+            desc (Text): description of the task
+            total (Optional[int], optional): amount to be done, None if unknown. Defaults to None.
+            unit (Text, optional): "B" for bytes, anything else counts items. Defaults to "B".
+            initial (int, optional): amount already done, e.g. by a resumed download. Defaults to 0.
+
+        Returns:
+            Optional[Progress]: progress of the task, None to skip reporting it
+        """
+        return None
+
+    def _batched(
+        self,
+        unit: Text,
+        flush: Callable[[int], Any],
+        close: Optional[Callable[[], Any]] = None,
+    ) -> Progress:
+        min_size: int = self.min_bytes if unit == "B" else 1
+        return Progress(flush, close, min_size, self.min_interval)
+
+
+class NoProgress(ProgressSink):
+    """Report nothing, for headless workers"""
+
+
+class TqdmProgress(ProgressSink):
+    def __init__(
+        self,
+        min_bytes: int = MIN_UPDATE_BYTES,
+        min_interval: float = MIN_UPDATE_INTERVAL,
+        **options: Any,
+    ) -> None:
+        """Show a tqdm progress bar per task
+
+        Args:
+            min_bytes (int, optional): bytes downloaded which are reported at once. Defaults to 1 MiB.
+            min_interval (float, optional): seconds after which pending updates are reported. Defaults to 0.1.
+            **options (Any): passed to tqdm, e.g. `leave=False` or `file=sys.stdout`
+        """
+        super().__init__(min_bytes, min_interval)
+        self.options: Dict[Text, Any] = options
+
+    def open(
+        self,
+        desc: Text,
+        total: Optional[int] = None,
+        unit: Text = "B",
+        initial: int = 0,
+    ) -> Optional[Progress]:
+        from tqdm.auto import tqdm
+
+        bar: Any = tqdm(
+            total=total,
+            initial=initial,
+            unit=unit,
+            unit_scale=unit == "B",
+            desc=desc,
+            **self.options,
+        )
+        return self._batched(unit, bar.update, bar.close)
+
+
+class CallbackProgress(ProgressSink):
+    def __init__(
+        self,
+        callback: Callable[[Text, int, Optional[int]], Any],
+        min_bytes: int = MIN_UPDATE_BYTES,
+        min_interval: float = MIN_UPDATE_INTERVAL,
+    ) -> None:
+        """Call a function with the progress of every task
+
+        Args:
+            callback (Callable[[Text, int, Optional[int]], Any]): called with the description, the amount done and the total, None if unknown
+            min_bytes (int, optional): bytes downloaded which are reported at once. Defaults to 1 MiB.
+            min_interval (float, optional): seconds after which pending updates are reported. Defaults to 0.1.
+        """
+        super().__init__(min_bytes, min_interval)
+        self.callback: Callable[[Text, int, Optional[int]], Any] = callback
+
+    def open(
+        self,
+        desc: Text,
+        total: Optional[int] = None,
+        unit: Text = "B",
+        initial: int = 0,
+    ) -> Optional[Progress]:
+        done: int = initial
+
+        def flush(n: int) -> None:
+            nonlocal done
+            done += n
+            self.callback(desc, done, total)
+
+        return self._batched(unit, flush)
+
+
+class MetricsProgress(ProgressSink):
+    def __init__(
+        self,
+        min_bytes: int = MIN_UPDATE_BYTES,
+        min_interval: float = MIN_UPDATE_INTERVAL,
+    ) -> None:
+        """Count the progress of every task, by unit, e.g. to be exported with other metrics
+
+        Args:
+            min_bytes (int, optional): bytes downloaded which are counted at once. Defaults to 1 MiB.
+            min_interval (float, optional): seconds after which pending updates are counted. Defaults to 0.1.
+
+        Attributes:
+            done (Dict[Text, int]): amount done by unit, "B" for bytes
+            started (int): tasks started
+            finished (int): tasks finished
+        """
+        super().__init__(min_bytes, min_interval)
+        self.done: Dict[Text, int] = dict()
+        self.started: int = 0
+        self.finished: int = 0
+        self._lock: Lock = Lock()
+
+    def open(
+        self,
+        desc: Text,
+        total: Optional[int] = None,
+        unit: Text = "B",
+        initial: int = 0,
+    ) -> Optional[Progress]:
+        with self._lock:
+            self.started += 1
+
+        def flush(n: int) -> None:
+            with self._lock:
+                self.done[unit] = self.done.get(unit, 0) + n
+
+        def close() -> None:
+            with self._lock:
+                self.finished += 1
+
+        return self._batched(unit, flush, close)
+
+
+NO_PROGRESS: NoProgress = NoProgress()
+
+PROGRESS_SINKS: Dict[Text, Callable[[], ProgressSink]] = {
+    "none": NoProgress,
+    "tqdm": TqdmProgress,
+}
+
+ProgressConvertible = Union[
+    Text, bool, None, ProgressSink, Callable[[Text, int, Optional[int]], Any]
+]
+
+
+def get_progress(progress: ProgressConvertible) -> ProgressSink:
+    """Resolve the sink of the download progress
+
+    Args:
+        progress (ProgressConvertible): "tqdm" or True for progress bars, "none", False or None to report nothing, a ProgressSink, or a callback receiving the description, amount done and total of every task
+
+    Raises:
+        NASAInvalidInput: Raised when the sink name is unknown
+
+    Returns:
+        ProgressSink: sink of the download progress
+    """
+    if isinstance(progress, ProgressSink):
+        return progress
+    if progress is None or progress is False:
+        return NO_PROGRESS
+    if progress is True:
+        return TqdmProgress()
+    if callable(progress):
+        return CallbackProgress(progress)
+    if progress not in PROGRESS_SINKS:
+        message: Text = f"Unknown progress sink {progress!r}, expected one of {', '.join(PROGRESS_SINKS)}, a ProgressSink or a callable"
+        raise NASAInvalidInput(message)
+    return PROGRESS_SINKS[progress]()
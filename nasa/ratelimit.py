@@ -0,0 +1,163 @@
+import asyncio
+import time
+from threading import Lock
+from typing import Dict, List, Mapping, Optional, Sequence, Text, Tuple
+
+RATE_LIMIT_PERIOD: float = 60 * 60
+
+
+class TokenBucket:
+    def __init__(self, limit: Optional[int] = None, period: float = RATE_LIMIT_PERIOD):
+        """Token bucket holding the quota of one API key
+
+        Args:
+            limit (Optional[int], optional): Number of requests allowed per period, None means unknown and unlimited until the API reports it. Defaults to None.
+            period (float, optional): Quota period in seconds. Defaults to one hour.
+        """
+        self.period: float = period
+        self.limit: Optional[int] = None
+        self.tokens: float = 0
+        self.updated: float = time.monotonic()
+        if limit is not None:
+            self.set_limit(limit)
+
+    def set_limit(self, limit: int) -> None:
+        self.limit = limit
+        self.tokens = float(limit)
+
+    @property
+    def rate(self) -> float:
+        return self.limit / self.period
+
+    def refill(self) -> None:
+        now: float = time.monotonic()
+        if self.limit is not None:
+            self.tokens = min(
+                float(self.limit), self.tokens + (now - self.updated) * self.rate
+            )
+        self.updated = now
+
+    def available(self) -> float:
+        """Number of tokens available now, infinite while the limit is unknown"""
+        self.refill()
+        return float("inf") if self.limit is None else self.tokens
+
+    def wait_time(self) -> float:
+        """Seconds until the next token is available"""
+        self.refill()
+        if self.limit is None or self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        if self.limit is not None:
+            self.tokens -= 1
+
+    def sync(self, limit: Optional[int], remaining: Optional[int]) -> None:
+        """Synchronize the bucket with the quota reported by the API
+
+        Args:
+            limit (Optional[int]): value of X-RateLimit-Limit
+            remaining (Optional[int]): value of X-RateLimit-Remaining
+        """
+        self.refill()
+        if limit is not None and limit != self.limit:
+            self.set_limit(limit)
+        if remaining is not None and self.limit is not None:
+            self.tokens = min(self.tokens, float(remaining))
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        api_keys: Sequence[Text],
+        limit: Optional[int] = None,
+        period: float = RATE_LIMIT_PERIOD,
+    ) -> None:
+        """Pace the requests of a pool of API keys, always picking the key with the most quota left
+
+        Args:
+            api_keys (Sequence[Text]): API keys to rotate
+            limit (Optional[int], optional): Requests allowed per key and period, None to learn it from the X-RateLimit-Limit header. Defaults to None.
+            period (float, optional): Quota period in seconds. Defaults to one hour.
+        """
+        self.api_keys: Tuple[Text, ...] = tuple(api_keys)
+        self.buckets: Dict[Text, TokenBucket] = {
+            key: TokenBucket(limit, period) for key in self.api_keys
+        }
+        self._next: int = 0
+        self._lock: Lock = Lock()
+
+    def reserve(self) -> Tuple[Text, float]:
+        """Take a token from the key with the most quota left
+
+        Returns:
+            Tuple[Text, float]: API key and the seconds to wait before trying again, 0 if the token was taken
+        """
+        with self._lock:
+            # Rotating the start keeps the keys evenly used while their quota is unknown
+            order: List[Text] = list(
+                self.api_keys[self._next :] + self.api_keys[: self._next]
+            )
+            self._next = (self._next + 1) % len(self.api_keys)
+            key: Text = max(order, key=lambda k: self.buckets[k].available())
+            bucket: TokenBucket = self.buckets[key]
+            wait: float = bucket.wait_time()
+            if wait == 0:
+                bucket.take()
+            return key, wait
+
+    def acquire(self) -> Text:
+        """Block until a key has quota left and take a token from it
+
+        Returns:
+            Text: API key to use
+        """
+        while True:
+            key, wait = self.reserve()
+            if wait == 0:
+                return key
+            time.sleep(wait)
+
+    async def acquire_async(self) -> Text:
+        """Wait on the event loop until a key has quota left and take a token from it
+
+        Returns:
+            Text: API key to use
+        """
+        while True:
+            key, wait = self.reserve()
+            if wait == 0:
+                return key
+            await asyncio.sleep(wait)
+
+    def update(self, api_key: Text, status_code: int, headers: Mapping) -> None:
+        """Synchronize the quota of a key with the rate limit headers of its response
+
+        Args:
+            api_key (Text): API key used by the request
+            status_code (int): status code of the response, 429 empties the key quota
+            headers (Mapping): headers of the response
+        """
+        limit: Optional[int] = self._header(headers, "X-RateLimit-Limit")
+        remaining: Optional[int] = self._header(headers, "X-RateLimit-Remaining")
+        if status_code == 429:
+            remaining = 0
+        with self._lock:
+            self.buckets[api_key].sync(limit, remaining)
+
+    def remaining(self) -> Dict[Text, Optional[float]]:
+        """Quota left for each key, None while it is unknown"""
+        with self._lock:
+            return {
+                key: None if bucket.limit is None else bucket.available()
+                for key, bucket in self.buckets.items()
+            }
+
+    @staticmethod
+    def _header(headers: Mapping, name: Text) -> Optional[int]:
+        value: Optional[Text] = headers.get(name)
+        try:
+            return None if value is None else int(value)
+        except ValueError:
+            return None
@@ -0,0 +1,215 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Text
+
+from nasa.exceptions import NASACircuitOpen
+
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+CLOSED: Text = "closed"
+OPEN: Text = "open"
+HALF_OPEN: Text = "half-open"
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        statuses: Iterable[int] = RETRY_STATUSES,
+        max_retry_after: float = 60,
+    ) -> None:
+        """How a failed request is retried: exponential backoff with full jitter, honouring Retry-After
+
+        Args:
+            max_attempts (int, optional): Number of attempts including the first one, 1 disables retries. Defaults to 3.
+            backoff (float, optional): Base delay in seconds, doubled on every attempt. Defaults to 0.5.
+            max_backoff (float, optional): Maximum delay in seconds between two attempts. Defaults to 30.
+            jitter (bool, optional): If True, sleep a random delay between 0 and the backoff so clients do not retry in lockstep. Defaults to True.
+            statuses (Iterable[int], optional): Status codes which are retried. Defaults to 429 and the 5xx gateway errors.
+            max_retry_after (float, optional): A response asking to wait longer than this many seconds in Retry-After is not retried. Defaults to 60.
+        """
+        self.max_attempts: int = max_attempts
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.jitter: bool = jitter
+        self.statuses: FrozenSet[int] = frozenset(statuses)
+        self.max_retry_after: float = max_retry_after
+
+    def delay(self, attempt: int, headers: Optional[Mapping] = None) -> Optional[float]:
+        """Seconds to wait before the next attempt
+
+        Args:
+            attempt (int): number of attempts already made, starting at 1
+            headers (Optional[Mapping], optional): headers of the failed response, if any. Defaults to None.
+
+        Returns:
+            Optional[float]: delay before retrying, None if the request should not be retried
+        """
+        if attempt >= self.max_attempts:
+            return None
+        retry_after: Optional[float] = parse_retry_after(headers)
+        if retry_after is not None:
+            return None if retry_after > self.max_retry_after else retry_after
+        backoff: float = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, backoff={self.backoff}, "
+            f"max_backoff={self.max_backoff}, jitter={self.jitter})"
+        )
+
+
+NO_RETRY: RetryPolicy = RetryPolicy(max_attempts=1)
+
+DEFAULT_RETRY_POLICIES: Dict[Text, RetryPolicy] = {"": RetryPolicy()}
+
+
+def retry_policy(path: Text, policies: Dict[Text, RetryPolicy]) -> RetryPolicy:
+    """Get the retry policy of a path from the entry with the longest matching path prefix
+
+    Args:
+        path (Text): path of the request
+        policies (Dict[Text, RetryPolicy]): retry policies by path prefix
+
+    Returns:
+        RetryPolicy: retry policy of the path, NO_RETRY if no prefix matches
+    """
+    prefixes: List[Text] = [prefix for prefix in policies if path.startswith(prefix)]
+    if not prefixes:
+        return NO_RETRY
+    return policies[max(prefixes, key=len)]
+
+
+def parse_retry_after(headers: Optional[Mapping]) -> Optional[float]:
+    """Parse the Retry-After header, given in seconds or as an HTTP date
+
+    Args:
+        headers (Optional[Mapping]): headers of the response
+
+    Returns:
+        Optional[float]: seconds to wait, None if the header is missing or invalid
+    """
+    value: Optional[Text] = None if headers is None else headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def upstream(path: Text) -> Text:
+    """Name of the service answering a path, e.g. "DONKI" or "EPIC"
+
+    The APIs under /planetary are different services, so they are told apart by
+    their second segment.
+    """
+    segments: List[Text] = path.strip("/").split("/")
+    if segments[0] == "planetary" and len(segments) > 1:
+        return "/".join(segments[:2])
+    return segments[0]
+
+
+class CircuitState:
+    def __init__(self) -> None:
+        self.state: Text = CLOSED
+        self.failures: int = 0
+        self.opened: float = 0
+
+
+class CircuitBreaker:
+    def __init__(
+        self, failure_threshold: int = 5, recovery_timeout: float = 30
+    ) -> None:
+        """Fail fast while an upstream service is down instead of piling up requests on it
+
+        Every upstream, e.g. DONKI or EPIC, has its own circuit. It opens after
+        failure_threshold consecutive failures, then requests fail at once with
+        NASACircuitOpen until recovery_timeout has passed. A single trial request
+        is then let through, which closes the circuit on success or opens it again
+        on failure, and another one is let through if it is still running after
+        recovery_timeout or ends without an answer of the upstream, e.g. cancelled.
+
+        Args:
+            failure_threshold (int, optional): Consecutive 5xx responses or connection errors opening the circuit. Defaults to 5.
+            recovery_timeout (float, optional): Seconds the circuit stays open before a trial request. Defaults to 30.
+        """
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+        self.circuits: Dict[Text, CircuitState] = dict()
+        self._lock: Lock = Lock()
+
+    def _circuit(self, name: Text) -> CircuitState:
+        if name not in self.circuits:
+            self.circuits[name] = CircuitState()
+        return self.circuits[name]
+
+    def before_call(self, path: Text) -> None:
+        """Check the circuit of the upstream before sending a request
+
+        Args:
+            path (Text): path of the request
+
+        Raises:
+            NASACircuitOpen: Raised when the circuit is open, or half-open with a trial request running
+        """
+        name: Text = upstream(path)
+        with self._lock:
+            circuit: CircuitState = self._circuit(name)
+            if circuit.state == CLOSED:
+                return
+            now: float = time.monotonic()
+            waited: float = now - circuit.opened
+            # A trial request whose outcome was never recorded is replaced by a new one
+            if waited >= self.recovery_timeout:
+                circuit.state = HALF_OPEN
+                circuit.opened = now
+                return
+        message: Text = f"{name} is failing, requests are paused for {max(0.0, self.recovery_timeout - waited):.1f} seconds"
+        raise NASACircuitOpen(message)
+
+    def record_success(self, path: Text) -> None:
+        with self._lock:
+            circuit: CircuitState = self._circuit(upstream(path))
+            circuit.state = CLOSED
+            circuit.failures = 0
+
+    def record_failure(self, path: Text) -> None:
+        with self._lock:
+            circuit: CircuitState = self._circuit(upstream(path))
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened = time.monotonic()
+
+    def release(self, path: Text) -> None:
+        """Record a request which ended without an answer of the upstream, e.g. cancelled
+
+        It is neither a success nor a failure, but a trial request gives its slot
+        back so the next request is let through at once.
+        """
+        with self._lock:
+            circuit: CircuitState = self._circuit(upstream(path))
+            if circuit.state == HALF_OPEN:
+                circuit.state = OPEN
+                circuit.opened = time.monotonic() - self.recovery_timeout
+
+    def state(self, path: Text) -> Text:
+        """State of the circuit of the upstream answering a path: "closed", "open" or "half-open" """
+        with self._lock:
+            return self._circuit(upstream(path)).state
+
+    @staticmethod
+    def is_failure(status_code: int) -> bool:
+        # 429 means the key ran out of quota, the upstream itself is healthy
+        return status_code // 100 == 5
@@ -0,0 +1,32 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """Create a requests Session backed by a pooled HTTP adapter
+
+    Args:
+        pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+        pool_maxsize (int, optional): Maximum number of connections kept open per host. Defaults to 10.
+        pool_block (bool, optional): If True, block when a host pool is exhausted instead of opening an extra connection, so pool_maxsize becomes a hard per-host limit. Defaults to False.
+        keep_alive (bool, optional): If False, send `Connection: close` so every connection is torn down after its response. Defaults to True.
+
+    Returns:
+        requests.Session: Session to be shared by every request of a client
+    """
+    session: requests.Session = requests.Session()
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
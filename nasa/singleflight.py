@@ -0,0 +1,91 @@
+import asyncio
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Text, Tuple
+
+
+class Call:
+    """Request in flight, waited on by the threads asking for the same key"""
+
+    def __init__(self) -> None:
+        self.done: Event = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        """Share one call between the threads asking for the same key at the same time"""
+        self._calls: Dict[Text, Call] = dict()
+        self._lock: Lock = Lock()
+
+    def do(self, key: Text, function: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Call function, unless a call with the same key is in flight, then wait for its result
+
+        Args:
+            key (Text): identity of the call, e.g. `nasa.cache.cache_key` of a request
+            function (Callable[[], Any]): call to be shared
+
+        Raises:
+            Exception: the error raised by the shared call, in every waiting thread
+
+        Returns:
+            Tuple[Any, bool]: result of the call, and whether it was shared with another thread
+        """
+        with self._lock:
+            call: Optional[Call] = self._calls.get(key)
+            leader: bool = call is None
+            if leader:
+                call = self._calls[key] = Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class AsyncSingleFlight:
+    def __init__(self) -> None:
+        """Share one call between the coroutines asking for the same key at the same time"""
+        self._calls: Dict[Text, asyncio.Task] = dict()
+
+    async def do(
+        self, key: Text, function: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """Await function, unless a call with the same key is in flight, then wait for its result
+
+        The call runs in its own task, which every caller awaits through a shield,
+        so cancelling any caller, the first one included, leaves it to the others.
+
+        Args:
+            key (Text): identity of the call, e.g. `nasa.cache.cache_key` of a request
+            function (Callable[[], Awaitable[Any]]): coroutine function to be shared
+
+        Raises:
+            Exception: the error raised by the shared call, in every waiting coroutine
+
+        Returns:
+            Tuple[Any, bool]: result of the call, and whether it was shared with another coroutine
+        """
+        task: Optional[asyncio.Task] = self._calls.get(key)
+        shared: bool = task is not None
+        if not shared:
+            task = self._calls[key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: Text, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the error as retrieved when every caller was cancelled
+            task.exception()
@@ -0,0 +1,25 @@
+from importlib import import_module
+from typing import Any, Dict, List, Text
+
+# Stores are imported on first access, each pulls in its client
+_LAZY_ATTRIBUTES: Dict[Text, Text] = {
+    "DonkiStore": "nasa.stores.donki",
+    "MarsPhotoStore": "nasa.stores.mars",
+    "SQLiteStore": "nasa.stores.base",
+    "TechPortStore": "nasa.stores.techport",
+    "TechTransferIndex": "nasa.stores.tech_transfer",
+}
+
+__all__: List[Text] = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: Text) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[Text]:
+    return sorted(list(globals()) + __all__)
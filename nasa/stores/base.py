@@ -0,0 +1,79 @@
+import sqlite3
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Text
+
+
+class SQLiteStore:
+    SCHEMA: Sequence[Text] = ()
+
+    def __init__(self, path: Text = ":memory:") -> None:
+        """Local SQLite database mirroring API data, shared by the threads of a process
+
+        Every store keeps its sync state, e.g. high-water marks, in the `sync_state` table.
+
+        Args:
+            path (Text, optional): database file, created if missing. Defaults to ":memory:".
+        """
+        self.path: Text = path
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            path, check_same_thread=False
+        )
+        self._connection.row_factory = sqlite3.Row
+        self._lock: RLock = RLock()
+        with self._lock, self._connection:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            for statement in self.SCHEMA:
+                self._connection.execute(statement)
+
+    def query(self, sql: Text, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def execute_many(
+        self,
+        sql: Text,
+        rows: Iterable[Sequence[Any]],
+        state: Optional[Dict[Text, Text]] = None,
+    ) -> None:
+        """Run a statement for every row and update the sync state in one transaction
+
+        Args:
+            sql (Text): statement with placeholders
+            rows (Iterable[Sequence[Any]]): parameters of every run
+            state (Optional[Dict[Text, Text]], optional): sync state values to be set with the rows. Defaults to None.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(sql, rows)
+            for name, value in (state or dict()).items():
+                self._set_state(name, value)
+
+    def get_state(self, name: Text) -> Optional[Text]:
+        rows: List[sqlite3.Row] = self.query(
+            "SELECT value FROM sync_state WHERE name = ?", (name,)
+        )
+        return rows[0]["value"] if rows else None
+
+    def set_state(self, name: Text, value: Text) -> None:
+        with self._lock, self._connection:
+            self._set_state(name, value)
+
+    def _set_state(self, name: Text, value: Text) -> None:
+        self._connection.execute(
+            "INSERT INTO sync_state (name, value) VALUES (?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+            (name, value),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -0,0 +1,233 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Text,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from nasa.clients.donki import DonkiClient
+from nasa.stores.base import SQLiteStore
+from nasa.typing import IsoDate, IsoDateConvertible, JSONType
+
+if TYPE_CHECKING:
+    from sqlite3 import Row
+
+# Event types polled by `DonkiStore.sync` when none are given
+DONKI_SYNC_TYPES: List[Text] = [
+    "CME",
+    "GST",
+    "IPS",
+    "FLR",
+    "SEP",
+    "MPC",
+    "RBE",
+    "HSS",
+    "notifications",
+]
+
+# Field holding the time an event is indexed by, for every API type
+DONKI_TIME_FIELDS: Dict[Text, Text] = {
+    "CME": "startTime",
+    "CMEAnalysis": "time21_5",
+    "GST": "startTime",
+    "IPS": "eventTime",
+    "FLR": "beginTime",
+    "SEP": "eventTime",
+    "MPC": "eventTime",
+    "RBE": "eventTime",
+    "HSS": "eventTime",
+    "WSAEnlilSimulations": "modelCompletionTime",
+    "notifications": "messageIssueTime",
+}
+
+# Days fetched when an event type is synced for the first time
+DEFAULT_BACKFILL_DAYS: int = 30
+
+
+class DonkiStore(SQLiteStore):
+    SCHEMA: Sequence[Text] = (
+        "CREATE TABLE IF NOT EXISTS donki_events ("
+        "api_type TEXT NOT NULL, "
+        "event_id TEXT NOT NULL, "
+        "event_time TEXT, "
+        "body TEXT NOT NULL, "
+        "PRIMARY KEY (api_type, event_id))",
+        "CREATE INDEX IF NOT EXISTS donki_events_time ON donki_events (event_time)",
+        "CREATE INDEX IF NOT EXISTS donki_events_type_time "
+        "ON donki_events (api_type, event_time)",
+    )
+
+    def __init__(self, path: Text = ":memory:", overlap_days: int = 1) -> None:
+        """Local SQLite store of DONKI events, kept up to date by incremental syncs
+
+        The store keeps a high-water mark per event type, the last day it was
+        synced up to. A sync only requests the days since then, plus overlap_days
+        to catch the events published or revised late, and upserts the events
+        by their ID so those seen again replace their previous version.
+
+        Args:
+            path (Text, optional): database file, created if missing. Defaults to ":memory:".
+            overlap_days (int, optional): days before the high-water mark fetched again on every sync. Defaults to 1.
+        """
+        super().__init__(path)
+        self.overlap_days: int = overlap_days
+
+    @staticmethod
+    def _state_name(api_type: Text) -> Text:
+        return f"donki:{api_type}"
+
+    def high_water_mark(self, api_type: Text) -> Optional[date]:
+        """Last day the events of a type were synced up to, None if they never were"""
+        value: Optional[Text] = self.get_state(self._state_name(api_type))
+        return None if value is None else date.fromisoformat(value)
+
+    def sync(
+        self,
+        client: DonkiClient,
+        api_types: Iterable[Text] = DONKI_SYNC_TYPES,
+        start_date: Optional[IsoDateConvertible] = None,
+        max_workers: int = 4,
+    ) -> Dict[Text, int]:
+        """Fetch the events published since the last sync of every type and upsert them
+
+        Args:
+            client (DonkiClient): client fetching the events, e.g. `nasa.Client`
+            api_types (Iterable[Text], optional): event types to sync. Defaults to DONKI_SYNC_TYPES.
+            start_date (Optional[IsoDateConvertible], optional): first day of the types never synced before. Defaults to None, 30 days ago.
+            max_workers (int, optional): Number of event types fetched at the same time. Defaults to 4.
+
+        Raises:
+            NASAInvalidInput: Raised when an event type is invalid
+
+        Returns:
+            Dict[Text, int]: number of events received by event type
+        """
+        today: date = date.today()
+        first: date = IsoDate(start_date).dt or today - timedelta(
+            days=DEFAULT_BACKFILL_DAYS
+        )
+        windows: Dict[Text, Tuple[date, date]] = dict()
+        for api_type in api_types:
+            mark: Optional[date] = self.high_water_mark(api_type)
+            start: date = (
+                first if mark is None else mark - timedelta(days=self.overlap_days)
+            )
+            windows[api_type] = (start, today)
+
+        def fetch(api_type: Text) -> JSONType:
+            start, end = windows[api_type]
+            return client.donki_range(api_type, start, end, max_workers=1)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses: List[JSONType] = list(executor.map(fetch, windows))
+        counts: Dict[Text, int] = dict()
+        for api_type, events in zip(windows, responses):
+            counts[api_type] = self.upsert(api_type, events, today)
+        return counts
+
+    def upsert(
+        self,
+        api_type: Text,
+        events: Iterable[JSONType],
+        high_water_mark: Optional[date] = None,
+    ) -> int:
+        """Insert the events, replacing the stored ones with the same ID
+
+        Args:
+            api_type (Text): API type of the events
+            events (Iterable[JSONType]): DONKI events
+            high_water_mark (Optional[date], optional): day the events of the type are now synced up to, set in the same transaction. Defaults to None.
+
+        Returns:
+            int: number of events written
+        """
+        time_field: Optional[Text] = DONKI_TIME_FIELDS.get(api_type)
+        rows: List[Tuple[Text, Text, Optional[Text], Text]] = [
+            (
+                api_type,
+                DonkiClient._donki_event_id(api_type, event),
+                None if time_field is None else event.get(time_field),
+                json.dumps(event),
+            )
+            for event in events or list()
+        ]
+        state: Dict[Text, Text] = dict()
+        if high_water_mark is not None:
+            state[self._state_name(api_type)] = high_water_mark.isoformat()
+        self.execute_many(
+            "INSERT INTO donki_events (api_type, event_id, event_time, body) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT (api_type, event_id) DO UPDATE SET "
+            "event_time = excluded.event_time, body = excluded.body",
+            rows,
+            state,
+        )
+        return len(rows)
+
+    def _where(
+        self,
+        api_type: Optional[Text],
+        start_date: Optional[IsoDateConvertible],
+        end_date: Optional[IsoDateConvertible],
+    ) -> Tuple[Text, List[Any]]:
+        clauses: List[Text] = list()
+        params: List[Any] = list()
+        if api_type is not None:
+            clauses.append("api_type = ?")
+            params.append(api_type)
+        start: Optional[date] = IsoDate(start_date).dt
+        if start is not None:
+            clauses.append("event_time >= ?")
+            params.append(start.strftime("%Y-%m-%d"))
+        end: Optional[date] = IsoDate(end_date).dt
+        if end is not None:
+            # Event times carry the time of the day, the end day is included
+            clauses.append("event_time < ?")
+            params.append((end + timedelta(days=1)).strftime("%Y-%m-%d"))
+        where: Text = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def events(
+        self,
+        api_type: Optional[Text] = None,
+        start_date: Optional[IsoDateConvertible] = None,
+        end_date: Optional[IsoDateConvertible] = None,
+        limit: Optional[int] = None,
+    ) -> List[JSONType]:
+        """Stored events, by event time
+
+        Args:
+            api_type (Optional[Text], optional): API type of the events, None for every type. Defaults to None.
+            start_date (Optional[IsoDateConvertible], optional): first day of the events. Defaults to None.
+            end_date (Optional[IsoDateConvertible], optional): last day of the events, included. Defaults to None.
+            limit (Optional[int], optional): maximum number of events. Defaults to None.
+
+        Returns:
+            List[JSONType]: DONKI events as returned by the API
+        """
+        where, params = self._where(api_type, start_date, end_date)
+        sql: Text = (
+            f"SELECT body FROM donki_events{where} ORDER BY event_time, event_id"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows: List["Row"] = self.query(sql, params)
+        return [json.loads(row["body"]) for row in rows]
+
+    def count(
+        self,
+        api_type: Optional[Text] = None,
+        start_date: Optional[IsoDateConvertible] = None,
+        end_date: Optional[IsoDateConvertible] = None,
+    ) -> int:
+        """Number of stored events, see `DonkiStore.events`"""
+        where, params = self._where(api_type, start_date, end_date)
+        return self.query(f"SELECT COUNT(*) FROM donki_events{where}", params)[0][0]
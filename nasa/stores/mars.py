@@ -0,0 +1,239 @@
+import math
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Sequence, Text, Tuple, TYPE_CHECKING
+
+from nasa.clients.mars_rover_photos import MarsRoverPhotosClient
+from nasa.stores.base import SQLiteStore
+from nasa.typing import IsoDate, IsoDateConvertible, JSONType
+
+if TYPE_CHECKING:
+    from sqlite3 import Row
+
+# Columns of the indexed photos, in the order they are returned
+MARS_PHOTO_COLUMNS: List[Text] = [
+    "id",
+    "rover",
+    "sol",
+    "earth_date",
+    "camera",
+    "img_src",
+]
+
+
+class MarsPhotoStore(SQLiteStore):
+    SCHEMA: Sequence[Text] = (
+        "CREATE TABLE IF NOT EXISTS mars_photos ("
+        "id INTEGER PRIMARY KEY, "
+        "rover TEXT NOT NULL, "
+        "sol INTEGER NOT NULL, "
+        "earth_date TEXT, "
+        "camera TEXT, "
+        "img_src TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS mars_photos_sol ON mars_photos (rover, sol)",
+        "CREATE INDEX IF NOT EXISTS mars_photos_earth_date "
+        "ON mars_photos (rover, earth_date)",
+        "CREATE INDEX IF NOT EXISTS mars_photos_camera "
+        "ON mars_photos (rover, camera, sol)",
+        "CREATE TABLE IF NOT EXISTS mars_sols ("
+        "rover TEXT NOT NULL, "
+        "sol INTEGER NOT NULL, "
+        "total_photos INTEGER NOT NULL, "
+        "PRIMARY KEY (rover, sol))",
+    )
+
+    def __init__(self, path: Text = ":memory:") -> None:
+        """Local SQLite index of the Mars rover photos metadata, harvested once per sol
+
+        A sync reads the mission manifest of the rover and only fetches the sols
+        which are not indexed yet, or to which the manifest added photos since,
+        so indexed sols never call the photos API again.
+
+        Args:
+            path (Text, optional): database file, created if missing. Defaults to ":memory:".
+        """
+        super().__init__(path)
+
+    def indexed_sols(self, rover: Text) -> Dict[int, int]:
+        """Number of photos of every indexed sol of a rover, as reported by its manifest"""
+        rows: List["Row"] = self.query(
+            "SELECT sol, total_photos FROM mars_sols WHERE rover = ?", (rover,)
+        )
+        return {row["sol"]: row["total_photos"] for row in rows}
+
+    def sync(
+        self,
+        client: MarsRoverPhotosClient,
+        rover: Text,
+        start_sol: int = 0,
+        end_sol: Optional[int] = None,
+        max_workers: int = 4,
+    ) -> Dict[int, int]:
+        """Index the photos of the sols of a rover which are new since the last sync
+
+        Every sol is written in its own transaction as soon as its pages arrive,
+        so an interrupted sync resumes with the sols it did not finish.
+
+        Args:
+            client (MarsRoverPhotosClient): client fetching the photos, e.g. `nasa.Client`
+            rover (Text): Rover Name, currently supports "curiousity", "opportunity", "spirit"
+            start_sol (int, optional): first sol to index. Defaults to 0.
+            end_sol (Optional[int], optional): last sol to index, included. Defaults to None, the last sol of the manifest.
+            max_workers (int, optional): Number of sols fetched at the same time. Defaults to 4.
+
+        Raises:
+            NASAInvalidInput: Raised when Mars Rover input is invalid
+
+        Returns:
+            Dict[int, int]: number of photos indexed by sol fetched
+        """
+        manifest: JSONType = client.mars_rover_manifest(rover)["photo_manifest"]
+        last_sol: int = manifest["max_sol"] if end_sol is None else end_sol
+        indexed: Dict[int, int] = self.indexed_sols(rover)
+        # Photos downlinked late grow the total of a sol, which is then fetched again
+        pending: Dict[int, int] = {
+            entry["sol"]: entry["total_photos"]
+            for entry in manifest["photos"]
+            if start_sol <= entry["sol"] <= last_sol
+            and indexed.get(entry["sol"]) != entry["total_photos"]
+        }
+
+        def fetch(sol: int) -> List[JSONType]:
+            pages: int = math.ceil(pending[sol] / client.MARS_ROVER_PHOTOS_PAGE_SIZE)
+            photos: List[JSONType] = list()
+            for page in range(1, pages + 1):
+                photos.extend(
+                    client.mars_rover_photos(rover, sol=sol, page=page)["photos"]
+                )
+            return photos
+
+        counts: Dict[int, int] = dict()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: Dict[Future, int] = {
+                executor.submit(fetch, sol): sol for sol in sorted(pending)
+            }
+            for future in as_completed(futures):
+                sol: int = futures[future]
+                counts[sol] = self.upsert(rover, sol, future.result(), pending[sol])
+        return dict(sorted(counts.items()))
+
+    def upsert(
+        self,
+        rover: Text,
+        sol: int,
+        photos: List[JSONType],
+        total_photos: Optional[int] = None,
+    ) -> int:
+        """Replace the indexed photos of a sol
+
+        Args:
+            rover (Text): Rover Name
+            sol (int): sol of the photos
+            photos (List[JSONType]): photos of the sol, as returned by `mars_rover_photos`
+            total_photos (Optional[int], optional): photos of the sol in the manifest, marking it as indexed. Defaults to None, the number of photos.
+
+        Returns:
+            int: number of photos written
+        """
+        rows: List[Tuple[int, Text, int, Optional[Text], Optional[Text], Text]] = [
+            (
+                photo["id"],
+                rover,
+                sol,
+                photo.get("earth_date"),
+                (photo.get("camera") or dict()).get("name"),
+                photo["img_src"],
+            )
+            for photo in photos
+        ]
+        total: int = len(rows) if total_photos is None else total_photos
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM mars_photos WHERE rover = ? AND sol = ?", (rover, sol)
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO mars_photos "
+                "(id, rover, sol, earth_date, camera, img_src) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO mars_sols (rover, sol, total_photos) "
+                "VALUES (?, ?, ?)",
+                (rover, sol, total),
+            )
+        return len(rows)
+
+    def _where(
+        self,
+        rover: Optional[Text],
+        camera: Optional[Text],
+        start_sol: Optional[int],
+        end_sol: Optional[int],
+        start_date: Optional[IsoDateConvertible],
+        end_date: Optional[IsoDateConvertible],
+    ) -> Tuple[Text, List[Any]]:
+        conditions: List[Tuple[Text, Any]] = [
+            ("rover = ?", rover),
+            ("camera = ?", None if camera == "all" else camera),
+            ("sol >= ?", start_sol),
+            ("sol <= ?", end_sol),
+            ("earth_date >= ?", IsoDate.cached_value(start_date)),
+            ("earth_date <= ?", IsoDate.cached_value(end_date)),
+        ]
+        clauses: List[Text] = [
+            clause for clause, value in conditions if value is not None
+        ]
+        params: List[Any] = [value for _, value in conditions if value is not None]
+        where: Text = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def photos(
+        self,
+        rover: Optional[Text] = None,
+        camera: Optional[Text] = None,
+        start_sol: Optional[int] = None,
+        end_sol: Optional[int] = None,
+        start_date: Optional[IsoDateConvertible] = None,
+        end_date: Optional[IsoDateConvertible] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[Text, Any]]:
+        """Indexed photos, by sol and ID
+
+        Args:
+            rover (Optional[Text], optional): Rover Name, None for every rover. Defaults to None.
+            camera (Optional[Text], optional): camera name abbreviation, None or "all" for every camera. Defaults to None.
+            start_sol (Optional[int], optional): first sol. Defaults to None.
+            end_sol (Optional[int], optional): last sol, included. Defaults to None.
+            start_date (Optional[IsoDateConvertible], optional): first earth date. Defaults to None.
+            end_date (Optional[IsoDateConvertible], optional): last earth date, included. Defaults to None.
+            limit (Optional[int], optional): maximum number of photos. Defaults to None.
+
+        Returns:
+            List[Dict[Text, Any]]: id, rover, sol, earth_date, camera and img_src of every photo
+        """
+        where, params = self._where(
+            rover, camera, start_sol, end_sol, start_date, end_date
+        )
+        sql: Text = (
+            f"SELECT {', '.join(MARS_PHOTO_COLUMNS)} FROM mars_photos{where} "
+            "ORDER BY sol, id"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self.query(sql, params)]
+
+    def count(
+        self,
+        rover: Optional[Text] = None,
+        camera: Optional[Text] = None,
+        start_sol: Optional[int] = None,
+        end_sol: Optional[int] = None,
+        start_date: Optional[IsoDateConvertible] = None,
+        end_date: Optional[IsoDateConvertible] = None,
+    ) -> int:
+        """Number of indexed photos, see `MarsPhotoStore.photos`"""
+        where, params = self._where(
+            rover, camera, start_sol, end_sol, start_date, end_date
+        )
+        return self.query(f"SELECT COUNT(*) FROM mars_photos{where}", params)[0][0]
@@ -0,0 +1,281 @@
+import heapq
+import json
+import math
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Text,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from nasa.clients.tech_transfer import TechTransferClient
+from nasa.exceptions import NASAInvalidInput
+from nasa.stores.base import SQLiteStore
+from nasa.typing import JSONType
+
+if TYPE_CHECKING:
+    from sqlite3 import Row
+
+# Positions of the searchable texts in a result row: case number, title, description and category
+TECH_TRANSFER_TEXT_FIELDS: Sequence[int] = (1, 2, 3, 5)
+
+TAG: Pattern = re.compile(r"<[^>]*>")
+TOKEN: Pattern = re.compile(r"[a-z0-9]+")
+
+# Okapi BM25 parameters
+BM25_K1: float = 1.2
+BM25_B: float = 0.75
+
+
+def tokenize(text: Text) -> List[Text]:
+    """Lower case words of a text, without the highlight markup of the API"""
+    return TOKEN.findall(TAG.sub(" ", text).lower())
+
+
+class InvertedIndex:
+    def __init__(self, documents: Iterable[Tuple[Any, Text]]) -> None:
+        """In-memory inverted index ranking its documents with Okapi BM25
+
+        The corpus only changes when the index is rebuilt, so the BM25 weight of
+        every term in every document is computed once here and the postings are
+        sorted by weight: a one word search is a slice, longer ones add weights up.
+
+        Args:
+            documents (Iterable[Tuple[Any, Text]]): key and text of every document
+        """
+        self.keys: List[Any] = list()
+        lengths: List[int] = list()
+        frequencies: Dict[Text, Dict[int, int]] = dict()
+        for key, text in documents:
+            document: int = len(self.keys)
+            terms: Counter = Counter(tokenize(text))
+            self.keys.append(key)
+            lengths.append(sum(terms.values()))
+            for term, frequency in terms.items():
+                frequencies.setdefault(term, dict())[document] = frequency
+        # Documents without any token, e.g. only markup, must not divide by zero
+        average_length: float = (sum(lengths) / len(lengths) if lengths else 0.0) or 1.0
+        norms: List[float] = [
+            BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+            for length in lengths
+        ]
+        self.postings: Dict[Text, List[Tuple[int, float]]] = dict()
+        for term, documents_frequency in frequencies.items():
+            count: int = len(documents_frequency)
+            idf: float = math.log(1 + (len(self.keys) - count + 0.5) / (count + 0.5))
+            weights: List[Tuple[int, float]] = [
+                (
+                    document,
+                    idf * frequency * (BM25_K1 + 1) / (frequency + norms[document]),
+                )
+                for document, frequency in documents_frequency.items()
+            ]
+            # Ties keep the order of the documents
+            weights.sort(key=lambda item: (-item[1], item[0]))
+            self.postings[term] = weights
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def search(self, query: Text, limit: Optional[int] = 10) -> List[Tuple[Any, float]]:
+        """Documents matching any word of the query, best first
+
+        Args:
+            query (Text): words searched
+            limit (Optional[int], optional): maximum number of documents, None for all of them. Defaults to 10.
+
+        Returns:
+            List[Tuple[Any, float]]: key and score of the matching documents
+        """
+        terms: List[Text] = [
+            term for term in dict.fromkeys(tokenize(query)) if term in self.postings
+        ]
+        ranked: Iterable[Tuple[int, float]]
+        if len(terms) == 1:
+            ranked = self.postings[terms[0]][:limit]
+        else:
+            scores: Dict[int, float] = dict()
+            for term in terms:
+                for document, weight in self.postings[term]:
+                    scores[document] = scores.get(document, 0.0) + weight
+            ranked = (
+                sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+                if limit is None
+                else heapq.nsmallest(
+                    limit, scores.items(), key=lambda item: (-item[1], item[0])
+                )
+            )
+        return [(self.keys[document], score) for document, score in ranked]
+
+
+class TechTransferIndex(SQLiteStore):
+    SCHEMA: Sequence[Text] = (
+        "CREATE TABLE IF NOT EXISTS tech_transfer_results ("
+        "api_type TEXT NOT NULL, "
+        "position INTEGER NOT NULL, "
+        "result TEXT NOT NULL, "
+        "PRIMARY KEY (api_type, position))",
+    )
+
+    def __init__(self, path: Text = ":memory:") -> None:
+        """Local mirror of the TechTransfer corpora with a ranked full-text index
+
+        `mirror` downloads every result of the patent, patent_issued, software and
+        Spinoff corpora into SQLite, then keyword searches are answered by an
+        in-memory BM25 index instead of the API. Mirroring again, e.g. on a
+        schedule, replaces the stored results and rebuilds the index.
+
+        Args:
+            path (Text, optional): database file, created if missing. Defaults to ":memory:".
+        """
+        super().__init__(path)
+        # Results by api_type and their index, swapped together so searches see a consistent pair
+        self._snapshot: Tuple[Dict[Text, List[JSONType]], InvertedIndex] = (
+            dict(),
+            InvertedIndex(()),
+        )
+        self._build()
+
+    @staticmethod
+    def _state_name(api_type: Text) -> Text:
+        return f"techtransfer:{api_type}"
+
+    def mirrored_at(self, api_type: Text) -> Optional[datetime]:
+        """Time the results of a type were last mirrored, None if they never were"""
+        value: Optional[Text] = self.get_state(self._state_name(api_type))
+        return None if value is None else datetime.fromisoformat(value)
+
+    def mirror(
+        self,
+        client: TechTransferClient,
+        api_types: Iterable[Text] = TechTransferClient.TECH_TRANSFER_TYPES,
+        max_workers: int = 4,
+    ) -> Dict[Text, int]:
+        """Download every result of the corpora and rebuild the index
+
+        Args:
+            client (TechTransferClient): client fetching the results, e.g. `nasa.Client`
+            api_types (Iterable[Text], optional): corpora to mirror. Defaults to every one.
+            max_workers (int, optional): Number of corpora fetched at the same time. Defaults to 4.
+
+        Raises:
+            NASAInvalidInput: Raised when an api_type is invalid
+
+        Returns:
+            Dict[Text, int]: number of results by api_type
+        """
+        api_types = list(api_types)
+        for api_type in api_types:
+            if api_type not in TechTransferClient.TECH_TRANSFER_TYPES:
+                message: Text = f"Invalid api_type {api_type}. Valid api_type values are {tuple(TechTransferClient.TECH_TRANSFER_TYPES)}"
+                raise NASAInvalidInput(message)
+
+        def fetch(api_type: Text) -> List[JSONType]:
+            return self._fetch_all(client, api_type)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            corpora: List[List[JSONType]] = list(executor.map(fetch, api_types))
+        now: Text = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._connection:
+            for api_type, results in zip(api_types, corpora):
+                self._connection.execute(
+                    "DELETE FROM tech_transfer_results WHERE api_type = ?",
+                    (api_type,),
+                )
+                self._connection.executemany(
+                    "INSERT INTO tech_transfer_results (api_type, position, result) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (api_type, position, json.dumps(result))
+                        for position, result in enumerate(results)
+                    ],
+                )
+                self._set_state(self._state_name(api_type), now)
+        self._build()
+        return {api_type: len(results) for api_type, results in zip(api_types, corpora)}
+
+    @staticmethod
+    def _fetch_all(client: TechTransferClient, api_type: Text) -> List[JSONType]:
+        """Every result of a corpus, page after page until the total is reached
+
+        Results are deduplicated by their ID, so the loop also ends on a page
+        bringing nothing new whether the API counts pages from 0 or 1.
+        """
+        results: Dict[Text, JSONType] = dict()
+        page: int = 0
+        while True:
+            response: JSONType = client.tech_transfer(api_type, page=page)
+            size: int = len(results)
+            for result in response.get("results") or list():
+                results.setdefault(result[0], result)
+            if len(results) == size or len(results) >= response.get("total", 0):
+                return list(results.values())
+            page += 1
+
+    def _build(self) -> None:
+        rows: List["Row"] = self.query(
+            "SELECT api_type, result FROM tech_transfer_results "
+            "ORDER BY api_type, position"
+        )
+        results: Dict[Text, List[JSONType]] = dict()
+        documents: List[Tuple[Tuple[Text, int], Text]] = list()
+        for row in rows:
+            result: JSONType = json.loads(row["result"])
+            corpus: List[JSONType] = results.setdefault(row["api_type"], list())
+            text: Text = " ".join(
+                str(result[field])
+                for field in TECH_TRANSFER_TEXT_FIELDS
+                if field < len(result) and result[field]
+            )
+            documents.append(((row["api_type"], len(corpus)), text))
+            corpus.append(result)
+        # Searches running meanwhile keep the previous snapshot until the swap
+        self._snapshot = (results, InvertedIndex(documents))
+
+    def results(self, api_type: Text) -> List[JSONType]:
+        """Mirrored results of a corpus, in the order of the API"""
+        results, _ = self._snapshot
+        return list(results.get(api_type, list()))
+
+    def search(
+        self,
+        keyword: Text,
+        api_types: Optional[Iterable[Text]] = None,
+        limit: Optional[int] = 10,
+    ) -> List[Dict[Text, Any]]:
+        """Rank the mirrored results matching any word of the keyword
+
+        Args:
+            keyword (Text): words searched in the case number, title, description and category
+            api_types (Optional[Iterable[Text]], optional): corpora searched, None for every one. Defaults to None.
+            limit (Optional[int], optional): maximum number of results, None for all of them. Defaults to 10.
+
+        Returns:
+            List[Dict[Text, Any]]: "api_type", "score" and "result", the row returned by the API, best first
+        """
+        results, index = self._snapshot
+        types: Optional[Set[Text]] = None if api_types is None else set(api_types)
+        hits: List[Tuple[Tuple[Text, int], float]] = index.search(
+            keyword, limit if types is None else None
+        )
+        matches: List[Dict[Text, Any]] = [
+            {
+                "api_type": api_type,
+                "score": score,
+                "result": results[api_type][position],
+            }
+            for (api_type, position), score in hits
+            if types is None or api_type in types
+        ]
+        return matches if limit is None else matches[:limit]
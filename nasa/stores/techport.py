@@ -0,0 +1,121 @@
+import json
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Text, TYPE_CHECKING
+
+from nasa.clients.techport import TechPortClient
+from nasa.stores.base import SQLiteStore
+from nasa.typing import IsoDate, IsoDateConvertible, JSONType
+
+if TYPE_CHECKING:
+    from sqlite3 import Row
+
+
+class TechPortStore(SQLiteStore):
+    SCHEMA: Sequence[Text] = (
+        "CREATE TABLE IF NOT EXISTS techport_projects ("
+        "project_id INTEGER PRIMARY KEY, "
+        "last_updated TEXT, "
+        "body TEXT NOT NULL)",
+    )
+    STATE: Text = "techport:updated_since"
+
+    def __init__(self, path: Text = ":memory:") -> None:
+        """Local SQLite mirror of the TechPort projects, kept up to date by incremental syncs
+
+        A sync lists the projects updated since the day of the previous one with
+        `updatedSince`, then fetches the details of those whose last update
+        differs from the stored one, several at a time.
+
+        Args:
+            path (Text, optional): database file, created if missing. Defaults to ":memory:".
+        """
+        super().__init__(path)
+
+    def updated_since(self) -> Optional[date]:
+        """Day the last complete sync started, None if there was none"""
+        value: Optional[Text] = self.get_state(self.STATE)
+        return None if value is None else date.fromisoformat(value)
+
+    def last_updated(self) -> Dict[int, Text]:
+        """Last update of every stored project, as listed by TechPort"""
+        rows: List["Row"] = self.query(
+            "SELECT project_id, last_updated FROM techport_projects"
+        )
+        return {row["project_id"]: row["last_updated"] for row in rows}
+
+    def sync(
+        self,
+        client: TechPortClient,
+        updated_since: Optional[IsoDateConvertible] = None,
+        max_workers: int = 8,
+    ) -> List[int]:
+        """Fetch the projects changed since the last sync and store them
+
+        Every project is stored as soon as it arrives, and the day of the sync is
+        only recorded once all of them are, so a failed sync is resumed by the
+        next one without fetching again the projects it stored.
+
+        Args:
+            client (TechPortClient): client fetching the projects, e.g. `nasa.Client`
+            updated_since (Optional[IsoDateConvertible], optional): first day of the updates listed. Defaults to None, the day of the last sync, or every project on the first one.
+            max_workers (int, optional): Number of projects fetched at the same time. Defaults to 8.
+
+        Returns:
+            List[int]: IDs of the projects fetched
+        """
+        today: date = date.today()
+        since: Optional[date] = IsoDate(updated_since).dt or self.updated_since()
+        listing: JSONType = client.techport(updated_since=since)
+        stored: Dict[int, Text] = self.last_updated()
+        changed: Dict[int, Text] = {
+            project["projectId"]: project.get("lastUpdated")
+            for project in listing.get("projects") or list()
+            if stored.get(project["projectId"]) != project.get("lastUpdated")
+        }
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: Dict[Future, int] = {
+                executor.submit(client.techport, project_id): project_id
+                for project_id in changed
+            }
+            for future in as_completed(futures):
+                project_id: int = futures[future]
+                self.upsert(project_id, changed[project_id], future.result())
+        self.set_state(self.STATE, today.isoformat())
+        return sorted(changed)
+
+    def upsert(
+        self, project_id: int, last_updated: Optional[Text], response: JSONType
+    ) -> None:
+        """Store a project, replacing its previous version
+
+        Args:
+            project_id (int): ID of the project
+            last_updated (Optional[Text]): last update of the project, as listed by TechPort
+            response (JSONType): details of the project, as returned by `techport(id_parameter=...)`
+        """
+        project: JSONType = response.get("project", response)
+        self.execute_many(
+            "INSERT INTO techport_projects (project_id, last_updated, body) "
+            "VALUES (?, ?, ?) ON CONFLICT (project_id) DO UPDATE SET "
+            "last_updated = excluded.last_updated, body = excluded.body",
+            [(project_id, last_updated, json.dumps(project))],
+        )
+
+    def project(self, project_id: int) -> Optional[JSONType]:
+        """Stored details of a project, None if it is not stored"""
+        rows: List["Row"] = self.query(
+            "SELECT body FROM techport_projects WHERE project_id = ?", (project_id,)
+        )
+        return json.loads(rows[0]["body"]) if rows else None
+
+    def projects(self) -> List[JSONType]:
+        """Stored details of every project, by ID"""
+        rows: List["Row"] = self.query(
+            "SELECT body FROM techport_projects ORDER BY project_id"
+        )
+        return [json.loads(row["body"]) for row in rows]
+
+    def count(self) -> int:
+        """Number of stored projects"""
+        return self.query("SELECT COUNT(*) FROM techport_projects")[0][0]
@@ -1,13 +1,17 @@
 from warnings import warn
 from decimal import Decimal
-from datetime import date, datetime
-from typing import Dict, Text, Union, Optional, Mapping, List
+from functools import lru_cache
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Text, Union, Optional, Mapping, List
 from nasa.decorators import catch_unidentidied_error, decorate_all_methods
+from nasa.exceptions import NASAInvalidInput
 
 from nasa.warnings import InvalidInputWarning
 
 
 IsoDateConvertible = Union[int, float, Decimal, Text, date, datetime]
+# ISO strings of the valid values already converted, least recently used first evicted
+ISO_DATE_CACHE_SIZE: int = 4096
 JSONType = Optional[
     Union[Text, int, float, bool, Mapping[str, "JSONType"], List["JSONType"]]
 ]
@@ -19,15 +23,15 @@ class IsoDate:
         "s": 1,
         "second": 1,
         "seconds": 1,
-        "ms": 10e3,
-        "millisecond": 10e3,
-        "milliseconds": 10e3,
-        "us": 10e6,
-        "microsecond": 10e6,
-        "microseconds": 10e6,
-        "ns": 10e9,
-        "nanosecond": 10e9,
-        "nanoseconds": 10e9,
+        "ms": 1e3,
+        "millisecond": 1e3,
+        "milliseconds": 1e3,
+        "us": 1e6,
+        "microsecond": 1e6,
+        "microseconds": 1e6,
+        "ns": 1e9,
+        "nanosecond": 1e9,
+        "nanoseconds": 1e9,
     }
     ISO_DATE_FORMAT: Text = "%Y-%m-%d"
 
@@ -44,7 +48,7 @@ class IsoDate:
             if unit not in self.UNIT_CONVERSION.keys():
                 message: Text = f"Invalid `unit` {unit}, will use default unit `s`. Valid unit values are {list(self.UNIT_CONVERSION.keys())}"
                 warn(message, InvalidInputWarning)
-            unix_seconds = arg / self.UNIT_CONVERSION.get(unit, "s")
+            unix_seconds = float(arg) / self.UNIT_CONVERSION.get(unit, 1)
             self.dt = datetime.utcfromtimestamp(unix_seconds)
         elif type(arg) is str:
             try:
@@ -67,8 +71,97 @@ class IsoDate:
             return None
         return self.dt.strftime(self.ISO_DATE_FORMAT)
 
+    @staticmethod
+    def cached_value(
+        arg: Optional[IsoDateConvertible],
+        unit: Text = "s",
+        format: Text = "%Y-%m-%d",
+    ) -> Optional[Text]:
+        """ISO string of arg, memoized so a value repeated across calls is converted once
+
+        Invalid values are not memoized, so they keep warning like `IsoDate(arg).value()`.
+
+        Args:
+            arg (Optional[IsoDateConvertible]): value to convert
+            unit (Text, optional): unit of numeric timestamps. Defaults to "s".
+            format (Text, optional): format of string dates. Defaults to "%Y-%m-%d".
+
+        Returns:
+            Optional[Text]: date in ISO format, None if arg is None or invalid
+        """
+        if arg is None:
+            return None
+        try:
+            return _valid_iso_value(arg, unit, format)
+        except ValueError:
+            return None
+        except TypeError:
+            # Unhashable values are invalid anyway
+            return IsoDate(arg, unit, format).value()
+
+    @staticmethod
+    def batch(
+        args: Iterable[Optional[IsoDateConvertible]],
+        unit: Text = "s",
+        format: Text = "%Y-%m-%d",
+    ) -> List[Optional[Text]]:
+        """Convert many values to ISO strings in one pass, see `IsoDate.cached_value`
+
+        Args:
+            args (Iterable[Optional[IsoDateConvertible]]): values to convert
+            unit (Text, optional): unit of numeric timestamps. Defaults to "s".
+            format (Text, optional): format of string dates. Defaults to "%Y-%m-%d".
+
+        Returns:
+            List[Optional[Text]]: ISO strings in the order of args, None for the missing or invalid values
+        """
+        return [IsoDate.cached_value(arg, unit, format) for arg in args]
+
+    @staticmethod
+    def date_range(
+        start: IsoDateConvertible,
+        end: Optional[IsoDateConvertible] = None,
+        step: int = 1,
+    ) -> List[Text]:
+        """ISO strings of every step days from start to end, both included
+
+        Args:
+            start (IsoDateConvertible): first date of the range
+            end (Optional[IsoDateConvertible], optional): last date of the range. Defaults to None, today.
+            step (int, optional): days between two dates. Defaults to 1.
+
+        Raises:
+            NASAInvalidInput: Raised when start or end is invalid, or step is not positive
+
+        Returns:
+            List[Text]: dates in ISO format
+        """
+        first: Optional[date] = IsoDate(start).dt
+        last: Optional[date] = date.today() if end is None else IsoDate(end).dt
+        if first is None or last is None or step < 1:
+            message: Text = (
+                f"Invalid date range from {start} to {end} every {step} days"
+            )
+            raise NASAInvalidInput(message)
+        first = date(first.year, first.month, first.day)
+        days: int = (date(last.year, last.month, last.day) - first).days
+        return [
+            (first + timedelta(days=offset)).isoformat()
+            for offset in range(0, days + 1, step)
+        ]
+
     def __str__(self) -> Text:
         return str(self.value())
 
     def __repr__(self) -> Text:
         return str(self.value())
+
+
+# typed, so equal values of different types such as 1 and True are told apart
+@lru_cache(maxsize=ISO_DATE_CACHE_SIZE, typed=True)
+def _valid_iso_value(arg: IsoDateConvertible, unit: Text, format: Text) -> Text:
+    """ISO string of a valid value, invalid ones raise ValueError so they are not memoized"""
+    value: Optional[Text] = IsoDate(arg, unit, format).value()
+    if value is None:
+        raise ValueError(f"Invalid date {arg}")
+    return value
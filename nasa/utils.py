@@ -1,24 +1,123 @@
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from io import BytesIO
+from threading import Semaphore
+from types import ModuleType
+from urllib.parse import urlparse
 from warnings import warn
-from typing import Iterable, List, Optional, Text
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Text,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 import requests
-from tqdm.auto import tqdm
-from PIL import Image
-from PIL.ImageFile import ImageFile
+from requests.auth import AuthBase
 
-from nasa.exceptions import NASAContentTypeNotImage
+from nasa.exceptions import (
+    NASAContentTypeNotImage,
+    NASAHTTPError,
+    NASAIncompleteDownload,
+)
+from nasa.metrics import Observer, RequestTrace
+from nasa.progress import Progress, ProgressConvertible, ProgressSink, get_progress
 from nasa.warnings import InvalidInputWarning
 
+if TYPE_CHECKING:
+    from PIL.ImageFile import ImageFile
+
+MIN_CHUNK_SIZE: int = 64 * 1024
+MAX_CHUNK_SIZE: int = 1024 * 1024
+PARTIAL_SUFFIX: Text = ".part"
+
+
+def adaptive_chunk_size(content_length: int) -> int:
+    """Chunk size reading a body in about 16 chunks, between 64 KiB and 1 MiB
+
+    Args:
+        content_length (int): Size of the body, 0 if unknown
+
+    Returns:
+        int: Chunk size in bytes
+    """
+    return min(max(content_length // 16, MIN_CHUNK_SIZE), MAX_CHUNK_SIZE)
+
+
+def read_content(
+    response: requests.Response,
+    content_length: int = 0,
+    chunk_size: Optional[int] = None,
+    on_chunk: Optional[Callable[[int], Any]] = None,
+) -> bytearray:
+    """Read a streamed response body in linear time
+
+    The buffer is preallocated from the Content-Length and grows only if the body is longer.
+
+    Args:
+        response (requests.Response): Response opened with stream=True
+        content_length (int, optional): Expected size of the body, 0 if unknown. Defaults to 0.
+        chunk_size (Optional[int], optional): Chunk Size on reading the body. Defaults to None, adapted to the content length.
+        on_chunk (Optional[Callable[[int], Any]], optional): Called with the size of every chunk read. Defaults to None.
+
+    Returns:
+        bytearray: Response body
+    """
+    if chunk_size is None:
+        chunk_size = adaptive_chunk_size(content_length)
+    buffer: bytearray = bytearray(content_length)
+    offset: int = 0
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        size: int = len(chunk)
+        buffer[offset : offset + size] = chunk
+        offset += size
+        if on_chunk is not None:
+            on_chunk(size)
+    if offset < len(buffer):
+        del buffer[offset:]
+    return buffer
+
+
+def open_image(content: Union[bytes, bytearray]) -> "ImageFile":
+    """Parse an already downloaded image content to PIL Image
+
+    Args:
+        content (Union[bytes, bytearray]): Image content
+
+    Returns:
+        ImageFile: PIL ImageFile Object
+    """
+    from PIL import Image
+
+    return Image.open(BytesIO(content))
+
 
 def get_url_image(
-    url: Text, chunk_size: int = 1024, ignore_non_image: bool = False
-) -> Optional[ImageFile]:
+    url: Text,
+    chunk_size: Optional[int] = None,
+    ignore_non_image: bool = False,
+    session: Optional[requests.Session] = None,
+    observers: Sequence[Observer] = (),
+    progress: ProgressConvertible = "tqdm",
+) -> Optional["ImageFile"]:
     """Parse Response Content Image to PIL Image
 
     Args:
         url (Text): URL containing image
-        chunk_size (int, optional): Chunk Size on downloading Image. Defaults to 1024.
+        chunk_size (Optional[int], optional): Chunk Size on downloading Image. Defaults to None, adapted to the image size.
         ignore_non_image (bool, optional): If True, Gave warning but return None, else raise an error. Defaults to False.
+        session (Optional[requests.Session], optional): Session whose connection pool is reused. Defaults to None.
+        observers (Sequence[Observer], optional): Callables receiving the `nasa.metrics.RequestEvent` of the request. Defaults to ().
+        progress (ProgressConvertible, optional): Sink of the download progress, see `nasa.progress.get_progress`. Defaults to "tqdm".
 
     Raises:
         NASAContentTypeNotImage: The response content type is not image.
@@ -26,37 +125,327 @@ def get_url_image(
     Returns:
         ImageFile: PIL ImageFile Object
     """
-    with requests.get(url, stream=True) as response:
-        content_type: Text = response.headers.get("Content-Type")
-        if content_type.split("/")[0] == "image":
-            content_length: int = int(response.headers.get("Content-Length", 0))
-            content: bytes = bytes()
-            desc: Text = f"Download Image from {response.url}"
-            with tqdm(total=content_length, unit_scale=True, desc=desc) as progress:
-                for c in response.iter_content(chunk_size=chunk_size):
-                    progress.update(len(c))
-                    content += c
-            image: ImageFile = Image.open(BytesIO(content))
-            return image
-        elif ignore_non_image:
-            message: Text = "Response Content-Type is not Image."
-            warn(message, InvalidInputWarning)
-            return None
+    trace: RequestTrace = RequestTrace(observers, urlparse(url).path, url)
+    http: Union[requests.Session, ModuleType] = requests if session is None else session
+    status_code: Optional[int] = None
+    headers: Optional[Mapping] = None
+    try:
+        with http.get(url, stream=True) as response:
+            status_code, headers = response.status_code, response.headers
+            image, size = _read_image(
+                response, chunk_size, ignore_non_image, get_progress(progress)
+            )
+            if image is not None:
+                # The body read, Content-Length is missing from chunked responses
+                trace.bytes(size, status_code)
+    except Exception as error:
+        trace.error(error, status_code, headers)
+        raise
+    trace.end(status_code, headers)
+    return image
+
+
+def _read_image(
+    response: requests.Response,
+    chunk_size: Optional[int],
+    ignore_non_image: bool,
+    progress: ProgressSink,
+) -> Tuple[Optional["ImageFile"], int]:
+    """Read an image response
+
+    Returns:
+        Tuple[Optional[ImageFile], int]: image, None if ignore_non_image and the response is not an image, and number of bytes read
+    """
+    content_type: Text = response.headers.get("Content-Type")
+    if content_type.split("/")[0] == "image":
+        content_length: int = int(response.headers.get("Content-Length", 0))
+        desc: Text = f"Download Image from {response.url}"
+        task: Optional[Progress] = progress.open(desc, content_length or None)
+        if task is None:
+            content: bytearray = read_content(response, content_length, chunk_size)
         else:
-            message: Text = "Response Content-Type is not Image."
-            raise NASAContentTypeNotImage(message)
+            with task:
+                content: bytearray = read_content(
+                    response, content_length, chunk_size, task.update
+                )
+        return open_image(content), len(content)
+    elif ignore_non_image:
+        message: Text = "Response Content-Type is not Image."
+        warn(message, InvalidInputWarning)
+        return None, 0
+    else:
+        message: Text = "Response Content-Type is not Image."
+        raise NASAContentTypeNotImage(message)
 
 
 def get_urls_images(
-    urls: Iterable[Text], chunk_size: int = 1024, ignore_non_image: bool = False
-) -> List[Optional[ImageFile]]:
-    """Parse response contents from list of urls to list of image
+    urls: Iterable[Text],
+    chunk_size: Optional[int] = None,
+    ignore_non_image: bool = False,
+    session: Optional[requests.Session] = None,
+    max_workers: int = 8,
+    max_per_host: Optional[int] = None,
+    observers: Sequence[Observer] = (),
+    progress: ProgressConvertible = "tqdm",
+) -> List[Optional["ImageFile"]]:
+    """Parse response contents from list of urls to list of image, downloading them concurrently
 
     Args:
         urls (Iterable[Text]): List of URLs containing images
-        ignore_non_image (bool, optional): If True, Gave warning but return None, else raise an error. Defaults to False.
+        chunk_size (Optional[int], optional): Chunk Size on downloading Image. Defaults to None, adapted to the image size.
+        ignore_non_image (bool, optional): If True, Gave warning but return None for every URL which failed, else raise an error. Defaults to False.
+        session (Optional[requests.Session], optional): Session whose connection pool is reused. Defaults to None.
+        max_workers (int, optional): Number of images downloaded at the same time, 1 downloads them one after another. Defaults to 8.
+        max_per_host (Optional[int], optional): Number of images downloaded at the same time from a single host. Defaults to None, only bounded by max_workers.
+        observers (Sequence[Observer], optional): Callables receiving the `nasa.metrics.RequestEvent` of every request. Defaults to ().
+        progress (ProgressConvertible, optional): Sink of the progress of every image and of the whole list, see `nasa.progress.get_progress`. Defaults to "tqdm".
+
+    Returns:
+        List[Optional[ImageFile]]: List of PIL ImageFile Object, in the order of the urls
+    """
+    urls: List[Text] = list(urls)
+    sink: ProgressSink = get_progress(progress)
+    host_limits: Dict[Text, Semaphore] = {
+        urlparse(url).netloc: Semaphore(max_per_host or max_workers) for url in urls
+    }
+
+    def fetch(url: Text) -> Optional["ImageFile"]:
+        with host_limits[urlparse(url).netloc]:
+            try:
+                return get_url_image(
+                    url, chunk_size, ignore_non_image, session, observers, sink
+                )
+            except Exception as error:
+                if not ignore_non_image:
+                    raise
+                message: Text = f"Failed to get image from {url}. {error}"
+                warn(message, InvalidInputWarning)
+                return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: List[Future] = [executor.submit(fetch, url) for url in urls]
+        task: Optional[Progress] = sink.open("Images", len(futures), unit="image")
+        try:
+            for future in as_completed(futures):
+                if task is not None:
+                    task.update(1)
+                if future.exception() is not None:
+                    for pending in futures:
+                        pending.cancel()
+                    raise future.exception()
+        finally:
+            if task is not None:
+                task.close()
+    return [future.result() for future in futures]
+
+
+def date_windows(
+    start_date: Union[date, datetime], end_date: Union[date, datetime], days: int
+) -> List[Tuple[date, date]]:
+    """Split an inclusive date range into consecutive inclusive windows of at most `days` days
+
+    Args:
+        start_date (Union[date, datetime]): First date of the range
+        end_date (Union[date, datetime]): Last date of the range
+        days (int): Maximum number of days per window
+
+    Returns:
+        List[Tuple[date, date]]: start and end date of every window, empty if end_date is before start_date
+    """
+    start: date = start_date.date() if isinstance(start_date, datetime) else start_date
+    end: date = end_date.date() if isinstance(end_date, datetime) else end_date
+    windows: List[Tuple[date, date]] = list()
+    while start <= end:
+        window_end: date = min(start + timedelta(days=days - 1), end)
+        windows.append((start, window_end))
+        start = window_end + timedelta(days=1)
+    return windows
+
+
+def download_headers(offset: int) -> Dict[Text, Text]:
+    """Headers of a download request resuming at offset
+
+    The content is requested without compression, so its size can be checked against Content-Length.
+
+    Args:
+        offset (int): Number of bytes already downloaded
+
+    Returns:
+        Dict[Text, Text]: request headers
+    """
+    headers: Dict[Text, Text] = {"Accept-Encoding": "identity"}
+    if offset > 0:
+        headers["Range"] = f"bytes={offset}-"
+    return headers
+
+
+def expected_download_size(
+    status_code: int, headers: Mapping, offset: int
+) -> Optional[int]:
+    """Final size of a download from the headers of its response
+
+    Args:
+        status_code (int): status code of the response, 206 when the Range request was honoured
+        headers (Mapping): headers of the response
+        offset (int): Number of bytes already downloaded
+
+    Returns:
+        Optional[int]: size of the complete file, None if unknown
+    """
+    content_range: Optional[Text] = headers.get("Content-Range")
+    if content_range is not None:
+        match: Optional[re.Match] = re.search(r"/(\d+)$", content_range)
+        if match is not None:
+            return int(match.group(1))
+    content_length: Optional[Text] = headers.get("Content-Length")
+    if content_length is None:
+        return None
+    return int(content_length) + (offset if status_code == 206 else 0)
+
+
+def finish_download(part_path: Text, path: Text, expected_size: Optional[int]) -> Text:
+    """Check the size of a downloaded partial file and move it to its final path
+
+    Args:
+        part_path (Text): path of the partial file
+        path (Text): final path of the file
+        expected_size (Optional[int]): expected size of the file, None to skip the check
+
+    Raises:
+        NASAIncompleteDownload: The partial file size does not match the expected size, it is kept to be resumed.
+
+    Returns:
+        Text: final path of the file
+    """
+    size: int = os.path.getsize(part_path)
+    if expected_size is not None and size != expected_size:
+        message: Text = f"Downloaded {size} bytes of {expected_size} into {part_path}"
+        raise NASAIncompleteDownload(message)
+    os.replace(part_path, path)
+    return path
+
+
+def download_to(
+    url: Text,
+    path: Text,
+    chunk_size: Optional[int] = None,
+    session: Optional[requests.Session] = None,
+    auth: Optional[AuthBase] = None,
+    resume: bool = True,
+    overwrite: bool = False,
+    progress: ProgressConvertible = "tqdm",
+) -> Text:
+    """Stream the content of an URL to a file without holding it in memory
+
+    The content is written to `path + ".part"` and moved to path once its size matches Content-Length.
+    A partial file left by an interrupted download is resumed with an HTTP Range request.
+
+    Args:
+        url (Text): URL of the content
+        path (Text): destination file
+        chunk_size (Optional[int], optional): Chunk Size on downloading. Defaults to None, adapted to the content size.
+        session (Optional[requests.Session], optional): Session whose connection pool is reused. Defaults to None.
+        auth (Optional[AuthBase], optional): Authentication of the request, e.g. NASAAuth for api.nasa.gov URLs. Defaults to None.
+        resume (bool, optional): Resume from the partial file if there is one. Defaults to True.
+        overwrite (bool, optional): Download again when path already exists. Defaults to False.
+        progress (ProgressConvertible, optional): Sink of the download progress, see `nasa.progress.get_progress`. Defaults to "tqdm".
+
+    Raises:
+        NASAHTTPError: The server answered with an error status.
+        NASAIncompleteDownload: The connection ended before the whole content was received.
+
+    Returns:
+        Text: path of the downloaded file
+    """
+    if os.path.exists(path) and not overwrite:
+        return path
+    part_path: Text = path + PARTIAL_SUFFIX
+    offset: int = 0
+    if resume and os.path.exists(part_path):
+        offset = os.path.getsize(part_path)
+    http: Union[requests.Session, ModuleType] = requests if session is None else session
+    with http.get(
+        url, stream=True, auth=auth, headers=download_headers(offset)
+    ) as response:
+        if response.status_code == 416 and offset > 0:
+            # The partial file is already complete, or longer than the content
+            expected_size: Optional[int] = expected_download_size(
+                response.status_code, response.headers, offset
+            )
+            if expected_size == offset:
+                return finish_download(part_path, path, expected_size)
+            os.remove(part_path)
+            return download_to(
+                url, path, chunk_size, session, auth, False, overwrite, progress
+            )
+        # Reported with the URL requested, response.url carries the API key added by auth
+        if response.status_code >= 400:
+            message: Text = (
+                f"{response.status_code} Error: {response.reason} for url: {url}"
+            )
+            raise NASAHTTPError(message)
+        if response.status_code != 206:
+            offset = 0
+        expected_size: Optional[int] = expected_download_size(
+            response.status_code, response.headers, offset
+        )
+        if chunk_size is None:
+            chunk_size = adaptive_chunk_size((expected_size or 0) - offset)
+        desc: Text = f"Download {url}"
+        task: Optional[Progress] = get_progress(progress).open(
+            desc, expected_size, initial=offset
+        )
+        with open(part_path, "ab" if offset > 0 else "wb") as file:
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    file.write(chunk)
+                    if task is not None:
+                        task.update(len(chunk))
+            finally:
+                if task is not None:
+                    task.close()
+    return finish_download(part_path, path, expected_size)
+
+
+def download_all(
+    downloads: Iterable[Tuple[Text, Text]],
+    session: Optional[requests.Session] = None,
+    auth: Optional[AuthBase] = None,
+    max_workers: int = 4,
+    overwrite: bool = False,
+    progress: ProgressConvertible = "tqdm",
+) -> List[Text]:
+    """Stream the content of several URLs to files concurrently, see `download_to`
+
+    Args:
+        downloads (Iterable[Tuple[Text, Text]]): URL and destination file of every download
+        session (Optional[requests.Session], optional): Session whose connection pool is reused. Defaults to None.
+        auth (Optional[AuthBase], optional): Authentication of the requests. Defaults to None.
+        max_workers (int, optional): Number of files downloaded at the same time. Defaults to 4.
+        overwrite (bool, optional): Download again the files which already exist. Defaults to False.
+        progress (ProgressConvertible, optional): Sink of the progress of every download, see `nasa.progress.get_progress`. Defaults to "tqdm".
+
+    Returns:
+        List[Text]: path of the downloaded files, in the order of the downloads
+    """
+    sink: ProgressSink = get_progress(progress)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: List[Future] = [
+            executor.submit(
+                download_to, url, path, None, session, auth, True, overwrite, sink
+            )
+            for url, path in downloads
+        ]
+        return [future.result() for future in futures]
+
+
+def url_filename(url: Text) -> Text:
+    """Last segment of the URL path, used as file name of a download
+
+    Args:
+        url (Text): URL of the content
 
     Returns:
-        List[Optional[ImageFile]]: List of PIL ImageFile Object
+        Text: file name
     """
-    return [get_url_image(url, chunk_size, ignore_non_image) for url in tqdm(urls)]
+    return os.path.basename(urlparse(url).path)
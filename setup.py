@@ -1,14 +1,27 @@
-from typing import List, Text
+from typing import Dict, List, Text
 import nasa
 
-from setuptools import setup
+from setuptools import find_packages, setup
 
 with open("README.md") as readme_file:
     readme: Text = readme_file.read()
 
-requirements: List[Text] = ["requests", "pillow"]
+requirements: List[Text] = ["requests", "pillow", "tqdm"]
 
-test_requirements: List[Text] = ["requests", "pre-commit", "pillow", "wheel"]
+extras_requirements: Dict[Text, List[Text]] = {
+    "async": ["aiohttp"],
+    "numpy": ["numpy"],
+    "orjson": ["orjson"],
+}
+
+test_requirements: List[Text] = [
+    "requests",
+    "pre-commit",
+    "pillow",
+    "wheel",
+    "aiohttp",
+    "numpy",
+]
 
 setup(
     name="python-nasa",
@@ -20,11 +33,12 @@ setup(
     download_url="https://github.com/wrap-api/python-nasa/archive/main.tar.gz",
     author=nasa.__author__,
     author_email=nasa.__email__,
-    packages=["nasa"],
+    packages=find_packages(include=["nasa", "nasa.*"]),
     package_dir={"nasa": "nasa"},
     include_package_data=True,
     license="MIT",
     install_requires=requirements,
+    extras_require=extras_requirements,
     tests_require=test_requirements,
     keywords="nasa planet astronomy image galaxy earth",
     classifiers=[
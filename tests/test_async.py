@@ -0,0 +1,82 @@
+import asyncio
+from io import BytesIO
+from typing import List, Text
+from unittest import IsolatedAsyncioTestCase
+
+from PIL import Image
+from nasa.clients.async_main import AsyncClient
+from nasa.exceptions import NASAHTTPError
+from nasa.typing import JSONType
+from benchmarks.server import StubServer
+
+
+def png_bytes() -> bytes:
+    buffer: BytesIO = BytesIO()
+    Image.new("RGB", (4, 4)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestAsyncClient(IsolatedAsyncioTestCase):
+    API_KEY: Text = "Example-Key"
+
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.client: AsyncClient = AsyncClient(
+            self.API_KEY, base_url=self.server.url, limit=10
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        self.server.stop()
+
+    async def test_apod_client(self):
+        # Arrange
+        self.server.json("/planetary/apod", {"title": "stub"})
+        # Act
+        response: JSONType = await self.client.apod(date="2021-01-15")
+        # Assert
+        path, query, _ = self.server.requests[0]
+        self.assertEqual(response, {"title": "stub"})
+        self.assertEqual(path, "/planetary/apod")
+        self.assertEqual(
+            query,
+            {"date": ["2021-01-15"], "thumbs": ["False"], "api_key": [self.API_KEY]},
+        )
+
+    async def test_concurrent_calls_share_bounded_pool(self):
+        # Arrange
+        self.server.json("/DONKI/notifications", [])
+        # Act
+        responses: List[JSONType] = await asyncio.gather(
+            *(self.client.donki_notifications() for _ in range(200))
+        )
+        # Assert
+        self.assertEqual(len(responses), 200)
+        self.assertLessEqual(self.server.connections, 10)
+
+    async def test_mars_rover_photos_images(self):
+        # Arrange
+        image: bytes = png_bytes()
+        photos: JSONType = {
+            "photos": [{"img_src": f"{self.server.url}/img/{i}"} for i in range(3)]
+        }
+        self.server.json("/mars-photos/api/v1/rovers/spirit/photos", photos)
+        for i in range(3):
+            self.server.route(
+                f"/img/{i}", lambda *_: (200, {"Content-Type": "image/png"}, image)
+            )
+        # Act
+        response: JSONType = await self.client.mars_rover_photos(
+            "spirit", sol=1, get_images=True
+        )
+        # Assert
+        self.assertEqual(response["JSON"], photos)
+        self.assertEqual([i.size for i in response["Images"]], [(4, 4)] * 3)
+
+    async def test_nasa_http_error(self):
+        # Arrange
+        self.server.route("/insight_weather", lambda *_: (500, {}, b""))
+        # Assert
+        with self.assertRaises(NASAHTTPError):
+            # Act
+            await self.client.insight()
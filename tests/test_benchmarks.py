@@ -0,0 +1,16 @@
+from typing import Any, Dict, Text
+from unittest import TestCase
+
+from benchmarks.bench_clients import SCENARIOS, run_suite
+
+
+class TestBenchmarkSuite(TestCase):
+    def test_every_mixin_is_measured(self):
+        # Act
+        report: Dict[Text, Any] = run_suite(calls=2, latency_ms=0, image_size=8)
+        # Assert
+        self.assertEqual(list(report["results"]), list(SCENARIOS))
+        for result in report["results"].values():
+            self.assertGreaterEqual(result["requests_per_call"], 1)
+            self.assertGreater(result["bytes_per_call"], 0)
+            self.assertGreater(result["throughput_per_s"], 0)
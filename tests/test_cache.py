@@ -0,0 +1,124 @@
+import json
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Optional, Text
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests.models import Response
+from nasa.cache import CacheEntry, DiskCache, MemoryCache, cache_key, cache_ttl
+from nasa.clients.main import Client
+from benchmarks.server import StubServer
+
+
+def make_entry(content: bytes, expires: float = 0) -> CacheEntry:
+    response: Response = Response()
+    response._content = content
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    return CacheEntry(response, expires)
+
+
+class TestCache(TestCase):
+    def test_cache_key_normalizes_params(self):
+        # Act
+        key: Text = cache_key("/DONKI/CME", {"endDate": "b", "startDate": "a"})
+        other_key: Text = cache_key(
+            "/DONKI/CME", {"startDate": "a", "type": None, "endDate": "b"}
+        )
+        # Assert
+        self.assertEqual(key, other_key)
+
+    def test_cache_ttl_longest_prefix(self):
+        # Arrange
+        ttl: Dict[Text, float] = {"": 1, "/DONKI": 2, "/DONKI/notifications": 3}
+        # Act & Assert
+        self.assertEqual(cache_ttl("/planetary/apod", ttl), 1)
+        self.assertEqual(cache_ttl("/DONKI/CME", ttl), 2)
+        self.assertEqual(cache_ttl("/DONKI/notifications", ttl), 3)
+
+    def test_memory_cache_lru_eviction(self):
+        # Arrange
+        cache: MemoryCache = MemoryCache(max_entries=2)
+        cache.set("a", make_entry(b"a"))
+        cache.set("b", make_entry(b"b"))
+        # Act
+        cache.get("a")
+        cache.set("c", make_entry(b"c"))
+        # Assert
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_memory_cache_oversized_entry_evicts_previous_value(self):
+        # Arrange
+        cache: MemoryCache = MemoryCache(max_bytes=10)
+        cache.set("a", make_entry(b"a"))
+        # Act
+        cache.set("a", make_entry(b"a" * 100))
+        # Assert
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.size, 0)
+
+    def test_disk_cache_oversized_entry_evicts_previous_value(self):
+        with TemporaryDirectory() as directory:
+            # Arrange
+            cache: DiskCache = DiskCache(directory, max_bytes=3000)
+            cache.set("a", make_entry(b"a"))
+            # Act
+            cache.set("a", make_entry(b"a" * 5000))
+            # Assert
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.size, 0)
+
+    def test_disk_cache_get_tolerates_concurrent_delete(self):
+        with TemporaryDirectory() as directory:
+            # Arrange
+            cache: DiskCache = DiskCache(directory)
+            cache.set("a", make_entry(b"a"))
+            # Act
+            with patch("nasa.cache.os.utime", side_effect=FileNotFoundError):
+                entry: Optional[CacheEntry] = cache.get("a")
+            # Assert
+            self.assertEqual(entry.content, b"a")
+
+    def test_disk_cache_size_eviction(self):
+        with TemporaryDirectory() as directory:
+            # Arrange
+            cache: DiskCache = DiskCache(directory, max_bytes=3000)
+            # Act
+            for key in "abcd":
+                cache.set(key, make_entry(key.encode() * 1000))
+            # Assert
+            self.assertLessEqual(cache.size, 3000)
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(DiskCache(directory).get("d").content, b"d" * 1000)
+
+    def test_client_cache_hit_and_revalidation(self):
+        # Arrange
+        body: bytes = json.dumps({"title": "stub"}).encode()
+        statuses: List[int] = list()
+
+        def apod(path, query, headers):
+            if headers.get("If-None-Match") == '"v1"':
+                statuses.append(304)
+                return 304, {"ETag": '"v1"'}, b""
+            statuses.append(200)
+            return 200, {"Content-Type": "application/json", "ETag": '"v1"'}, body
+
+        with StubServer({"/planetary/apod": apod}) as server:
+            client: Client = Client(
+                base_url=server.url,
+                cache=MemoryCache(),
+                cache_ttl={"/planetary/apod": 60},
+            )
+            # Act
+            first = client.apod()
+            second = client.apod()
+            client._cache.get(
+                cache_key("/planetary/apod", {"thumbs": False})
+            ).expires = 0
+            third = client.apod()
+        # Assert
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+        self.assertEqual(statuses, [200, 304])
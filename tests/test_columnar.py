@@ -0,0 +1,72 @@
+from datetime import date
+from typing import Any, Dict, List
+from unittest import TestCase, skipIf
+
+from benchmarks.mock_api import neo_feed, neo_object
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+if numpy is not None:
+    from benchmarks.bench_neo_columns import columnar_filter, dict_filter
+    from nasa.columnar import NEO_COLUMNS, neo_columns
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class TestNeoColumns(TestCase):
+    def test_feed_is_flattened_per_close_approach(self):
+        # Arrange
+        feed: Dict[str, Any] = neo_feed(date(2021, 1, 1), 2, 3)
+        # Act
+        columns: Dict[str, Any] = neo_columns(feed)
+        # Assert
+        self.assertEqual(list(columns), NEO_COLUMNS)
+        self.assertEqual(columns["id"].tolist(), [2000000 + i for i in range(6)])
+        self.assertEqual(columns["id"].dtype, numpy.int64)
+        self.assertEqual(columns["epoch"][0], numpy.datetime64("2021-01-01", "ms"))
+        self.assertEqual(columns["miss_distance_km"][1], 2e6)
+        self.assertEqual(columns["relative_velocity_kps"][2], 12.0)
+        self.assertAlmostEqual(columns["diameter_max_km"][3], 0.303)
+        self.assertEqual(columns["hazardous"].tolist(), [True] + [False] * 5)
+
+    def test_responses_are_concatenated(self):
+        # Arrange
+        browse: Dict[str, Any] = {"near_earth_objects": [neo_object(7), neo_object(8)]}
+        feed: Dict[str, Any] = neo_feed(date(2021, 1, 1), 1, 1)
+        # Act
+        columns: Dict[str, Any] = neo_columns(feed, browse)
+        # Assert
+        self.assertEqual(columns["id"].tolist(), [2000000, 2000007, 2000008])
+
+    def test_missing_values(self):
+        # Arrange
+        response: Dict[str, Any] = {
+            "near_earth_objects": {
+                "2021-01-01": [{"id": "1", "close_approach_data": [{}]}]
+            }
+        }
+        # Act
+        columns: Dict[str, Any] = neo_columns(response)
+        # Assert
+        self.assertTrue(numpy.isnat(columns["epoch"][0]))
+        self.assertTrue(numpy.isnan(columns["miss_distance_km"][0]))
+        self.assertTrue(numpy.isnan(columns["diameter_min_km"][0]))
+        self.assertFalse(columns["hazardous"][0])
+
+    def test_empty_response(self):
+        # Act
+        columns: Dict[str, Any] = neo_columns({"element_count": 0})
+        # Assert
+        for column in NEO_COLUMNS:
+            self.assertEqual(len(columns[column]), 0)
+
+    def test_vectorized_filter_matches_dict_filter(self):
+        # Arrange
+        feed: Dict[str, Any] = neo_feed(date(2021, 1, 1), 10, 20)
+        # Act
+        ids: List[int] = columnar_filter(neo_columns(feed)).tolist()
+        # Assert
+        self.assertTrue(ids)
+        self.assertEqual(ids, dict_filter(feed))
@@ -0,0 +1,83 @@
+import json
+from typing import Any, List
+from unittest import TestCase
+
+from benchmarks.bench_json import compare
+from nasa.clients.main import Client
+from nasa.decoders import DECODERS, get_decoder, raw
+from nasa.exceptions import NASAInvalidInput
+from benchmarks.server import StubServer
+
+
+class TestJSONDecoders(TestCase):
+    BODY: Any = {"title": "stub", "values": [1, 2.5, None, True]}
+
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.server.json("/planetary/apod", self.BODY)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+
+    def test_every_named_decoder_gives_the_same_result(self):
+        for name in ("auto", "orjson", "json"):
+            with self.subTest(name):
+                # Arrange
+                try:
+                    get_decoder(name)
+                except ImportError:
+                    self.skipTest("orjson is not installed")
+                client: Client = Client(base_url=self.server.url, json_decoder=name)
+                # Act
+                content: Any = client.apod()
+                client.close()
+                # Assert
+                self.assertEqual(content, self.BODY)
+
+    def test_raw_returns_the_undecoded_body(self):
+        # Arrange
+        client: Client = Client(base_url=self.server.url, json_decoder="raw")
+        # Act
+        content: Any = client.apod()
+        client.close()
+        # Assert
+        self.assertIsInstance(content, bytes)
+        self.assertEqual(json.loads(content), self.BODY)
+
+    def test_callable_decoder(self):
+        # Arrange
+        calls: List[bytes] = []
+
+        def decoder(content: bytes) -> Any:
+            calls.append(content)
+            return json.loads(content)
+
+        client: Client = Client(base_url=self.server.url, json_decoder=decoder)
+        # Act
+        content: Any = client.apod()
+        client.close()
+        # Assert
+        self.assertEqual(content, self.BODY)
+        self.assertEqual(len(calls), 1)
+
+    def test_unknown_decoder(self):
+        # Act / Assert
+        with self.assertRaises(NASAInvalidInput):
+            get_decoder("yaml")
+
+    def test_named_decoders(self):
+        # Act / Assert
+        self.assertIs(get_decoder("json"), json.loads)
+        self.assertIs(get_decoder("raw"), raw)
+        self.assertIn("auto", DECODERS)
+
+
+class TestJSONBenchmark(TestCase):
+    def test_every_payload_is_timed_against_response_json(self):
+        # Act
+        results: Any = compare(records=10, repeat=1)
+        # Assert
+        self.assertEqual(list(results), ["techport", "neo_browse", "wsa_enlil"])
+        for timings in results.values():
+            self.assertIn("response.json", timings)
+            self.assertIn("raw", timings)
@@ -0,0 +1,336 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Optional, Text, Tuple
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from nasa.auth import NASAAuth
+from nasa.clients.async_main import AsyncClient
+from nasa.clients.main import Client
+from nasa.exceptions import NASAHTTPError, NASAIncompleteDownload, NASAInvalidInput
+from nasa.progress import CallbackProgress
+from nasa.utils import download_to
+from benchmarks.server import StubServer
+
+CONTENT: bytes = bytes(range(256)) * 64
+
+
+def ranged(content: bytes, truncate: Optional[int] = None):
+    def handler(path: Text, query: Dict, headers: Dict[Text, Text]) -> Tuple:
+        response_headers: Dict[Text, Text] = {"Content-Type": "image/png"}
+        range_header: Optional[Text] = headers.get("Range")
+        if range_header is None:
+            return 200, response_headers, content[:truncate]
+        start: int = int(range_header[len("bytes=") : -1])
+        response_headers[
+            "Content-Range"
+        ] = f"bytes {start}-{len(content) - 1}/{len(content)}"
+        return 206, response_headers, content[start:truncate]
+
+    return handler
+
+
+def failing(path: Text, query: Dict, headers: Dict[Text, Text]) -> Tuple:
+    return 500, {"Content-Type": "text/plain"}, b"error"
+
+
+def epic_archive(
+    server: StubServer, days: List[Text], variant: Text, per_day: int = 2
+) -> None:
+    server.json("/EPIC/api/natural/available", days)
+    extension: Text = "png" if variant == "png" else "jpg"
+    for day in days:
+        records: List[Dict[Text, Text]] = [
+            {"date": f"{day} 00:00:00", "image": f"epic_{day}_{i}"}
+            for i in range(per_day)
+        ]
+        server.json(f"/EPIC/api/natural/date/{day}", records)
+        for record in records:
+            server.route(
+                f"/EPIC/archive/natural/{day.replace('-', '/')}/{variant}/{record['image']}.{extension}",
+                ranged(CONTENT),
+            )
+
+
+class TestDownload(TestCase):
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.directory: TemporaryDirectory = TemporaryDirectory()
+        self.path: Text = os.path.join(self.directory.name, "image.png")
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        self.directory.cleanup()
+
+    def test_download_to(self):
+        # Arrange
+        self.server.route("/image.png", ranged(CONTENT))
+        # Act
+        download_to(f"{self.server.url}/image.png", self.path)
+        download_to(f"{self.server.url}/image.png", self.path)
+        # Assert
+        with open(self.path, "rb") as file:
+            self.assertEqual(file.read(), CONTENT)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_resume_partial_download(self):
+        # Arrange
+        self.server.route("/image.png", ranged(CONTENT))
+        with open(self.path + ".part", "wb") as file:
+            file.write(CONTENT[:1000])
+        # Act
+        download_to(f"{self.server.url}/image.png", self.path)
+        # Assert
+        with open(self.path, "rb") as file:
+            self.assertEqual(file.read(), CONTENT)
+        self.assertEqual(self.server.requests[0][2]["Range"], "bytes=1000-")
+        self.assertEqual(self.server.bytes_sent, len(CONTENT) - 1000)
+
+    def test_incomplete_download_is_kept_partial(self):
+        # Arrange
+        self.server.route("/image.png", ranged(CONTENT, truncate=2000))
+        with open(self.path + ".part", "wb") as file:
+            file.write(CONTENT[:1000])
+        # Assert
+        with self.assertRaises(NASAIncompleteDownload):
+            # Act
+            download_to(f"{self.server.url}/image.png", self.path)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(os.path.getsize(self.path + ".part"), 2000)
+
+    def test_download_to_hides_api_key(self):
+        # Arrange
+        self.server.route("/image.png", ranged(CONTENT))
+        self.server.route("/missing.png", failing)
+        descriptions: List[Text] = list()
+        progress: CallbackProgress = CallbackProgress(
+            lambda desc, done, total: descriptions.append(desc)
+        )
+        auth: NASAAuth = NASAAuth("Secret-Key")
+        # Act
+        download_to(
+            f"{self.server.url}/image.png", self.path, auth=auth, progress=progress
+        )
+        with self.assertRaises(NASAHTTPError) as context:
+            download_to(
+                f"{self.server.url}/missing.png",
+                os.path.join(self.directory.name, "missing.png"),
+                auth=auth,
+                progress=progress,
+            )
+        # Assert
+        self.assertEqual(self.server.requests[0][1]["api_key"], ["Secret-Key"])
+        self.assertTrue(descriptions)
+        self.assertTrue(all("Secret-Key" not in desc for desc in descriptions))
+        self.assertIn("/missing.png", str(context.exception))
+        self.assertNotIn("Secret-Key", str(context.exception))
+
+    def test_epic_download(self):
+        # Arrange
+        records: List[Dict[Text, Text]] = [
+            {"date": "2021-01-01 00:00:00", "image": f"epic_{i}"} for i in range(3)
+        ]
+        self.server.json("/EPIC/api/natural/date/2021-01-01", records)
+        for record in records:
+            self.server.route(
+                f"/EPIC/archive/natural/2021/01/01/png/{record['image']}.png",
+                ranged(CONTENT),
+            )
+        client: Client = Client("Example-Key", base_url=self.server.url)
+        # Act
+        paths: List[Text] = client.epic_download(
+            self.directory.name, "natural", "2021-01-01"
+        )
+        # Assert
+        self.assertEqual(
+            [os.path.basename(path) for path in paths],
+            ["epic_0.png", "epic_1.png", "epic_2.png"],
+        )
+        self.assertTrue(
+            all(
+                query["api_key"] == ["Example-Key"]
+                for _, query, _ in self.server.requests
+            )
+        )
+
+    def test_epic_download_range(self):
+        # Arrange
+        days: List[Text] = ["2020-12-31", "2021-01-01", "2021-01-02", "2021-01-03"]
+        epic_archive(self.server, days, "thumbs")
+        client: Client = Client(base_url=self.server.url)
+        # Act
+        paths: List[Text] = client.epic_download_range(
+            self.directory.name, "natural", "2021-01-01", "2021-01-02", "thumbs"
+        )
+        sent: int = len(self.server.requests)
+        again: List[Text] = client.epic_download_range(
+            self.directory.name, "natural", "2021-01-01", "2021-01-02", "thumbs"
+        )
+        # Assert
+        self.assertEqual(
+            [os.path.relpath(path, self.directory.name) for path in paths],
+            [
+                os.path.join("thumbs", "2021-01-01", "epic_2021-01-01_0.jpg"),
+                os.path.join("thumbs", "2021-01-01", "epic_2021-01-01_1.jpg"),
+                os.path.join("thumbs", "2021-01-02", "epic_2021-01-02_0.jpg"),
+                os.path.join("thumbs", "2021-01-02", "epic_2021-01-02_1.jpg"),
+            ],
+        )
+        self.assertTrue(all(os.path.getsize(path) == len(CONTENT) for path in paths))
+        self.assertEqual(again, paths)
+        self.assertEqual(len(self.server.requests), sent + 1)
+
+    def test_epic_download_range_rechecks_the_latest_date(self):
+        # Arrange
+        epic_archive(self.server, ["2021-01-01", "2021-01-02"], "png")
+        client: Client = Client(base_url=self.server.url)
+        # Act
+        client.epic_download_range(self.directory.name, "natural", "2021-01-01")
+        sent: int = len(self.server.requests)
+        paths: List[Text] = client.epic_download_range(
+            self.directory.name, "natural", "2021-01-01"
+        )
+        # Assert
+        self.assertEqual(len(paths), 4)
+        self.assertEqual(
+            [path for path, _, _ in self.server.requests[sent:]],
+            ["/EPIC/api/natural/available", "/EPIC/api/natural/date/2021-01-02"],
+        )
+
+    def test_epic_download_range_hides_api_key(self):
+        # Arrange
+        epic_archive(self.server, ["2021-01-01"], "png")
+        self.server.route(
+            "/EPIC/archive/natural/2021/01/01/png/epic_2021-01-01_1.png", failing
+        )
+        descriptions: List[Text] = list()
+        client: Client = Client(
+            "Secret-Key",
+            base_url=self.server.url,
+            progress=lambda desc, done, total: descriptions.append(desc),
+        )
+        # Assert
+        with self.assertRaises(NASAHTTPError) as context:
+            # Act
+            client.epic_download_range(
+                self.directory.name, "natural", "2021-01-01", "2021-01-01", "png"
+            )
+        self.assertIn("epic_2021-01-01_1.png", str(context.exception))
+        self.assertNotIn("Secret-Key", str(context.exception))
+        self.assertIn(
+            f"Download {self.server.url}/EPIC/archive/natural/2021/01/01/png/epic_2021-01-01_0.png",
+            descriptions,
+        )
+        self.assertTrue(all("Secret-Key" not in desc for desc in descriptions))
+
+    def test_epic_download_range_invalid_variant(self):
+        # Arrange
+        client: Client = Client(base_url=self.server.url)
+        # Assert
+        with self.assertRaises(NASAInvalidInput):
+            # Act
+            client.epic_download_range(
+                self.directory.name, "natural", "2021-01-01", variant="tiff"
+            )
+
+
+class TestAsyncDownload(IsolatedAsyncioTestCase):
+    async def test_epic_download_range(self):
+        # Arrange
+        with StubServer() as server, TemporaryDirectory() as directory:
+            epic_archive(server, ["2021-01-01", "2021-01-02", "2021-01-03"], "jpg")
+            async with AsyncClient(base_url=server.url) as client:
+                # Act
+                paths: List[Text] = await client.epic_download_range(
+                    directory, "natural", "2021-01-02", variant="jpg", max_workers=2
+                )
+            # Assert
+            self.assertEqual(
+                [os.path.basename(path) for path in paths],
+                [
+                    "epic_2021-01-02_0.jpg",
+                    "epic_2021-01-02_1.jpg",
+                    "epic_2021-01-03_0.jpg",
+                    "epic_2021-01-03_1.jpg",
+                ],
+            )
+            self.assertTrue(
+                os.path.exists(
+                    os.path.join(directory, "jpg", "2021-01-02", "manifest.json")
+                )
+            )
+
+    async def test_epic_download_range_hides_api_key(self):
+        # Arrange
+        descriptions: List[Text] = list()
+        with StubServer() as server, TemporaryDirectory() as directory:
+            epic_archive(server, ["2021-01-01"], "png")
+            server.route(
+                "/EPIC/archive/natural/2021/01/01/png/epic_2021-01-01_1.png", failing
+            )
+            async with AsyncClient(
+                "Secret-Key",
+                base_url=server.url,
+                progress=lambda desc, done, total: descriptions.append(desc),
+            ) as client:
+                # Assert
+                with self.assertRaises(NASAHTTPError) as context:
+                    # Act
+                    await client.epic_download_range(
+                        directory, "natural", "2021-01-01", "2021-01-01", "png"
+                    )
+        self.assertIn("epic_2021-01-01_1.png", str(context.exception))
+        self.assertNotIn("Secret-Key", str(context.exception))
+        self.assertTrue(all("Secret-Key" not in desc for desc in descriptions))
+
+    async def test_download_to_hides_api_key(self):
+        # Arrange
+        descriptions: List[Text] = list()
+        with StubServer() as server, TemporaryDirectory() as directory:
+            server.route("/image.png", ranged(CONTENT))
+            server.route("/missing.png", failing)
+            async with AsyncClient(
+                "Secret-Key",
+                base_url=server.url,
+                progress=lambda desc, done, total: descriptions.append(desc),
+            ) as client:
+                # Act
+                await client._download_to(
+                    f"{server.url}/image.png",
+                    os.path.join(directory, "image.png"),
+                    authenticate=True,
+                )
+                with self.assertRaises(NASAHTTPError) as context:
+                    await client._download_to(
+                        f"{server.url}/missing.png",
+                        os.path.join(directory, "missing.png"),
+                        authenticate=True,
+                    )
+            # Assert
+            self.assertEqual(server.requests[0][1]["api_key"], ["Secret-Key"])
+        self.assertTrue(descriptions)
+        self.assertTrue(all("Secret-Key" not in desc for desc in descriptions))
+        self.assertIn("/missing.png", str(context.exception))
+        self.assertNotIn("Secret-Key", str(context.exception))
+
+    async def test_mars_rover_photos_download(self):
+        # Arrange
+        with StubServer() as server, TemporaryDirectory() as directory:
+            photos = {
+                "photos": [{"img_src": f"{server.url}/img/{i}.jpg"} for i in range(3)]
+            }
+            server.json("/mars-photos/api/v1/rovers/spirit/photos", photos)
+            for i in range(3):
+                server.route(f"/img/{i}.jpg", ranged(CONTENT))
+            with open(os.path.join(directory, "1.jpg.part"), "wb") as file:
+                file.write(CONTENT[:10])
+            async with AsyncClient(base_url=server.url) as client:
+                # Act
+                paths: List[Text] = await client.mars_rover_photos_download(
+                    directory, "spirit", sol=1
+                )
+            # Assert
+            self.assertEqual(len(paths), 3)
+            for path in paths:
+                with open(path, "rb") as file:
+                    self.assertEqual(file.read(), CONTENT)
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from typing import Dict, Text
+from unittest import TestCase
+
+
+def import_times(code: Text) -> Dict[Text, int]:
+    """Cumulative import time in microseconds of every module imported by the code"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[Text, int] = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyImports(TestCase):
+    def test_import_nasa_is_cheap(self):
+        # Act
+        times: Dict[Text, int] = import_times("import nasa")
+        # Assert
+        for module in ("requests", "PIL", "tqdm", "aiohttp", "nasa.clients.base"):
+            self.assertNotIn(module, times)
+        self.assertLess(times["nasa"], 100_000)
+
+    def test_client_does_not_import_image_and_progress_libraries(self):
+        # Act
+        times: Dict[Text, int] = import_times("from nasa import Client; Client()")
+        # Assert
+        self.assertIn("nasa.clients.base", times)
+        for module in ("PIL", "tqdm", "aiohttp", "nasa.clients.async_base"):
+            self.assertNotIn(module, times)
+
+    def test_image_path_imports_pil(self):
+        # Act
+        times: Dict[Text, int] = import_times(
+            "from nasa.utils import open_image\n"
+            "try:\n"
+            "    open_image(b'')\n"
+            "except Exception:\n"
+            "    pass"
+        )
+        # Assert
+        self.assertIn("PIL", times)
@@ -0,0 +1,167 @@
+from io import BytesIO
+from typing import Dict, List, Text
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock
+
+from PIL import Image
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from nasa.cache import MemoryCache
+from nasa.clients.async_main import AsyncClient
+from nasa.clients.main import Client
+from nasa.exceptions import NASAHTTPError
+from nasa.metrics import MetricsCollector, RequestEvent, route_label
+from nasa.utils import get_url_image, get_urls_images
+from benchmarks.server import StubServer
+
+APOD: Dict[Text, Text] = {"title": "stub", "url": "stub"}
+
+
+class TestMetrics(TestCase):
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.server.json("/planetary/apod", APOD, {"X-RateLimit-Remaining": "41"})
+        self.server.route(
+            "/DONKI/CME", lambda *_: (404, {"Content-Type": "text/plain"}, b"missing")
+        )
+        self.metrics: MetricsCollector = MetricsCollector()
+
+    def tearDown(self) -> None:
+        self.server.stop()
+
+    def test_counters_and_histograms_per_path(self):
+        # Arrange
+        client: Client = Client(base_url=self.server.url, observers=[self.metrics])
+        # Act
+        client.apod()
+        client.apod()
+        with self.assertRaises(NASAHTTPError):
+            client.donki_cme()
+        # Assert
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(
+            snapshot["requests"],
+            {("/planetary/apod", "200"): 2, ("/DONKI/CME", "404"): 1},
+        )
+        self.assertEqual(snapshot["errors"], {("/DONKI/CME", "NASAHTTPError"): 1})
+        self.assertEqual(
+            snapshot["bytes"]["/planetary/apod"],
+            2 * len(b'{"title": "stub", "url": "stub"}'),
+        )
+        self.assertEqual(snapshot["in_flight"], {"/planetary/apod": 0, "/DONKI/CME": 0})
+        self.assertEqual(snapshot["latency"]["/planetary/apod"]["count"], 2)
+        self.assertEqual(snapshot["rate_limit_remaining"], 41)
+
+    def test_path_parameters_share_one_series(self):
+        # Arrange
+        client: Client = Client(base_url=self.server.url, observers=[self.metrics])
+        # Act
+        for project_id in (17792, 17793, 17794):
+            client.techport(project_id)
+        # Assert
+        self.assertEqual(
+            self.metrics.snapshot()["requests"],
+            {("/techport/api/projects/{id}", "200"): 3},
+        )
+        self.assertEqual(
+            route_label("/EPIC/archive/natural/2021/01/01/png/epic_1b.png"),
+            "/EPIC/archive/{collection}/{year}/{month}/{day}/{variant}/{image}",
+        )
+        self.assertEqual(
+            route_label("/neo/rest/v1/neo/3542519"), "/neo/rest/v1/neo/{id}"
+        )
+        self.assertEqual(
+            route_label("/neo/rest/v1/neo/browse"), "/neo/rest/v1/neo/browse"
+        )
+
+    def test_prometheus_export(self):
+        # Arrange
+        client: Client = Client(base_url=self.server.url, observers=[self.metrics])
+        client.apod()
+        # Act
+        text: Text = self.metrics.to_prometheus()
+        # Assert
+        self.assertIn("# TYPE nasa_requests_total counter", text)
+        self.assertIn(
+            'nasa_requests_total{path="/planetary/apod",status="200"} 1', text
+        )
+        self.assertIn(
+            'nasa_request_duration_seconds_bucket{path="/planetary/apod",le="+Inf"} 1',
+            text,
+        )
+        self.assertIn(
+            'nasa_request_duration_seconds_count{path="/planetary/apod"} 1', text
+        )
+        self.assertIn("nasa_rate_limit_remaining 41", text)
+
+    def test_cache_hits_do_not_count_bytes(self):
+        # Arrange
+        client: Client = Client(base_url=self.server.url, cache=MemoryCache())
+        client.add_observer(self.metrics)
+        # Act
+        client.apod()
+        client.apod()
+        # Assert
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(
+            snapshot["cache"],
+            {("/planetary/apod", "miss"): 1, ("/planetary/apod", "hit"): 1},
+        )
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(snapshot["bytes"]["/planetary/apod"], self.server.bytes_sent)
+
+    def test_image_events(self):
+        # Arrange
+        buffer: BytesIO = BytesIO()
+        Image.new("RGB", (4, 4)).save(buffer, format="PNG")
+        image: bytes = buffer.getvalue()
+        self.server.route(
+            "/image.png", lambda *_: (200, {"Content-Type": "image/png"}, image)
+        )
+        events: List[RequestEvent] = []
+        # Act
+        get_urls_images([f"{self.server.url}/image.png"], observers=[events.append])
+        # Assert
+        self.assertEqual([event.kind for event in events], ["start", "bytes", "end"])
+        self.assertEqual(events[1].size, len(image))
+        self.assertEqual(events[2].path, "/image.png")
+        self.assertEqual(events[2].status_code, 200)
+
+    def test_image_bytes_without_content_length(self):
+        # Arrange
+        buffer: BytesIO = BytesIO()
+        Image.new("RGB", (4, 4)).save(buffer, format="PNG")
+        image: bytes = buffer.getvalue()
+        response: Response = Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict({"Content-Type": "image/png"})
+        response.url = "http://stub/chunked.png"
+        response.raw = BytesIO(image)
+        events: List[RequestEvent] = []
+        # Act
+        get_url_image(
+            response.url,
+            session=Mock(get=Mock(return_value=response)),
+            observers=[events.append],
+            progress="none",
+        )
+        # Assert
+        self.assertEqual(events[1].kind, "bytes")
+        self.assertEqual(events[1].size, len(image))
+
+
+class TestAsyncMetrics(IsolatedAsyncioTestCase):
+    async def test_async_client_events(self):
+        # Arrange
+        events: List[RequestEvent] = []
+        with StubServer() as server:
+            server.json("/planetary/apod", APOD)
+            async with AsyncClient(
+                base_url=server.url, observers=[events.append]
+            ) as client:
+                # Act
+                await client.apod()
+        # Assert
+        self.assertEqual([event.kind for event in events], ["start", "bytes", "end"])
+        self.assertEqual(events[-1].status_code, 200)
+        self.assertGreater(events[-1].elapsed, 0)
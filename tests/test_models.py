@@ -0,0 +1,81 @@
+from datetime import date
+from typing import Any, Dict, List
+from unittest import TestCase
+
+from benchmarks.bench_neo_models import compare
+from benchmarks.mock_api import neo_feed, neo_object
+from nasa.models import CloseApproach, NearEarthObject, NeoFeed
+
+
+class TestNeoModels(TestCase):
+    def test_fields_are_parsed_to_floats(self):
+        # Arrange
+        neo: NearEarthObject = NearEarthObject(neo_object(3))
+        # Act
+        approach: CloseApproach = neo.close_approaches[0]
+        # Assert
+        self.assertEqual(neo.id, "2000003")
+        self.assertAlmostEqual(neo.diameter_min_km, 0.103)
+        self.assertAlmostEqual(neo.diameter_max_km, 0.303)
+        self.assertFalse(neo.is_potentially_hazardous)
+        self.assertEqual(approach.epoch, 1609459200000)
+        self.assertEqual(approach.relative_velocity_kps, 13.0)
+        self.assertEqual(approach.miss_distance_km, 4e6)
+        self.assertIsNone(approach.miss_distance_lunar)
+
+    def test_parsing_is_lazy(self):
+        # Arrange
+        raw: Dict[str, Any] = neo_object(0)
+        neo: NearEarthObject = NearEarthObject(raw)
+        # Act
+        before: Any = neo._raw
+        neo.name
+        # Assert
+        self.assertIs(before, raw)
+        self.assertIsNone(neo._raw)
+
+    def test_models_have_no_instance_dict(self):
+        # Arrange
+        neo: NearEarthObject = NearEarthObject(neo_object(0))
+        # Act / Assert
+        self.assertFalse(hasattr(neo, "__dict__"))
+        with self.assertRaises(AttributeError):
+            neo.unknown
+
+    def test_missing_fields_are_none(self):
+        # Act
+        neo: NearEarthObject = NearEarthObject({"id": "1"})
+        # Assert
+        self.assertIsNone(neo.diameter_max_km)
+        self.assertEqual(neo.close_approaches, [])
+
+    def test_feed_keeps_days_in_order(self):
+        # Arrange
+        response: Dict[str, Any] = neo_feed(date(2021, 1, 1), 3, 2)
+        # Act
+        feed: NeoFeed = NeoFeed(response)
+        ids: List[str] = [neo.id for neo in feed]
+        # Assert
+        self.assertEqual(list(feed.days), ["2021-01-01", "2021-01-02", "2021-01-03"])
+        self.assertEqual(len(feed), 6)
+        self.assertEqual(ids, [str(2000000 + i) for i in range(6)])
+
+    def test_to_dict(self):
+        # Arrange
+        neo: NearEarthObject = NearEarthObject(neo_object(1))
+        # Act
+        result: Dict[str, Any] = neo.to_dict()
+        # Assert
+        self.assertEqual(result["close_approaches"][0]["miss_distance_km"], 2e6)
+        self.assertEqual(neo, NearEarthObject(neo_object(1)))
+
+
+class TestNeoModelsBenchmark(TestCase):
+    def test_models_retain_less_memory(self):
+        # Act
+        results: Dict[str, Dict[str, float]] = compare(days=5, per_day=20, repeat=1)
+        # Assert
+        self.assertEqual(results["models"]["objects"], 100)
+        self.assertLess(
+            results["models"]["retained_bytes"], results["dict"]["retained_bytes"]
+        )
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import time
+from typing import Dict, List, Text
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from nasa.clients.async_main import AsyncClient
+from nasa.clients.main import Client
+from nasa.exceptions import NASAUnidentifiedError
+from nasa.typing import JSONType
+from benchmarks.server import StubServer
+
+PATH: Text = "/mars-photos/api/v1/rovers/spirit/photos"
+PAGE_SIZES: Dict[int, int] = {1: 25, 2: 25, 3: 10}
+
+
+def photos_page(path: Text, query: Dict[Text, List[Text]], headers: Dict) -> tuple:
+    page: int = int(query["page"][0])
+    photos: List[JSONType] = [
+        {"id": page * 100 + i} for i in range(PAGE_SIZES.get(page, 0))
+    ]
+    body: bytes = json.dumps({"photos": photos}).encode()
+    return 200, {"Content-Type": "application/json"}, body
+
+
+class TestMarsRoverPhotosPages(TestCase):
+    def test_all_pages(self):
+        # Arrange
+        with StubServer({PATH: photos_page}) as server:
+            client: Client = Client(base_url=server.url)
+            # Act
+            response: JSONType = client.mars_rover_photos_all_pages("spirit", sol=1)
+        # Assert
+        self.assertEqual(len(response["photos"]), 60)
+        self.assertEqual(response["photos"][-1], {"id": 309})
+
+    def test_pages_are_lazy(self):
+        # Arrange
+        with StubServer({PATH: photos_page}) as server:
+            client: Client = Client(base_url=server.url)
+            # Act
+            pages = client.mars_rover_photos_pages("spirit", sol=1, prefetch=0)
+            first: JSONType = next(pages)
+            time.sleep(0.1)
+            requested: int = len(server.requests)
+            pages.close()
+        # Assert
+        self.assertEqual(len(first["photos"]), 25)
+        self.assertEqual(requested, 1)
+
+    def test_prefetch_bounds_the_pages_ahead(self):
+        # Arrange
+        with StubServer({PATH: photos_page}) as server:
+            client: Client = Client(base_url=server.url)
+            # Act
+            pages = client.mars_rover_photos_pages("spirit", sol=1, prefetch=1)
+            next(pages)
+            time.sleep(0.1)
+            requested: int = len(server.requests)
+            pages.close()
+        # Assert
+        self.assertEqual(requested, 2)
+
+
+class TestAsyncMarsRoverPhotosPages(IsolatedAsyncioTestCase):
+    async def test_all_pages(self):
+        # Arrange
+        with StubServer({PATH: photos_page}) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                # Act
+                response: JSONType = await client.mars_rover_photos_all_pages(
+                    "spirit", sol=1
+                )
+        # Assert
+        self.assertEqual(len(response["photos"]), 60)
+
+    async def test_pages_are_lazy(self):
+        # Arrange
+        with StubServer({PATH: photos_page}) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                pages = client.mars_rover_photos_pages("spirit", sol=1, prefetch=0)
+                # Act
+                first: JSONType = await pages.__anext__()
+                await asyncio.sleep(0.1)
+                requested: int = len(server.requests)
+                await pages.aclose()
+        # Assert
+        self.assertEqual(len(first["photos"]), 25)
+        self.assertEqual(requested, 1)
+
+    async def test_malformed_page_raises_nasa_error(self):
+        # Arrange
+        with StubServer() as server:
+            async with AsyncClient(base_url=server.url) as client:
+                pages = client.mars_rover_photos_pages("spirit", sol=1)
+                # Act & Assert
+                with self.assertRaises(NASAUnidentifiedError):
+                    async for _ in pages:
+                        pass
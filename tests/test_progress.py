@@ -0,0 +1,160 @@
+import os
+from io import BytesIO
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List, Optional, Text, Tuple
+from unittest import TestCase
+from unittest.mock import patch
+
+from PIL import Image
+from benchmarks.bench_progress import compare
+from nasa.clients.main import Client
+from nasa.exceptions import NASAInvalidInput
+from nasa.progress import (
+    NO_PROGRESS,
+    CallbackProgress,
+    MetricsProgress,
+    NoProgress,
+    Progress,
+    TqdmProgress,
+    get_progress,
+)
+from nasa.utils import download_to, get_urls_images
+from benchmarks.server import StubServer
+
+CONTENT: bytes = bytes(range(256)) * 64
+
+
+def png_bytes() -> bytes:
+    buffer: BytesIO = BytesIO()
+    Image.new("RGB", (4, 4)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestProgress(TestCase):
+    def test_updates_are_batched_by_size(self):
+        # Arrange
+        flushed: List[int] = []
+        progress: Progress = Progress(flushed.append, min_size=100, min_interval=60)
+        # Act
+        for _ in range(25):
+            progress.update(10)
+        progress.close()
+        # Assert
+        self.assertEqual(flushed, [100, 100, 50])
+
+    def test_updates_are_batched_by_time(self):
+        # Arrange
+        flushed: List[int] = []
+        progress: Progress = Progress(flushed.append, min_size=100, min_interval=1)
+        # Act
+        with patch("nasa.progress.time.monotonic", side_effect=[0.5, 1.5, 1.5]):
+            progress.flushed_at = 0
+            progress.update(10)
+            progress.update(10)
+        # Assert
+        self.assertEqual(flushed, [20])
+
+    def test_flush_by_size_restarts_the_interval(self):
+        # Arrange
+        flushed: List[int] = []
+        progress: Progress = Progress(flushed.append, min_size=100, min_interval=1)
+        # Act
+        with patch("nasa.progress.time.monotonic", side_effect=[10, 10.5]):
+            progress.flushed_at = 0
+            progress.update(100)
+            progress.update(10)
+        # Assert
+        self.assertEqual(flushed, [100])
+        self.assertEqual(progress.pending, 10)
+
+    def test_get_progress(self):
+        # Act / Assert
+        self.assertIsInstance(get_progress("none"), NoProgress)
+        self.assertIs(get_progress(None), NO_PROGRESS)
+        self.assertIsInstance(get_progress("tqdm"), TqdmProgress)
+        self.assertIsInstance(get_progress(lambda *_: None), CallbackProgress)
+        with self.assertRaises(NASAInvalidInput):
+            get_progress("bar")
+
+    def test_none_opens_no_task(self):
+        # Act / Assert
+        self.assertIsNone(NO_PROGRESS.open("task", 10))
+
+
+class TestProgressSinks(TestCase):
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.directory: TemporaryDirectory = TemporaryDirectory()
+        self.path: Text = os.path.join(self.directory.name, "file.bin")
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        self.directory.cleanup()
+
+    def test_callback_receives_the_total(self):
+        # Arrange
+        self.server.route(
+            "/file.bin", lambda *_: (200, {"Content-Type": "image/png"}, CONTENT)
+        )
+        calls: List[Tuple[Text, int, Optional[int]]] = []
+        # Act
+        download_to(
+            f"{self.server.url}/file.bin",
+            self.path,
+            chunk_size=1024,
+            progress=lambda *args: calls.append(args),
+        )
+        # Assert
+        self.assertEqual(calls[-1][1:], (len(CONTENT), len(CONTENT)))
+        self.assertEqual(len(calls), 1)
+
+    def test_metrics_count_images(self):
+        # Arrange
+        image: bytes = png_bytes()
+        self.server.route(
+            "/image.png", lambda *_: (200, {"Content-Type": "image/png"}, image)
+        )
+        metrics: MetricsProgress = MetricsProgress()
+        # Act
+        get_urls_images([f"{self.server.url}/image.png"] * 3, progress=metrics)
+        # Assert
+        self.assertEqual(metrics.done, {"B": 3 * len(image), "image": 3})
+        self.assertEqual(metrics.started, metrics.finished)
+        self.assertEqual(metrics.started, 4)
+
+    def test_client_progress(self):
+        # Arrange
+        self.server.json(
+            "/planetary/apod",
+            {"url": f"{self.server.url}/image.png", "media_type": "image"},
+        )
+        self.server.route(
+            "/image.png", lambda *_: (200, {"Content-Type": "image/png"}, png_bytes())
+        )
+        metrics: MetricsProgress = MetricsProgress()
+        client: Client = Client(base_url=self.server.url, progress=metrics)
+        # Act
+        client.apod(get_image=True)
+        client.close()
+        # Assert
+        self.assertEqual(metrics.done["image"], 1)
+
+    def test_none_does_not_import_tqdm(self):
+        # Arrange
+        self.server.route(
+            "/file.bin", lambda *_: (200, {"Content-Type": "image/png"}, CONTENT)
+        )
+        # Act
+        with patch.dict("sys.modules", {"tqdm": None, "tqdm.auto": None}):
+            download_to(f"{self.server.url}/file.bin", self.path, progress="none")
+        # Assert
+        self.assertEqual(os.path.getsize(self.path), len(CONTENT))
+
+
+class TestProgressBenchmark(TestCase):
+    def test_every_sink_is_timed(self):
+        # Act
+        results: Dict[Text, Any] = compare(chunks=100, chunk_size=8, repeat=1)
+        # Assert
+        self.assertIn("no sink", results)
+        self.assertIn("per chunk tqdm", results)
@@ -0,0 +1,93 @@
+import json
+from datetime import date, timedelta
+from typing import Dict, List, Text, Tuple
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from nasa.clients.async_main import AsyncClient
+from nasa.clients.main import Client
+from nasa.exceptions import NASAInvalidInput
+from nasa.typing import JSONType
+from nasa.utils import date_windows
+from benchmarks.server import StubServer
+
+
+def neo_feed(path: Text, query: Dict[Text, List[Text]], headers: Dict) -> Tuple:
+    start: date = date.fromisoformat(query["start_date"][0])
+    end: date = date.fromisoformat(query["end_date"][0])
+    # The feed repeats the day after the window, like a boundary overlap
+    days: List[date] = [
+        start + timedelta(days=i) for i in range((end - start).days + 2)
+    ]
+    body: JSONType = {
+        "element_count": len(days),
+        "near_earth_objects": {
+            day.isoformat(): [{"id": day.isoformat()}] for day in days
+        },
+    }
+    return 200, {"Content-Type": "application/json"}, json.dumps(body).encode()
+
+
+def donki_cme(path: Text, query: Dict[Text, List[Text]], headers: Dict) -> Tuple:
+    start: Text = query["startDate"][0]
+    end: Text = query["endDate"][0]
+    body: JSONType = [{"activityID": start}, {"activityID": "a"}, {"activityID": end}]
+    return 200, {"Content-Type": "application/json"}, json.dumps(body).encode()
+
+
+class TestDateRanges(TestCase):
+    def test_date_windows(self):
+        # Act
+        windows = date_windows(date(2021, 1, 1), date(2021, 1, 16), 7)
+        # Assert
+        self.assertEqual(
+            windows,
+            [
+                (date(2021, 1, 1), date(2021, 1, 7)),
+                (date(2021, 1, 8), date(2021, 1, 14)),
+                (date(2021, 1, 15), date(2021, 1, 16)),
+            ],
+        )
+
+    def test_neo_feed_range(self):
+        # Arrange
+        with StubServer({"/neo/rest/v1/feed": neo_feed}) as server:
+            client: Client = Client(base_url=server.url)
+            # Act
+            response: JSONType = client.neo_feed_range("2021-01-01", "2021-02-15")
+        # Assert
+        self.assertEqual(len(server.requests), 7)
+        self.assertEqual(response["element_count"], 46)
+        self.assertEqual(list(response["near_earth_objects"])[-1], "2021-02-15")
+
+    def test_donki_range_dedupes_boundaries(self):
+        # Arrange
+        with StubServer({"/DONKI/CME": donki_cme}) as server:
+            client: Client = Client(base_url=server.url)
+            # Act
+            events: JSONType = client.donki_range(
+                "CME", "2021-01-01", "2021-01-10", window_days=5
+            )
+        # Assert
+        self.assertEqual(
+            [event["activityID"] for event in events],
+            ["2021-01-01", "a", "2021-01-05", "2021-01-06", "2021-01-10"],
+        )
+
+    def test_missing_start_date(self):
+        # Assert
+        with self.assertRaises(NASAInvalidInput):
+            # Act
+            Client().neo_feed_range(None)
+
+
+class TestAsyncDateRanges(IsolatedAsyncioTestCase):
+    async def test_neo_feed_range(self):
+        # Arrange
+        with StubServer({"/neo/rest/v1/feed": neo_feed}) as server:
+            async with AsyncClient(base_url=server.url) as client:
+                # Act
+                response: JSONType = await client.neo_feed_range(
+                    "2021-01-01", "2021-02-15", max_workers=2
+                )
+        # Assert
+        self.assertEqual(response["element_count"], 46)
@@ -0,0 +1,61 @@
+import time
+from typing import Dict, List, Text
+from unittest import TestCase
+
+from nasa.clients.main import Client
+from nasa.ratelimit import RateLimiter
+from benchmarks.server import StubServer
+
+
+class TestRateLimit(TestCase):
+    def test_keys_rotate_while_quota_unknown(self):
+        # Arrange
+        limiter: RateLimiter = RateLimiter(["a", "b", "c"])
+        # Act
+        keys: List[Text] = [limiter.acquire() for _ in range(6)]
+        # Assert
+        self.assertEqual(keys, ["a", "b", "c", "a", "b", "c"])
+
+    def test_token_bucket_paces_requests(self):
+        # Arrange
+        limiter: RateLimiter = RateLimiter(["a"], limit=2, period=0.2)
+        # Act
+        start: float = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        elapsed: float = time.monotonic() - start
+        # Assert
+        self.assertGreaterEqual(elapsed, 0.09)
+
+    def test_exhausted_key_is_skipped(self):
+        # Arrange
+        limiter: RateLimiter = RateLimiter(["a", "b"])
+        limiter.update("a", 429, {"X-RateLimit-Limit": "1000"})
+        limiter.update("b", 200, {"X-RateLimit-Limit": "1000"})
+        # Act
+        keys: List[Text] = [limiter.acquire() for _ in range(3)]
+        # Assert
+        self.assertEqual(keys, ["b", "b", "b"])
+
+    def test_client_reads_rate_limit_headers(self):
+        # Arrange
+        remaining: Dict[Text, int] = {"key-a": 1, "key-b": 100}
+
+        def apod(path, query, headers):
+            key: Text = query["api_key"][0]
+            remaining[key] -= 1
+            rate_headers: Dict[Text, Text] = {
+                "Content-Type": "application/json",
+                "X-RateLimit-Limit": "1000",
+                "X-RateLimit-Remaining": str(remaining[key]),
+            }
+            return 200, rate_headers, b"{}"
+
+        with StubServer({"/planetary/apod": apod}) as server:
+            client: Client = Client(["key-a", "key-b"], base_url=server.url)
+            # Act
+            for _ in range(4):
+                client.apod()
+        # Assert
+        used: List[Text] = [query["api_key"][0] for _, query, _ in server.requests]
+        self.assertEqual(used, ["key-a", "key-b", "key-b", "key-b"])
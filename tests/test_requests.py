@@ -72,7 +72,7 @@ class TestRequests(TestCase):
         },
     }
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_base_client(self, mock_get_requests: Mock) -> None:
         # Arrange
         parameter: Dict[Text, JSONType] = self.parameters["test_base_client"]
@@ -84,10 +84,10 @@ class TestRequests(TestCase):
         client._get(path, params)
         # Assert
         mock_get_requests.assert_called_once_with(
-            url, params, auth=NASAAuth(self.API_KEY)
+            url, params=params, auth=NASAAuth(self.API_KEY)
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_apod_client(self, mock_get_requests: Mock) -> None:
         # Arrange
         parameter: Dict[Text, JSONType] = self.parameters["test_apod_client"]
@@ -99,10 +99,10 @@ class TestRequests(TestCase):
         client.apod()
         # Assert
         mock_get_requests.assert_called_once_with(
-            url, params, auth=NASAAuth(self.API_KEY)
+            url, params=params, auth=NASAAuth(self.API_KEY)
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_donki_client(self, mock_get_requests: Mock) -> None:
         # Arrange
         parameter: Dict[Text, JSONType] = self.parameters["test_donki_client"]
@@ -114,10 +114,10 @@ class TestRequests(TestCase):
         client.donki_cme()
         # Assert
         mock_get_requests.assert_called_once_with(
-            url, params, auth=NASAAuth(self.API_KEY)
+            url, params=params, auth=NASAAuth(self.API_KEY)
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_earth_client(self, mock_get_requests: Mock) -> None:
         # Arrange
         parameter: Dict[Text, JSONType] = self.parameters["test_earth_client"]
@@ -129,10 +129,10 @@ class TestRequests(TestCase):
         client.earth_assets(params["lat"], params["lon"])
         # Assert
         mock_get_requests.assert_called_once_with(
-            url, params, auth=NASAAuth(self.API_KEY)
+            url, params=params, auth=NASAAuth(self.API_KEY)
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_epic_client(self, mock_get_requests: Mock) -> None:
         # Arrange
         parameter: Dict[Text, JSONType] = self.parameters["test_epic_client"]
@@ -144,10 +144,10 @@ class TestRequests(TestCase):
         client.epic_natural()
         # Assert
         mock_get_requests.assert_called_once_with(
-            url, params, auth=NASAAuth(self.API_KEY)
+            url, params=params, auth=NASAAuth(self.API_KEY)
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_insight_client(self, mock_get_requests: Mock) -> None:
         # Arrange
         parameter: Dict[Text, JSONType] = self.parameters["test_insight_client"]
@@ -159,10 +159,10 @@ class TestRequests(TestCase):
         client.insight()
         # Assert
         mock_get_requests.assert_called_once_with(
-            url, params, auth=NASAAuth(self.API_KEY)
+            url, params=params, auth=NASAAuth(self.API_KEY)
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_mars_rover_photos_client(self, mock_get_requests: Mock) -> None:
         # Arrange
         parameter: Dict[Text, JSONType] = self.parameters[
@@ -176,10 +176,10 @@ class TestRequests(TestCase):
         client.mars_rover_photos("curiousity")
         # Assert
         mock_get_requests.assert_called_once_with(
-            url, params, auth=NASAAuth(self.API_KEY)
+            url, params=params, auth=NASAAuth(self.API_KEY)
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_neo_client(self, mock_get_requests: Mock) -> None:
         # Arrange
         parameter: Dict[Text, JSONType] = self.parameters["test_neo_client"]
@@ -191,10 +191,10 @@ class TestRequests(TestCase):
         client.neo_browse()
         # Assert
         mock_get_requests.assert_called_once_with(
-            url, params, auth=NASAAuth(self.API_KEY)
+            url, params=params, auth=NASAAuth(self.API_KEY)
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_tech_transfer_client(self, mock_get_requests: Mock) -> None:
         # Arrange
         parameter: Dict[Text, JSONType] = self.parameters["test_tech_transfer_client"]
@@ -206,10 +206,10 @@ class TestRequests(TestCase):
         client.tech_transfer_patent()
         # Assert
         mock_get_requests.assert_called_once_with(
-            url, params, auth=NASAAuth(self.API_KEY)
+            url, params=params, auth=NASAAuth(self.API_KEY)
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_techport_client(self, mock_get_requests: Mock) -> None:
         # Arrange
         parameter: Dict[Text, JSONType] = self.parameters["test_techport_client"]
@@ -221,5 +221,5 @@ class TestRequests(TestCase):
         client.techport()
         # Assert
         mock_get_requests.assert_called_once_with(
-            url, params, auth=NASAAuth(self.API_KEY)
+            url, params=params, auth=NASAAuth(self.API_KEY)
         )
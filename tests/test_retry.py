@@ -0,0 +1,229 @@
+import asyncio
+import json
+import time
+from email.utils import formatdate
+from typing import Dict, List, Text
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
+
+import requests
+
+from nasa.clients.async_main import AsyncClient
+from nasa.clients.main import Client
+from nasa.exceptions import NASACircuitOpen, NASAHTTPError, NASAUnidentifiedError
+from nasa.metrics import RequestEvent
+from nasa.retry import NO_RETRY, CircuitBreaker, RetryPolicy, parse_retry_after
+from benchmarks.server import StubServer
+
+FAST_RETRY: RetryPolicy = RetryPolicy(backoff=0.01)
+
+
+def failing(statuses: List[int], headers: Dict[Text, Text] = dict()):
+    """Route answering with the given statuses, then 200"""
+
+    def handler(*_):
+        if statuses:
+            return statuses.pop(0), headers, b"{}"
+        return 200, {"Content-Type": "application/json"}, b'{"ok": true}'
+
+    return handler
+
+
+class TestRetry(TestCase):
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.events: List[RequestEvent] = []
+
+    def tearDown(self) -> None:
+        self.server.stop()
+
+    def client(self, **kwargs) -> Client:
+        return Client(
+            base_url=self.server.url, observers=[self.events.append], **kwargs
+        )
+
+    def test_retry_server_errors(self):
+        # Arrange
+        self.server.route("/planetary/apod", failing([503, 502]))
+        # Act
+        response = self.client(retry=FAST_RETRY).apod()
+        # Assert
+        self.assertEqual(response, {"ok": True})
+        self.assertEqual(len(self.server.requests), 3)
+        retries: List[RequestEvent] = [e for e in self.events if e.kind == "retry"]
+        self.assertEqual(
+            [(e.attempt, e.status_code) for e in retries], [(1, 503), (2, 502)]
+        )
+
+    def test_give_up_after_max_attempts(self):
+        # Arrange
+        self.server.route("/planetary/apod", failing([500, 500, 500]))
+        # Assert
+        with self.assertRaises(NASAHTTPError):
+            # Act
+            self.client(retry=FAST_RETRY).apod()
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_retry_after_is_honoured(self):
+        # Arrange
+        self.server.route("/planetary/apod", failing([429], {"Retry-After": "0"}))
+        # Act
+        self.client(retry=RetryPolicy(backoff=10)).apod()
+        # Assert
+        retry: RequestEvent = next(e for e in self.events if e.kind == "retry")
+        self.assertEqual(retry.delay, 0)
+
+    def test_long_retry_after_is_not_retried(self):
+        # Arrange
+        self.server.route("/planetary/apod", failing([429], {"Retry-After": "3600"}))
+        # Assert
+        with self.assertRaises(NASAHTTPError):
+            # Act
+            self.client(retry=FAST_RETRY).apod()
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_policy_by_path_prefix(self):
+        # Arrange
+        self.server.route("/DONKI/CME", failing([503]))
+        self.server.route("/planetary/apod", failing([503]))
+        client: Client = self.client(retry={"": FAST_RETRY, "/DONKI": NO_RETRY})
+        # Act
+        client.apod()
+        # Assert
+        with self.assertRaises(NASAHTTPError):
+            client.donki_cme()
+
+    def test_circuit_breaker_fails_fast(self):
+        # Arrange
+        self.server.route("/DONKI/CME", failing([500, 500]))
+        client: Client = self.client(
+            retry=NO_RETRY,
+            circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=0.1),
+        )
+        for _ in range(2):
+            with self.assertRaises(NASAHTTPError):
+                client.donki_cme()
+        # Act & Assert
+        with self.assertRaises(NASACircuitOpen):
+            client.donki_cme()
+        self.assertEqual(len(self.server.requests), 2)
+        client.apod()
+        time.sleep(0.1)
+        self.assertEqual(client.donki_cme(), {"ok": True})
+        self.assertEqual(client._circuit_breaker.state("/DONKI/CME"), "closed")
+
+    def test_trial_request_raising_releases_circuit(self):
+        # Arrange
+        self.server.route("/DONKI/CME", failing([500]))
+        client: Client = self.client(
+            retry=NO_RETRY,
+            circuit_breaker=CircuitBreaker(failure_threshold=1, recovery_timeout=0.1),
+        )
+        with self.assertRaises(NASAHTTPError):
+            client.donki_cme()
+        time.sleep(0.1)
+        # Act
+        with patch.object(
+            client._session, "get", side_effect=requests.exceptions.ChunkedEncodingError
+        ):
+            with self.assertRaises(NASAUnidentifiedError):
+                client.donki_cme()
+        # Assert
+        self.assertEqual(client._circuit_breaker.state("/DONKI/CME"), "open")
+        self.assertEqual(client._circuit_breaker.circuits["DONKI"].failures, 1)
+        self.assertEqual(client.donki_cme(), {"ok": True})
+        self.assertEqual(client._circuit_breaker.state("/DONKI/CME"), "closed")
+
+    def test_stuck_trial_request_is_replaced(self):
+        # Arrange
+        breaker: CircuitBreaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=0.1
+        )
+        breaker.record_failure("/EPIC/api")
+        time.sleep(0.1)
+        breaker.before_call("/EPIC/api")
+        # Act & Assert
+        with self.assertRaises(NASACircuitOpen):
+            breaker.before_call("/EPIC/api")
+        time.sleep(0.1)
+        breaker.before_call("/EPIC/api")
+        self.assertEqual(breaker.state("/EPIC/api"), "half-open")
+
+    def test_parse_retry_after(self):
+        # Assert
+        self.assertEqual(parse_retry_after({"Retry-After": "120"}), 120)
+        self.assertAlmostEqual(
+            parse_retry_after(
+                {"Retry-After": formatdate(time.time() + 60, usegmt=True)}
+            ),
+            60,
+            delta=2,
+        )
+        self.assertIsNone(parse_retry_after({"Retry-After": "soon"}))
+        self.assertIsNone(parse_retry_after({}))
+
+
+class TestAsyncRetry(IsolatedAsyncioTestCase):
+    async def test_retry_server_errors(self):
+        # Arrange
+        with StubServer() as server:
+            server.route("/planetary/apod", failing([503]))
+            async with AsyncClient(base_url=server.url, retry=FAST_RETRY) as client:
+                # Act
+                response = await client.apod()
+        # Assert
+        self.assertEqual(response, {"ok": True})
+        self.assertEqual(len(server.requests), 2)
+
+    async def test_cancelled_trial_request_releases_circuit(self):
+        # Arrange
+        breaker: CircuitBreaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=0.1
+        )
+        breaker.record_failure("/planetary/apod")
+        await asyncio.sleep(0.1)
+        with StubServer() as server:
+            server.route(
+                "/planetary/apod", lambda *_: time.sleep(0.5) or (200, {}, b"{}")
+            )
+            async with AsyncClient(
+                base_url=server.url,
+                retry=NO_RETRY,
+                circuit_breaker=breaker,
+                coalesce=False,
+            ) as client:
+                # Act
+                with self.assertRaises(asyncio.TimeoutError):
+                    await asyncio.wait_for(client.apod(), 0.05)
+        # Assert
+        self.assertEqual(breaker.state("/planetary/apod"), "open")
+        self.assertEqual(breaker.circuits["planetary/apod"].failures, 1)
+        breaker.before_call("/planetary/apod")
+        self.assertEqual(breaker.state("/planetary/apod"), "half-open")
+
+    async def test_abandoned_prefetch_does_not_open_circuit(self):
+        # Arrange
+        breaker: CircuitBreaker = CircuitBreaker(failure_threshold=1)
+        path: Text = "/mars-photos/api/v1/rovers/spirit/photos"
+
+        def photos(path: Text, query: Dict[Text, List[Text]], headers: Dict) -> tuple:
+            if query["page"] != ["1"]:
+                time.sleep(0.2)
+            body: bytes = json.dumps({"photos": [{"id": 1}] * 25}).encode()
+            return 200, {"Content-Type": "application/json"}, body
+
+        with StubServer({path: photos}) as server:
+            async with AsyncClient(
+                base_url=server.url,
+                retry=NO_RETRY,
+                circuit_breaker=breaker,
+                coalesce=False,
+            ) as client:
+                pages = client.mars_rover_photos_pages("spirit", sol=1, prefetch=5)
+                # Act
+                await pages.__anext__()
+                await pages.aclose()
+                await asyncio.sleep(0)
+                # Assert
+                self.assertEqual(breaker.state(path), "closed")
+                self.assertEqual(breaker.circuits["mars-photos"].failures, 0)
@@ -0,0 +1,61 @@
+from io import BytesIO
+from unittest import TestCase
+
+import requests
+from PIL import Image
+from nasa.clients.base import BaseClient
+from nasa.clients.main import Client
+from benchmarks.server import StubServer
+
+
+class TestSession(TestCase):
+    def test_session_is_shared_by_mixins(self):
+        # Arrange
+        with StubServer() as server:
+            client: Client = Client(base_url=server.url)
+            # Act
+            client.apod()
+            client.donki_cme()
+            client.neo_browse()
+            client.insight()
+            client.close()
+        # Assert
+        self.assertEqual(len(server.requests), 4)
+        self.assertEqual(server.connections, 1)
+
+    def test_pool_configuration(self):
+        # Arrange
+        client: BaseClient = BaseClient(pool_maxsize=3, pool_block=True)
+        # Act
+        adapter = client._session.get_adapter(client.BASE_URL)
+        # Assert
+        self.assertEqual(adapter._pool_maxsize, 3)
+        self.assertTrue(adapter._pool_block)
+
+    def test_external_session_is_not_closed(self):
+        # Arrange
+        session: requests.Session = requests.Session()
+        # Act
+        with BaseClient(session=session) as client:
+            pass
+        # Assert
+        self.assertIs(client._session, session)
+        self.assertFalse(client._owns_session)
+
+    def test_image_response_is_fetched_once(self):
+        # Arrange
+        buffer: BytesIO = BytesIO()
+        Image.new("RGB", (8, 8)).save(buffer, format="PNG")
+        image: bytes = buffer.getvalue()
+        with StubServer() as server:
+            server.route(
+                "/planetary/earth/imagery",
+                lambda *_: (200, {"Content-Type": "image/png"}, image),
+            )
+            client: Client = Client(base_url=server.url)
+            # Act
+            response = client.earth_imagery(lat=0, lon=0)
+        # Assert
+        self.assertEqual(response.size, (8, 8))
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(server.bytes_sent, len(image))
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import Any, List
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from nasa.clients.async_main import AsyncClient
+from nasa.clients.main import Client
+from nasa.exceptions import NASAHTTPError
+from benchmarks.server import StubServer
+
+
+def slow(status: int, body: bytes):
+    def handler(*_):
+        time.sleep(0.2)
+        return status, {"Content-Type": "application/json"}, body
+
+    return handler
+
+
+class TestSingleFlight(TestCase):
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.server.route("/planetary/apod", slow(200, b'{"title": "stub"}'))
+        self.server.route("/DONKI/CME", slow(404, b"{}"))
+
+    def tearDown(self) -> None:
+        self.server.stop()
+
+    def call_concurrently(self, function, n: int = 8) -> List[Any]:
+        barrier: Barrier = Barrier(n)
+
+        def call(_) -> Any:
+            barrier.wait()
+            try:
+                return function()
+            except Exception as error:
+                return error
+
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            return list(executor.map(call, range(n)))
+
+    def test_identical_calls_share_one_request(self):
+        # Arrange
+        client: Client = Client(base_url=self.server.url)
+        # Act
+        results: List[Any] = self.call_concurrently(client.apod)
+        # Assert
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(results, [{"title": "stub"}] * 8)
+        self.assertIsNot(results[0], results[1])
+
+    def test_errors_are_shared(self):
+        # Arrange
+        client: Client = Client(base_url=self.server.url)
+        # Act
+        results: List[Any] = self.call_concurrently(client.donki_cme)
+        # Assert
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertTrue(all(isinstance(r, NASAHTTPError) for r in results))
+
+    def test_different_params_are_not_shared(self):
+        # Arrange
+        client: Client = Client(base_url=self.server.url)
+        dates: List[str] = ["2021-01-01", "2021-01-02"]
+        # Act
+        self.call_concurrently(lambda: client.apod(date=dates.pop()), n=2)
+        # Assert
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_coalescing_can_be_disabled(self):
+        # Arrange
+        client: Client = Client(base_url=self.server.url, coalesce=False)
+        # Act
+        self.call_concurrently(client.apod, n=3)
+        # Assert
+        self.assertEqual(len(self.server.requests), 3)
+
+
+class TestAsyncSingleFlight(IsolatedAsyncioTestCase):
+    async def test_identical_calls_share_one_request(self):
+        # Arrange
+        with StubServer() as server:
+            server.route("/planetary/apod", slow(200, b'{"title": "stub"}'))
+            async with AsyncClient(base_url=server.url) as client:
+                # Act
+                results: List[Any] = await asyncio.gather(
+                    *(client.apod() for _ in range(5))
+                )
+        # Assert
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(results, [{"title": "stub"}] * 5)
+
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        # Arrange
+        with StubServer() as server:
+            server.route("/planetary/apod", slow(200, b'{"title": "stub"}'))
+            async with AsyncClient(base_url=server.url) as client:
+                leader: asyncio.Task = asyncio.ensure_future(client.apod())
+                await asyncio.sleep(0.05)
+                follower: asyncio.Task = asyncio.ensure_future(client.apod())
+                await asyncio.sleep(0.05)
+                # Act
+                leader.cancel()
+                result: Any = await follower
+        # Assert
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(result, {"title": "stub"})
+        self.assertEqual(len(server.requests), 1)
@@ -0,0 +1,511 @@
+import json
+import os
+from datetime import date, timedelta
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List, Text, Tuple
+from unittest import TestCase
+
+from nasa.clients.main import Client
+from nasa.exceptions import NASAInvalidInput
+from nasa.stores.donki import DonkiStore
+from nasa.stores.mars import MarsPhotoStore
+from nasa.stores.techport import TechPortStore
+from nasa.stores.tech_transfer import InvertedIndex, TechTransferIndex
+from benchmarks.server import StubServer
+
+
+class DonkiAPI:
+    """Serves DONKI events of a type, filtered by the startDate and endDate queries"""
+
+    def __init__(self, server: StubServer, api_type: Text, time_field: Text) -> None:
+        self.events: List[Dict[Text, Any]] = []
+        self.time_field: Text = time_field
+        server.route(f"/DONKI/{api_type}", self.handle)
+
+    def handle(self, path: Text, query: Dict[Text, List[Text]], headers: Dict) -> Tuple:
+        start, end = query["startDate"][0], query["endDate"][0]
+        events: List[Dict[Text, Any]] = [
+            event
+            for event in self.events
+            if start <= event[self.time_field][:10] <= end
+        ]
+        body: bytes = json.dumps(events).encode()
+        return 200, {"Content-Type": "application/json"}, body
+
+
+class TestDonkiStore(TestCase):
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.client: Client = Client(base_url=self.server.url)
+        self.cme: DonkiAPI = DonkiAPI(self.server, "CME", "startTime")
+        self.today: date = date.today()
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.server.stop()
+
+    def day(self, days_ago: int) -> Text:
+        return (self.today - timedelta(days=days_ago)).isoformat()
+
+    def cme_event(self, days_ago: int, note: Text = "") -> Dict[Text, Any]:
+        return {
+            "activityID": f"{self.day(days_ago)}-CME-001",
+            "startTime": f"{self.day(days_ago)}T01:00Z",
+            "note": note,
+        }
+
+    def test_first_sync_backfills_from_start_date(self):
+        # Arrange
+        self.cme.events = [self.cme_event(10), self.cme_event(3)]
+        store: DonkiStore = DonkiStore()
+        # Act
+        counts: Dict[Text, int] = store.sync(
+            self.client, ["CME"], start_date=self.day(5)
+        )
+        # Assert
+        self.assertEqual(counts, {"CME": 1})
+        self.assertEqual(store.events("CME"), [self.cme_event(3)])
+        self.assertEqual(store.high_water_mark("CME"), self.today)
+        self.assertEqual(self.server.requests[0][1]["startDate"], [self.day(5)])
+
+    def test_sync_fetches_the_delta_and_upserts(self):
+        # Arrange
+        self.cme.events = [self.cme_event(3)]
+        store: DonkiStore = DonkiStore(overlap_days=1)
+        store.sync(self.client, ["CME"], start_date=self.day(5))
+        self.cme.events = [self.cme_event(3), self.cme_event(0, note="revised")]
+        store.set_state("donki:CME", self.day(1))
+        # Act
+        store.sync(self.client, ["CME"])
+        self.cme.events = [self.cme_event(0, note="final")]
+        store.sync(self.client, ["CME"])
+        # Assert
+        self.assertEqual(
+            [query["startDate"] for _, query, _ in self.server.requests[1:]],
+            [[self.day(2)], [self.day(1)]],
+        )
+        self.assertEqual(store.count("CME"), 2)
+        self.assertEqual(store.events("CME")[-1]["note"], "final")
+
+    def test_events_by_type_and_time(self):
+        # Arrange
+        store: DonkiStore = DonkiStore()
+        store.upsert(
+            "CME",
+            [
+                {"activityID": "a", "startTime": "2021-01-01T00:00Z"},
+                {"activityID": "b", "startTime": "2021-01-03T23:59Z"},
+            ],
+        )
+        store.upsert("FLR", [{"flrID": "c", "beginTime": "2021-01-02T12:00Z"}])
+        # Act
+        events: List[Dict] = store.events(
+            start_date="2021-01-02", end_date="2021-01-03"
+        )
+        # Assert
+        self.assertEqual(
+            [event.get("flrID") or event.get("activityID") for event in events],
+            ["c", "b"],
+        )
+        self.assertEqual(store.count(), 3)
+        self.assertEqual(store.count("CME", end_date="2021-01-02"), 1)
+
+    def test_store_persists(self):
+        with TemporaryDirectory() as directory:
+            # Arrange
+            path: Text = os.path.join(directory, "donki.db")
+            with DonkiStore(path) as store:
+                store.upsert(
+                    "GST",
+                    [{"gstID": "g", "startTime": "2021-01-01T00:00Z"}],
+                    self.today,
+                )
+            # Act
+            with DonkiStore(path) as store:
+                events: List[Dict] = store.events("GST")
+                mark: date = store.high_water_mark("GST")
+        # Assert
+        self.assertEqual(events, [{"gstID": "g", "startTime": "2021-01-01T00:00Z"}])
+        self.assertEqual(mark, self.today)
+
+    def test_invalid_event_type(self):
+        # Arrange
+        store: DonkiStore = DonkiStore()
+        # Assert
+        with self.assertRaises(NASAInvalidInput):
+            # Act
+            store.sync(self.client, ["XYZ"])
+        self.assertIsNone(store.high_water_mark("XYZ"))
+
+
+class MarsAPI:
+    """Serves the manifest and the photo pages of the spirit rover"""
+
+    def __init__(self, server: StubServer) -> None:
+        self.sols: Dict[int, int] = dict()
+        server.route("/mars-photos/api/v1/manifests/spirit", self.manifest)
+        server.route("/mars-photos/api/v1/rovers/spirit/photos", self.photos)
+
+    def manifest(self, path: Text, query: Dict, headers: Dict) -> Tuple:
+        body: Dict[Text, Any] = {
+            "photo_manifest": {
+                "name": "Spirit",
+                "max_sol": max(self.sols),
+                "total_photos": sum(self.sols.values()),
+                "photos": [
+                    {
+                        "sol": sol,
+                        "earth_date": f"2004-01-{sol + 4:02d}",
+                        "total_photos": total,
+                    }
+                    for sol, total in sorted(self.sols.items())
+                ],
+            }
+        }
+        return 200, {"Content-Type": "application/json"}, json.dumps(body).encode()
+
+    def photos(self, path: Text, query: Dict[Text, List[Text]], headers: Dict) -> Tuple:
+        sol, page = int(query["sol"][0]), int(query["page"][0])
+        ids: range = range((page - 1) * 25, min(page * 25, self.sols.get(sol, 0)))
+        body: Dict[Text, Any] = {
+            "photos": [
+                {
+                    "id": sol * 1000 + i,
+                    "sol": sol,
+                    "camera": {"name": "NAVCAM" if i % 2 else "PANCAM"},
+                    "img_src": f"http://mars/{sol}/{i}.jpg",
+                    "earth_date": f"2004-01-{sol + 4:02d}",
+                }
+                for i in ids
+            ]
+        }
+        return 200, {"Content-Type": "application/json"}, json.dumps(body).encode()
+
+
+class TestMarsPhotoStore(TestCase):
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.client: Client = Client(base_url=self.server.url)
+        self.api: MarsAPI = MarsAPI(self.server)
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.server.stop()
+
+    def photo_requests(self) -> List[Tuple[int, int]]:
+        return sorted(
+            (int(query["sol"][0]), int(query["page"][0]))
+            for path, query, _ in self.server.requests
+            if path.endswith("/photos")
+        )
+
+    def test_sync_fetches_every_page_of_new_sols(self):
+        # Arrange
+        self.api.sols = {1: 30, 2: 4, 4: 25}
+        store: MarsPhotoStore = MarsPhotoStore()
+        # Act
+        counts: Dict[int, int] = store.sync(self.client, "spirit")
+        # Assert
+        self.assertEqual(counts, {1: 30, 2: 4, 4: 25})
+        self.assertEqual(self.photo_requests(), [(1, 1), (1, 2), (2, 1), (4, 1)])
+        self.assertEqual(store.count("spirit"), 59)
+        self.assertEqual(
+            store.photos("spirit", limit=1),
+            [
+                {
+                    "id": 1000,
+                    "rover": "spirit",
+                    "sol": 1,
+                    "earth_date": "2004-01-05",
+                    "camera": "PANCAM",
+                    "img_src": "http://mars/1/0.jpg",
+                }
+            ],
+        )
+
+    def test_indexed_sols_are_not_fetched_again(self):
+        # Arrange
+        self.api.sols = {1: 3, 2: 4}
+        store: MarsPhotoStore = MarsPhotoStore()
+        store.sync(self.client, "spirit")
+        self.api.sols = {1: 3, 2: 6, 3: 1}
+        self.server.requests.clear()
+        # Act
+        counts: Dict[int, int] = store.sync(self.client, "spirit")
+        store.sync(self.client, "spirit")
+        # Assert
+        self.assertEqual(counts, {2: 6, 3: 1})
+        self.assertEqual(self.photo_requests(), [(2, 1), (3, 1)])
+        self.assertEqual(store.indexed_sols("spirit"), {1: 3, 2: 6, 3: 1})
+        self.assertEqual(store.count("spirit"), 10)
+
+    def test_sync_sol_range(self):
+        # Arrange
+        self.api.sols = {1: 1, 2: 1, 3: 1}
+        store: MarsPhotoStore = MarsPhotoStore()
+        # Act
+        counts: Dict[int, int] = store.sync(
+            self.client, "spirit", start_sol=2, end_sol=2
+        )
+        # Assert
+        self.assertEqual(counts, {2: 1})
+        self.assertEqual(list(store.indexed_sols("spirit")), [2])
+
+    def test_photos_filters(self):
+        # Arrange
+        self.api.sols = {1: 4, 2: 4, 3: 4}
+        store: MarsPhotoStore = MarsPhotoStore()
+        store.sync(self.client, "spirit")
+        # Act
+        navcam: List[Dict] = store.photos("spirit", camera="NAVCAM", start_sol=2)
+        dates: int = store.count(start_date="2004-01-05", end_date="2004-01-06")
+        every_camera: int = store.count("spirit", camera="all", end_sol=1)
+        # Assert
+        self.assertEqual([photo["id"] for photo in navcam], [2001, 2003, 3001, 3003])
+        self.assertEqual(dates, 8)
+        self.assertEqual(every_camera, 4)
+
+    def test_invalid_rover(self):
+        # Arrange
+        store: MarsPhotoStore = MarsPhotoStore()
+        # Assert
+        with self.assertRaises(NASAInvalidInput):
+            # Act
+            store.sync(self.client, "zhurong")
+        self.assertEqual(self.server.requests, [])
+
+
+def tech_transfer_row(api_type: Text, i: int, title: Text) -> List[Any]:
+    return [
+        f"{api_type}{i}",
+        f"GSC-{i}",
+        title,
+        f"<span>{title}</span> device",
+        "",
+        "test",
+    ]
+
+
+class TechTransferAPI:
+    """Serves corpora of TechTransfer results, 2 by page from page 0"""
+
+    def __init__(self, server: StubServer) -> None:
+        self.corpora: Dict[Text, List[List[Any]]] = {
+            api_type: list() for api_type in Client.TECH_TRANSFER_TYPES
+        }
+        for api_type in self.corpora:
+            server.route(f"/techtransfer/{api_type}/", self.results)
+
+    def results(
+        self, path: Text, query: Dict[Text, List[Text]], headers: Dict
+    ) -> Tuple:
+        corpus: List[List[Any]] = self.corpora[path.split("/")[2]]
+        page: int = int(query.get("page", ["0"])[0])
+        body: Dict[Text, Any] = {
+            "results": corpus[page * 2 : page * 2 + 2],
+            "count": len(corpus[page * 2 : page * 2 + 2]),
+            "total": len(corpus),
+            "perpage": 2,
+            "page": page,
+        }
+        return 200, {"Content-Type": "application/json"}, json.dumps(body).encode()
+
+
+class TestInvertedIndex(TestCase):
+    def test_ranking(self):
+        # Arrange
+        index: InvertedIndex = InvertedIndex(
+            [
+                ("a", "solar solar tracker"),
+                ("b", "rocket engine nozzle"),
+                ("c", "solar <span class='highlight'>engine</span>"),
+            ]
+        )
+        # Act
+        solar: List[Tuple[Text, float]] = index.search("Solar")
+        engine: List[Tuple[Text, float]] = index.search("solar engine", limit=1)
+        # Assert
+        self.assertEqual([key for key, _ in solar], ["a", "c"])
+        self.assertGreater(solar[0][1], solar[1][1])
+        self.assertEqual([key for key, _ in engine], ["c"])
+        self.assertEqual(index.search("span highlight"), [])
+        self.assertEqual(index.search(""), [])
+
+    def test_documents_without_tokens(self):
+        # Act
+        index: InvertedIndex = InvertedIndex([("a", "<b></b>"), ("b", "")])
+        # Assert
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.search("b"), [])
+
+
+class TestTechTransferIndex(TestCase):
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.client: Client = Client(base_url=self.server.url)
+        self.api: TechTransferAPI = TechTransferAPI(self.server)
+        self.api.corpora["patent"] = [
+            tech_transfer_row("patent", i, title)
+            for i, title in enumerate(["Solar sail", "Ion engine", "Heat shield"])
+        ]
+        self.api.corpora["software"] = [
+            tech_transfer_row("software", 0, "Engine simulator")
+        ]
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.server.stop()
+
+    def test_mirror_fetches_every_page(self):
+        # Arrange
+        index: TechTransferIndex = TechTransferIndex()
+        # Act
+        counts: Dict[Text, int] = index.mirror(self.client)
+        # Assert
+        self.assertEqual(
+            counts, {"patent": 3, "patent_issued": 0, "software": 1, "Spinoff": 0}
+        )
+        self.assertEqual(index.results("patent"), self.api.corpora["patent"])
+        self.assertIsNotNone(index.mirrored_at("patent"))
+
+    def test_search_runs_locally(self):
+        # Arrange
+        index: TechTransferIndex = TechTransferIndex()
+        index.mirror(self.client, ["patent", "software"])
+        requested: int = len(self.server.requests)
+        # Act
+        hits: List[Dict[Text, Any]] = index.search("engine")
+        software: List[Dict[Text, Any]] = index.search("engine", api_types=["software"])
+        # Assert
+        self.assertEqual(len(self.server.requests), requested)
+        self.assertEqual(
+            [(hit["api_type"], hit["result"][2]) for hit in hits],
+            [("patent", "Ion engine"), ("software", "Engine simulator")],
+        )
+        self.assertEqual([hit["result"][0] for hit in software], ["software0"])
+
+    def test_mirror_refresh_replaces_results(self):
+        with TemporaryDirectory() as directory:
+            # Arrange
+            path: Text = os.path.join(directory, "techtransfer.db")
+            with TechTransferIndex(path) as index:
+                index.mirror(self.client, ["patent"])
+            self.api.corpora["patent"] = [
+                tech_transfer_row("patent", 9, "Ion thruster")
+            ]
+            # Act
+            with TechTransferIndex(path) as index:
+                before: List[Dict] = index.search("engine")
+                index.mirror(self.client, ["patent"])
+                after: List[Dict] = index.search("engine")
+                thruster: List[Dict] = index.search("thruster")
+        # Assert
+        self.assertEqual(len(before), 1)
+        self.assertEqual(after, [])
+        self.assertEqual([hit["result"][0] for hit in thruster], ["patent9"])
+
+    def test_invalid_api_type(self):
+        # Arrange
+        index: TechTransferIndex = TechTransferIndex()
+        # Assert
+        with self.assertRaises(NASAInvalidInput):
+            # Act
+            index.mirror(self.client, ["patents"])
+        self.assertEqual(self.server.requests, [])
+
+
+class TechPortAPI:
+    """Serves the project list, filtered by updatedSince, and the project details"""
+
+    def __init__(self, server: StubServer) -> None:
+        self.server: StubServer = server
+        self.projects: Dict[int, Text] = dict()
+        server.route("/techport/api/projects/", self.handle)
+
+    def serve(self, projects: Dict[int, Text]) -> None:
+        self.projects = projects
+        for project_id in projects:
+            self.server.route(f"/techport/api/projects/{project_id}", self.handle)
+
+    def handle(self, path: Text, query: Dict[Text, List[Text]], headers: Dict) -> Tuple:
+        project_id: Text = path.rsplit("/", 1)[1]
+        if project_id:
+            body: Dict[Text, Any] = {
+                "project": {
+                    "projectId": int(project_id),
+                    "lastUpdated": self.projects[int(project_id)],
+                }
+            }
+        else:
+            since: Text = query.get("updatedSince", [""])[0]
+            body = {
+                "projects": [
+                    {"projectId": project_id, "lastUpdated": updated}
+                    for project_id, updated in self.projects.items()
+                    if updated >= since
+                ]
+            }
+        return 200, {"Content-Type": "application/json"}, json.dumps(body).encode()
+
+
+class TestTechPortStore(TestCase):
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.client: Client = Client(base_url=self.server.url)
+        self.api: TechPortAPI = TechPortAPI(self.server)
+        self.today: Text = date.today().isoformat()
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.server.stop()
+
+    def test_first_sync_mirrors_every_project(self):
+        # Arrange
+        self.api.serve({1: "2020-01-01", 2: "2021-01-01", 3: "2021-06-01"})
+        store: TechPortStore = TechPortStore()
+        # Act
+        fetched: List[int] = store.sync(self.client, max_workers=2)
+        # Assert
+        self.assertEqual(fetched, [1, 2, 3])
+        self.assertEqual(store.count(), 3)
+        self.assertEqual(
+            store.project(2), {"projectId": 2, "lastUpdated": "2021-01-01"}
+        )
+        self.assertIsNone(store.project(4))
+        self.assertEqual(store.updated_since(), date.today())
+        self.assertNotIn("updatedSince", self.server.requests[0][1])
+
+    def test_sync_only_touches_changes(self):
+        # Arrange
+        self.api.serve({1: "2020-01-01", 2: "2021-01-01"})
+        store: TechPortStore = TechPortStore()
+        store.sync(self.client)
+        store.set_state(TechPortStore.STATE, "2021-01-01")
+        self.api.serve({1: "2021-03-01", 2: "2021-01-01", 3: "2021-02-01"})
+        self.server.requests.clear()
+        # Act
+        fetched: List[int] = store.sync(self.client)
+        # Assert
+        self.assertEqual(fetched, [1, 3])
+        self.assertEqual(self.server.requests[0][1]["updatedSince"], ["2021-01-01"])
+        self.assertEqual(
+            sorted(path for path, _, _ in self.server.requests[1:]),
+            ["/techport/api/projects/1", "/techport/api/projects/3"],
+        )
+        self.assertEqual(store.project(1)["lastUpdated"], "2021-03-01")
+        self.assertEqual(
+            store.last_updated(), {1: "2021-03-01", 2: "2021-01-01", 3: "2021-02-01"}
+        )
+
+    def test_failed_sync_is_resumed(self):
+        # Arrange
+        self.api.serve({1: "2021-01-01", 2: "2021-01-01"})
+        store: TechPortStore = TechPortStore()
+        store.upsert(1, "2021-01-01", {"project": {"projectId": 1}})
+        self.server.route("/techport/api/projects/2", lambda *args: (500, {}, b""))
+        # Act
+        with self.assertRaises(Exception):
+            store.sync(self.client, max_workers=1)
+        # Assert
+        self.assertIsNone(store.updated_since())
+        self.assertEqual(store.count(), 1)
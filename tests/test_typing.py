@@ -0,0 +1,95 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional, Text
+from unittest import TestCase
+
+from benchmarks.bench_iso_date import compare
+from nasa.exceptions import NASAInvalidInput
+from nasa.typing import ISO_DATE_CACHE_SIZE, IsoDate, _valid_iso_value
+from nasa.warnings import InvalidInputWarning
+
+
+class TestIsoDate(TestCase):
+    def setUp(self) -> None:
+        _valid_iso_value.cache_clear()
+
+    def test_timestamp_units(self):
+        for unit, timestamp in (
+            ("s", 1609459200),
+            ("ms", 1609459200 * 10 ** 3),
+            ("us", 1609459200 * 10 ** 6),
+            ("ns", 1609459200 * 10 ** 9),
+        ):
+            with self.subTest(unit):
+                # Act
+                value: Optional[Text] = IsoDate(timestamp, unit=unit).value()
+                # Assert
+                self.assertEqual(value, "2021-01-01")
+
+    def test_decimal_timestamp(self):
+        # Act
+        value: Optional[Text] = IsoDate(Decimal(1609459200000), unit="ms").value()
+        # Assert
+        self.assertEqual(value, "2021-01-01")
+
+    def test_invalid_unit_falls_back_to_seconds(self):
+        # Assert
+        with self.assertWarns(InvalidInputWarning):
+            # Act
+            value: Optional[Text] = IsoDate(1609459200, unit="days").value()
+        self.assertEqual(value, "2021-01-01")
+
+    def test_batch(self):
+        # Arrange
+        args: List = ["2021-01-01", date(2021, 1, 2), datetime(2021, 1, 3, 12), None]
+        # Act
+        values: List[Optional[Text]] = IsoDate.batch(args)
+        # Assert
+        self.assertEqual(values, ["2021-01-01", "2021-01-02", "2021-01-03", None])
+
+    def test_batch_memoizes_valid_values_only(self):
+        # Act
+        with self.assertWarns(InvalidInputWarning):
+            IsoDate.batch(["2021-01-01", "Invalid Date"])
+        # Assert
+        self.assertEqual(_valid_iso_value.cache_info().currsize, 1)
+        with self.assertWarns(InvalidInputWarning):
+            IsoDate.batch(["Invalid Date"])
+
+    def test_cache_tells_types_apart(self):
+        # Act
+        with self.assertWarns(InvalidInputWarning):
+            values: List[Optional[Text]] = IsoDate.batch([0, True])
+        # Assert
+        self.assertEqual(values, ["1970-01-01", None])
+
+    def test_cache_is_bounded(self):
+        # Act
+        IsoDate.batch(range(ISO_DATE_CACHE_SIZE + 1))
+        IsoDate.batch([ISO_DATE_CACHE_SIZE, 0])
+        # Assert
+        info = _valid_iso_value.cache_info()
+        self.assertEqual(info.currsize, ISO_DATE_CACHE_SIZE)
+        # The least recently used value was evicted, the latest one was kept
+        self.assertEqual((info.hits, info.misses), (1, ISO_DATE_CACHE_SIZE + 2))
+
+    def test_date_range(self):
+        # Act
+        days: List[Text] = IsoDate.date_range("2021-02-27", date(2021, 3, 2))
+        weeks: List[Text] = IsoDate.date_range("2021-01-01", "2021-01-20", step=7)
+        # Assert
+        self.assertEqual(days, ["2021-02-27", "2021-02-28", "2021-03-01", "2021-03-02"])
+        self.assertEqual(weeks, ["2021-01-01", "2021-01-08", "2021-01-15"])
+
+    def test_invalid_date_range(self):
+        # Act / Assert
+        with self.assertRaises(NASAInvalidInput):
+            IsoDate.date_range("2021-01-02", "2021-01-01", step=0)
+
+
+class TestIsoDateBenchmark(TestCase):
+    def test_every_kind_of_value_is_timed(self):
+        # Act
+        results = compare(days=5, repeat=1)
+        # Assert
+        self.assertEqual(list(results), ["str", "date", "timestamp", "range"])
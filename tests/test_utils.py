@@ -0,0 +1,88 @@
+import time
+from io import BytesIO
+from threading import Lock
+from typing import List, Optional, Text
+from unittest import TestCase
+from unittest.mock import Mock
+
+from PIL import Image
+from nasa.exceptions import NASAContentTypeNotImage
+from nasa.utils import get_urls_images, read_content
+from nasa.warnings import InvalidInputWarning
+from benchmarks.server import StubServer
+
+
+def png_bytes(size: int) -> bytes:
+    buffer: BytesIO = BytesIO()
+    Image.new("RGB", (size, size)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestGetUrlsImages(TestCase):
+    def setUp(self) -> None:
+        self.server: StubServer = StubServer().start()
+        self.active: int = 0
+        self.max_active: int = 0
+        self.lock: Lock = Lock()
+        for size in range(1, 7):
+            self.server.route(f"/img/{size}", self.slow_image(size))
+        self.server.json("/not-image", {})
+
+    def tearDown(self) -> None:
+        self.server.stop()
+
+    def slow_image(self, size: int):
+        def handler(*_):
+            with self.lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            time.sleep(0.05)
+            with self.lock:
+                self.active -= 1
+            return 200, {"Content-Type": "image/png"}, png_bytes(size)
+
+        return handler
+
+    def test_keeps_order_and_limits_host_concurrency(self):
+        # Arrange
+        urls: List[Text] = [f"{self.server.url}/img/{size}" for size in range(1, 7)]
+        # Act
+        images = get_urls_images(urls, max_workers=6, max_per_host=2)
+        # Assert
+        self.assertEqual([image.size[0] for image in images], list(range(1, 7)))
+        self.assertEqual(self.max_active, 2)
+
+    def test_ignore_non_image_reports_failures(self):
+        # Arrange
+        urls: List[Text] = [
+            f"{self.server.url}/img/1",
+            f"{self.server.url}/not-image",
+            "http://127.0.0.1:1/unreachable",
+        ]
+        # Assert
+        with self.assertWarns(InvalidInputWarning):
+            # Act
+            images: List[Optional[Image.Image]] = get_urls_images(
+                urls, ignore_non_image=True
+            )
+        self.assertEqual(images[0].size, (1, 1))
+        self.assertEqual(images[1:], [None, None])
+
+    def test_raise_non_image(self):
+        # Arrange
+        urls: List[Text] = [f"{self.server.url}/img/1", f"{self.server.url}/not-image"]
+        # Assert
+        with self.assertRaises(NASAContentTypeNotImage):
+            # Act
+            get_urls_images(urls)
+
+
+class TestReadContent(TestCase):
+    def test_preallocated_and_growable_buffer(self):
+        # Arrange
+        chunks: List[bytes] = [b"abc", b"def", b"g"]
+        response: Mock = Mock()
+        response.iter_content.side_effect = lambda chunk_size: iter(chunks)
+        # Act & Assert
+        for content_length in (0, 4, 7, 10):
+            self.assertEqual(read_content(response, content_length), b"abcdefg")
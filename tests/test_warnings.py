@@ -18,7 +18,7 @@ class TestWarnings(TestCase):
             # Act
             IsoDate(invalid_date)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_attributes_collussion_warning(self, mock_request: Mock):
         # Arrange
         apod_client: ApodClient = ApodClient()